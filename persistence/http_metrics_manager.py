@@ -0,0 +1,51 @@
+# http_metrics_manager.py
+
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List
+
+from src.config import PERSISTENCE_DIR
+
+logger = logging.getLogger(__name__)
+HTTP_METRICS_FILE = PERSISTENCE_DIR / "http_metrics.jsonl"
+MAX_RUNS = 500
+_write_lock = threading.Lock()
+
+
+# effects: returns the persisted per-run HTTP summaries, oldest first
+def load_http_metrics() -> List[Dict]:
+    runs = []
+    try:
+        with HTTP_METRICS_FILE.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    runs.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.exception("Failed to read HTTP metrics file %s", HTTP_METRICS_FILE)
+    return runs
+
+
+# modifies: http_metrics.jsonl
+# effects: appends one timestamped run summary, keeping only the newest MAX_RUNS runs
+def append_http_metrics(http_summary: Dict[str, Dict]) -> None:
+    if not http_summary.get("states") and not http_summary.get("counties"):
+        return
+    entry = {"ts": datetime.now().isoformat(timespec="seconds"), **http_summary}
+    try:
+        with _write_lock:
+            HTTP_METRICS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with HTTP_METRICS_FILE.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+            runs = load_http_metrics()
+            if len(runs) > MAX_RUNS:
+                with HTTP_METRICS_FILE.open("w", encoding="utf-8") as f:
+                    for run in runs[-MAX_RUNS:]:
+                        f.write(json.dumps(run) + "\n")
+    except Exception:
+        logger.exception("Failed to write HTTP metrics file %s", HTTP_METRICS_FILE)
@@ -0,0 +1,79 @@
+# replay.py
+# usage: python -m scripts.replay <region> [--county-of STATE] [--mode record|replay] [--repeat N] [--profile]
+
+import argparse
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+
+
+# effects: returns parsed command line arguments
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description="Record or replay one HTTP scraper's traffic and time scrape -> filter -> export offline."
+    )
+    parser.add_argument("region", help="state key, or county key when --county-of is given")
+    parser.add_argument("--county-of", metavar="STATE", help="treat region as a county of STATE")
+    parser.add_argument("--mode", choices=("record", "replay"), default="replay")
+    parser.add_argument("--repeat", type=int, default=1, help="number of timed runs")
+    parser.add_argument("--profile", action="store_true", help="print the top cProfile entries")
+    return parser.parse_args()
+
+
+# requires: RFP_HTTP_MODE already set in the environment
+# effects: runs one region end to end and returns per-phase timings in seconds
+def _run_once(region: str, county_of: str | None) -> dict[str, float]:
+    import pandas as pd
+    from scraper.runner import _run_single_scraper, _clean_dataframe
+    from scraper.scrapers.states import SCRAPER_MAP as STATE_SCRAPERS
+    from scraper.scrapers.counties import SCRAPER_MAP as COUNTY_SCRAPERS
+    from scraper.exporters.excel_exporter import export_all
+    from scraper.core.http_metrics import summarize
+
+    scraper_map = COUNTY_SCRAPERS.get(county_of, {}) if county_of else STATE_SCRAPERS
+    timings = {}
+
+    start = time.perf_counter()
+    events: list[dict] = []
+    df, _ = _run_single_scraper(region, scraper_map, threading.Event(), events)
+    timings["scrape+filter"] = time.perf_counter() - start
+    timings["requests"] = summarize(events)["requests"]
+
+    start = time.perf_counter()
+    cleaned = _clean_dataframe(df)
+    timings["clean"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with pd.ExcelWriter(io.BytesIO(), engine="xlsxwriter") as writer:
+        if county_of:
+            export_all({}, {county_of: {region: cleaned}}, writer)
+        else:
+            export_all({region: cleaned}, {}, writer)
+    timings["export"] = time.perf_counter() - start
+    timings["rows"] = len(cleaned)
+    return timings
+
+
+def main():
+    args = _parse_args()
+    os.environ["RFP_HTTP_MODE"] = args.mode
+
+    profiler = cProfile.Profile() if args.profile else None
+    for run in range(1, args.repeat + 1):
+        if profiler:
+            profiler.enable()
+        timings = _run_once(args.region, args.county_of)
+        if profiler:
+            profiler.disable()
+        phases = ", ".join(f"{k}={v:.3f}s" for k, v in timings.items() if k not in ("rows", "requests"))
+        print(f"[{args.mode}] run {run}: {timings['rows']} rows, {timings['requests']} requests; {phases}")
+
+    if profiler:
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+
+if __name__ == "__main__":
+    main()
@@ -34,6 +34,10 @@ SCRAPER_DIR     = BASE_DIR / "src" / "scraper"
 CACHE_DIR       = DATA_DIR / "cache"
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+HTTP_CACHE_DIR  = CACHE_DIR / "http"
+BROWSER_PROFILES_DIR = CACHE_DIR / "browser_profiles"
+FIXTURES_DIR    = DATA_DIR / "fixtures"
+
 PERSISTENCE_DIR = DATA_DIR / "persistence"
 PERSISTENCE_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -41,6 +45,9 @@ KEYWORDS_FILE     = PERSISTENCE_DIR / "keywords.txt"
 
 LOG_FILE        = DATA_DIR / "scraper.log"
 HIDDEN_IDS_FILE = PERSISTENCE_DIR / "hidden_ids.json"
+SESSION_STATE_FILE = PERSISTENCE_DIR / "session_state.json"
+DRIVER_PATHS_FILE  = PERSISTENCE_DIR / "driver_paths.json"
+BROWSER_PIDS_FILE  = PERSISTENCE_DIR / "browser_pids.json"
 
 # output naming
 OUTPUT_FILENAME_PREFIX = "rfp_scraping_output_"
@@ -53,6 +60,63 @@ SELENIUM_HEADLESS = False
 MAX_RETRIES       = 3
 MAX_CACHE_FILES   = 5
 
+# how SeleniumScraper gets a browser:
+#   "process"  - launch and quit a dedicated Chrome per scraper
+#   "pool"     - reuse running Chromes across scrapers; recycle after N uses or above the RSS ceiling
+#   "contexts" - one shared Chrome; each scraper gets an isolated browser context and tab. the runner still
+#                runs scrapers one at a time, so this only saves Chrome start-up cost; it adds no parallelism
+SELENIUM_BROWSER_BACKEND = os.getenv("RFP_BROWSER_BACKEND", "pool").lower()
+BROWSER_MAX_USES      = 8
+BROWSER_MAX_RSS_MB    = 1500
+BROWSER_POOL_MAX_IDLE = 2
+
+# watchdog over every chromedriver + Chrome tree: kill a tree above this RSS mid-run (needs psutil)
+BROWSER_KILL_RSS_MB       = 3000
+BROWSER_WATCHDOG_INTERVAL = 15
+
+# keep one Chrome profile per portal family (SeleniumScraper.PROFILE_FAMILY) so repeat runs load JS/CSS
+# from the disk cache; the cache is capped per browser and oversized profiles are reset after a run.
+# only the "process" and "pool" backends use it: "contexts" tabs are off-the-record
+SELENIUM_PERSISTENT_PROFILES = True
+BROWSER_PROFILE_CACHE_MB     = 150
+BROWSER_PROFILE_MAX_MB       = 400
+
+# driver.get returns at DOMContentLoaded ("eager") instead of the full load event ("normal");
+# scrapers wait for their own result elements, so images and late scripts need not block them
+SELENIUM_PAGE_LOAD_STRATEGY = "eager"
+
+# URL patterns (Network.setBlockedURLs wildcards) Selenium sessions never fetch:
+# images, fonts, media and third-party analytics; scrapers may allow or add patterns
+SELENIUM_BLOCK_RESOURCES = True
+SELENIUM_BLOCKED_URLS    = (
+    "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*", "*.bmp*",
+    "*.woff*", "*.ttf*", "*.otf*", "*.eot*",
+    "*.mp4*", "*.webm*", "*.mp3*", "*.m4a*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*", "*clarity.ms*", "*nr-data.net*", "*newrelic.com*",
+)
+
+# conditional-GET cache for RequestsScraper sessions
+HTTP_CACHE_ENABLED   = True
+HTTP_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# RequestsScraper transport: "live", "record" (save fixtures) or "replay" (serve fixtures offline)
+HTTP_TRANSPORT_MODE  = os.getenv("RFP_HTTP_MODE", "live").lower()
+
+# per-host token bucket pacing; 429/503 are retried in place for up to MAX_RETRIES
+HTTP_RATE_PER_HOST   = 5.0     # requests per second
+HTTP_RATE_BURST      = 10
+HTTP_MAX_RETRY_WAIT  = 60      # seconds; longer Retry-After values fall back to the runner
+# hosts shared by several regions whose engines fetch pages concurrently (MAX_WORKERS per region)
+HTTP_HOST_RATES: dict[str, float] = {
+    "www.bidnetdirect.com": 8.0,
+    "bids.sciquest.com": 8.0,
+    "api.procurement.opengov.com": 10.0,
+}
+
+# how long cached portal cookies/CSRF/viewstate are tried before a fresh warm-up GET
+SESSION_STATE_TTL    = 30 * 60  # seconds
+
 STATE_RFP_URL_MAP = {
     "alabama": 'https://procurement.staars.alabama.gov/PRDVSS1X1/AltSelfService',
     "arkansas": 'https://arbuy.arkansas.gov/bso/view/search/external/advancedSearchBid.xhtml?openBids=true',
@@ -181,13 +245,22 @@ COUNTY_RFP_URL_MAP = {
     }
 }
 
+# OpenGov Procurement tenants by government slug, with the timezone their deadlines are shown in (the API is UTC)
+OPENGOV_TENANTS = {
+    "acgov": "America/Los_Angeles",
+    "ocgov": "America/Los_Angeles",
+    "saccounty": "America/Los_Angeles",
+    "orangecountyfl": "America/New_York",
+    "cambridgema": "America/New_York",
+    "collincountytx": "America/Chicago",
+}
+
 AVAILABLE_STATES = list(STATE_RFP_URL_MAP.keys())
 AVAILABLE_COUNTIES_BY_STATE = {
     state: list(counties.keys())
     for state, counties in COUNTY_RFP_URL_MAP.items()
 }
 
-FALLBACK_CSRF = "4b9qnD7UgwevuI79WCsBUAv2VtsgEvdqW8gdWmgRSO0%3D"
 KEYWORD_FILE = './scraper/config/keywords.txt'
 
 BUSINESS_UNIT_DICT = {'Statewide Business Unit': '0000', 'State of California Emergency': '00001', 'Major Revenue - DOF USE ONLY': '0001', 'Major Policy Revenue - DOF USE': '0003', 'Legislative/Judicial/Executive': '0010', 'Legislative': '0020', 'Legislature': '0100', 'Senate': '0110', 'Assembly': '0120', 'Legislative Joint Expenses': '0130', "Contrib Legislatrs' Retire Sys": '0150', 'Legislative Counsel Bureau': '0160', 'Judicial': '0200', 'CA Judicial Center Library': '0240', 'Judicial Branch': '0250', 'SUPREME COURT': '0260', 'JUDICIAL COUNCIL': '0270', 'Comm. on Judicial Performance': '0280', 'Habeas Resource Center': '0290', 'DISTRICT COURTS OF APPEAL': '0300', '1st DISTRICT COURT OF APPEAL': '0310', '2nd DISTRICT COURT OF APPEAL': '0320', '3rd DISTRICT COURT OF APPEAL': '0330', "Judges' Retirement System": '0390', 'Executive': '0490', "Governor's Office": '0500', 'California Technology Agency': '0502', 'Business & Economic Developmnt': '0509', 'Sec. for State & Consumer Svcs': '0510', "Sec., Gov't Operations Agency": '0511', 'Bus, Consmer Svcs & Hsng Secty': '0515', 'Sec Business Trans & Housing': '0520', 'Sec., Transportation Agency': '0521', 'Sec., Health & Human Services': '0530', 'Ofc Technology and Solutions I': '0531', 'Sec., Natural Resources': '0540', 'Inspector General Office': '0552', 'Sec., Environment Protection': '0555', 'Secretary for Education': '0558', 'Sec., Labor/Workforce Develop': '0559', 'Wellness & Physical Fitness': '0570', 'Service & Volunteering Agency': '0596', "Gov's Off of Lnd Use & Clmt In": '0650', 'Gov Ofc Serv and Community Eng': '0680', 'Office of Emergency Services': '0690', "Governor's Portrait": '0720', 'Governor Elect & Outgoing': '0730', 'Executive/Constitutional': '0740', 'Office of Lieutenant Governor': '0750', 'Rural Youth Employment Comm': '0780', 'Department of Justice': '0820', 'State Controller': '0840', 'Department of Insurance': '0845', 'CA State Lottery Commission': '0850', 'CA Gambling Control Commission': '0855', 'State Board of Equalization': '0860', 'Office of Tax Appeals': '0870', 'Secretary of State': '0890', 'Citizens Redistricting Comm': '0911', 'State Treasurer': '0950', 'Scholarshare Investment Board': '6054', 'Debt & Investment Advisory Com': '0956', 'HOPE for Children Trust Acct': '0957', 'Debt Limit Allocation Commitee': '0959', 'Transportation Financing Auth': '0964', 'Industrial Develop Fin Comm': '0965', 'Tax Credit Allocation Commitee': '0968', 'Alternative Energy & Adv Trans': '0971', 'Sacramento City Fin Auth': '0972', 'Riverside Cty Public Fin Auth': '0973', 'Pollution Control Fin Auth': '0974', 'Los Angeles State Bldg Auth': '0975', 'Capitol Area Development Auth': '0976', 'Health Facilities Fin Auth': '0977', 'San Francisco State Bldg Auth': '0978', 'Oakland Joint Powers Authority': '0979', 'California ABLE Act Board': '0981', 'Urban Waterfront Area Restore': '0983', 'CalSavers Retirement Savings B': '0984', 'CA School Finance Authority': '0985', 'Educational Facilities Auth': '0989', 'GO Bonds - Debt Service - LJE': '0996', 'Business, Consumer Srvs & Hous': '1000', 'Sec., Biz, Con Srvs, & Housing': '1015', 'No Subagency - DO NOT USE': '5220', 'Sec., State & Consumer Service': '1030', 'Cannabis Control Appeals Panel': '1045', 'CA Science Center': '1100', 'CA African¿American Museum': '1105', 'Consumer Affairs-Reg Boards': '1110', 'Department of Consumer Affairs': '1111', 'Department of Cannabis Control': '1115', 'A. E. Alquist Seismic Safety': '1690', 'Civil Rights Department': '1700', 'Fair Employment and Housing': '17000', 'Dept of Finan Protec and Innov': '1701', 'California Privacy Protection': '1703', 'Fair Employment & Housing Comm': '1705', 'Franchise Tax Board': '1730', 'Horse Racing Board': '1750', 'Department of General Services': '1760', 'Victim Comp & Govt Claims Bd': '1870', 'State Personnel Board': '1880', "Public Employees' Retirement": '1900', "State Teachers' Retirement": '1920', 'GO Bonds - Debt Service\xa0 - BCH': '1996', 'Business, Transport & Housing': '2000', 'Business & Housing': '2010', 'Transportation': '2500', 'Sec., Business, Trans & Housng': '2030', 'Dept. Alcoholic Beverage Cntrl': '2100', 'Alcoholic Beverage Cntl Appeal': '2120', 'Dept. of Financial Institution': '2150', 'Department of Corporations': '2180', 'St Asst Fd Enterprise,Bus & In': '2222', 'Housing & Community Developmnt': '2240', 'CA Housing Finance Agency': '2260', 'Office Real Estate Appraisers': '2310', 'Department of Real Estate': '2320', 'Dept of Managed Health Care': '4150', 'Sec. for Transportation Agency': '2521', 'CA Transportation Commission': '2600', 'State Transit Assistance': '2640', 'Department of Transportation': '2660', 'High Speed Rail Authority': '2665', 'High-Speed Rail Auth Ofc Inspe': '2667', 'Board of Pilot Commissioners': '2670', 'Office of Traffic Safety': '2700', 'Dept of the CA Highway Patrol': '2720', 'Department of Motor Vehicles': '2740', 'GO Bonds-Transportation': '2830', 'Natural Resources': '3000', 'Sec., Natural Resources Agency': '3030', 'Exposition Park': '3100', 'Office of Exposition Park': '31001', 'CA African American Museum': '3105', 'Special Resources Programs': '3110', 'CA Tahoe Conservancy': '3125', 'Geothermal ResourcesDevProgram': '3180', 'Environmental Protection Pgm': '3210', 'CA Conservation Corps': '3340', 'Office of Energy Infrastructur': '3355', 'Energy Resources Conservation': '3360', 'Renew Res Protect Pgm': '3370', 'Colorado River Board of CA': '3460', 'Department of Conservation': '3480', 'Resources Recycling & Recovery': '3970', 'CAL FIRE': '3540', 'State Lands Commission': '3560', 'Department of Fish & Wildlife': '3600', 'Wildlife Conservation Board': '3640', 'Dept of Boating & Waterways': '3680', 'CA Coastal Commission': '3720', 'State Coastal Conservancy': '3760', 'Native American Heritage Comm': '3780', 'Dept of Parks & Recreation': '3790', 'Santa Monica Mtns Conservancy': '3810', 'Salton Sea Conservancy': '3815', 'SF Bay Conservation Commission': '3820', 'San Gabriel & Lower LA Rivers': '3825', 'San Joaquin River Conservancy': '3830', 'Baldwin Hills and Urban Waters': '3835', 'Delta Protection Commission': '3840', 'San Diego River Conservancy': '3845', 'Coachella Valley Mtns Conser': '3850', 'Sierra Nevada Conservancy': '3855', 'Department of Water Resources': '3860', 'Sacramento-San Joaquin Delta': '3875', 'GO Bonds Resources': '3882', 'Delta Stewardship Council': '3885', 'Environmental Protection': '3890', 'Sec., Environmental Protectio': '3895', 'State Air Resources Board': '3900', 'Dept of Pesticide Regulation': '3930', 'State Water Resources Control': '3940', 'Dept. Toxic Substances Control': '3960', "Env'l Health Hazard Assessment": '3980', 'Ofc of Env Health Hazard Asmnt': '39800', 'GO Bonds Env Protect': '3996', 'Health & Human Services': '4000', 'Sec., Health & Human Srvs Agy': '4020', 'Developmental Disabilities': '4100', 'Emergency Medical Service Auth': '4120', 'Health Care Access and Informa': '4140', 'California Department of Aging': '4170', 'Department of Aging': '41700', 'Commission on Aging': '41800', 'CA Senior Legislature': '4185', 'Dept. Alcohol & Drug Programs': '4200', 'First 5 California': '4250', 'State Dept Hlth Care Services': '4260', 'Department of Public Health': '4265', 'Medical Assistance Commission': '4270', 'Managed Risk Medical Insurance': '4280', 'Dept of Developmental Services': '4300', 'Developmental Services - HQ': '4310', 'State Hospitals': '4460', 'Agnews State Hospital': '4330', 'Fairview State Hospital': '4350', 'F. D. Lanterman State Hospital': '4370', 'Porterville State Hospital': '4390', 'Sonoma State Hospital': '4400', 'Northern CA Facility-Yuba City': '4420', 'SO. CA Facility¿Cathedral City': '4430', 'Department of State Hospitals': '4440', 'State Hospitals Sacramento': '4450', 'State Hospital - Atascadero': '4470', 'State Hospital Metropolitan': '4490', 'State Hospital Napa': '4500', 'State Hospital Patton': '4510', 'State Hospital Stockton': '4520', 'State Hospital Vacaville': '4530', 'State Hospital Coalinga': '4540', 'State Hospital Salinas': '4550', 'Behavioral Hlth Svcs Ovrst Acn': '4560', 'Community Srvcs & Development': '4700', 'CA Health Benefit Exchange': '4800', 'Department of Rehabilitation': '5160', 'Dept of Youth and Community Re': '5165', 'Independent Living Council': '5170', 'Dept of Child Support Services': '5175', 'Department of Social Services': '5180', 'State - Local Realignment 1991': '5195', 'State - Local Realignment 2011': '5196', 'GO Bonds -HHS': '5206', 'Misc Adj- HHS': '5209', 'Corrections & Rehabilitation': '5210', 'Dept of Corrections & Rehab': '5225', 'State & Community Corrections': '5227', 'SAFE NGHBORHOODS & SCHOOLS ACT': '5228', 'Local Law Enforcement Services': '5296', 'Trial Court Security 2011': '5396', 'Prison Industry Authority': '5420', 'Local Community Corrections': '5496', 'District Atty & Pub Def Svcs': '5596', 'Juvenile Justice Programs': '5696', 'ELEA Growth Subaccount': '5796', 'Fed Immig Fd Incarc-DCR': '5990', 'GO Bonds-DCR': '5996', 'Education': '6000', 'K-12 Education': '6010', 'Higher Education': '6013', 'Higher Ed ¿ Community Colleges': '6015', 'Higher Ed - UC, CSU, & Other': '6020', 'Secretary for Education, K-12': '6050', 'Department of Education': '6110', 'CA State Library': '6120', 'Education Audit Appeals Panel': '6125', 'Special Schools': '6190', 'CA School for the Blind': '6200', 'Diagnostic School - North CA': '6210', 'Diagnostic School - Central CA': '6220', 'Diagnostic School - So CA': '6230', 'School for the Deaf-Fremont': '6240', 'School for the Deaf-Riverside': '6250', 'State Summer School for Arts': '6255', 'Summer School for the Arts': '62550', 'Diagnostic Centers': '6260', 'State Contributions to STRS': '6300', 'Retire Costs for Comm Coll': '6305', 'CA Career Resource Network': '6330', 'School Facilities Aid Program': '6350', 'Teacher Credentialing Comm': '6360', 'GO Bonds K-12': '6396', 'Postsecondary Education Comm': '6420', 'University of California': '6440', 'Institute for Regenerative Med': '6445', 'UC Office of the President': '6491', 'UC Berkeley': '6500', 'UC Davis': '6510', 'UC Davis Medical Center': '6511', 'UC Irvine': '6520', 'UC Irvine Med Center': '6521', 'UCLA': '6530', 'blankblank': '6540', 'UC San Francisco': '6560', 'UCSF Medical Center': '6561', 'UC Santa Cruz': '6580', 'UC Merced': '6590', 'College of the Law, San Fran': '6600', 'Cal State University': '6610', 'CSU Statewide Programs': '6620', 'CSU Systemwide Offices': '6630', 'CSU Campuses': '6640', 'CSU Health Ben for Ret\xa0 Annuit': '6645', 'CSU, Bakersfield': '6650', 'CSU, San Bernardino': '6660', 'CSU, Stanislaus': '6670'}
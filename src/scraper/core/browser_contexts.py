@@ -0,0 +1,128 @@
+# browser_contexts.py
+
+import logging
+import threading
+
+from selenium import webdriver
+
+logger = logging.getLogger(__name__)
+
+
+# requires: options is the ChromeOptions a scraper asked for, address is "host:port"
+# effects: returns options that attach a new chromedriver session to the running browser at address
+def attach_options(options, address: str):
+    attached = webdriver.ChromeOptions()
+    attached.debugger_address = address
+    attached.page_load_strategy = options.page_load_strategy
+    logging_prefs = options.to_capabilities().get("goog:loggingPrefs")
+    if logging_prefs:
+        attached.set_capability("goog:loggingPrefs", logging_prefs)
+    return attached
+
+
+# one Chrome process shared by many scrapers, each in its own isolated browser context
+#
+# every lease gets its own chromedriver session attached to the shared browser, so element
+# handles and the "current window" never leak between scrapers; the browser context gives
+# each one a separate cookie jar, cache partition and storage. the runner leases one scraper
+# at a time, so the saving is Chrome's start-up per scraper, not parallel scraping
+class SharedBrowser:
+
+    # modifies: self
+    # effects: creates a backend with no browser running yet
+    def __init__(self):
+        self._host = None
+        self._address = None
+        self._contexts: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+
+    # requires: launch(options) starts a chromedriver session
+    # modifies: self
+    # effects: returns the debugger address of the shared browser, launching it if needed
+    def _ensure_host(self, options, launch) -> str:
+        with self._lock:
+            if self._host is not None:
+                try:
+                    self._host.current_url  # liveness probe
+                    return self._address
+                except Exception:
+                    logger.warning("Shared browser died; relaunching")
+                    self._host = None
+            self._host = launch(options)
+            self._address = self._host.capabilities["goog:chromeOptions"]["debuggerAddress"]
+            logger.info(f"Launched shared browser at {self._address}")
+            return self._address
+
+
+    # requires: launch(options) starts a chromedriver session
+    # modifies: self
+    # effects: returns a driver whose current window is a fresh tab in a new isolated context
+    def lease(self, options, launch):
+        address = self._ensure_host(options, launch)
+        driver = launch(attach_options(options, address))
+        try:
+            context_id = driver.execute_cdp_cmd(
+                "Target.createBrowserContext", {"disposeOnDetach": True}
+            )["browserContextId"]
+            target_id = driver.execute_cdp_cmd(
+                "Target.createTarget", {"url": "about:blank", "browserContextId": context_id}
+            )["targetId"]
+            driver.switch_to.window(target_id)
+        except Exception:
+            driver.quit()
+            raise
+        with self._lock:
+            self._contexts[id(driver)] = context_id
+        return driver
+
+
+    # modifies: self, shared browser
+    # effects: disposes the lease's context (closing its tabs), then detaches its chromedriver session
+    def release(self, driver) -> None:
+        with self._lock:
+            context_id = self._contexts.pop(id(driver), None)
+        try:
+            if context_id:
+                driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+        except Exception as e:
+            logger.debug(f"Failed to dispose browser context {context_id}: {e}")
+        finally:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.debug(f"Error detaching from shared browser: {e}")
+
+
+    # modifies: self
+    # effects: quits the shared browser
+    def shutdown(self) -> None:
+        with self._lock:
+            host, self._host = self._host, None
+        if host is not None:
+            try:
+                host.quit()
+            except Exception as e:
+                logger.debug(f"Error quitting shared browser: {e}")
+
+
+_shared: SharedBrowser | None = None
+_shared_lock = threading.Lock()
+
+
+# effects: returns the process-wide shared browser backend
+def get_shared_browser() -> SharedBrowser:
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = SharedBrowser()
+        return _shared
+
+
+# modifies: the process-wide shared browser
+# effects: quits the shared browser; safe to call when none exists
+def shutdown_shared_browser() -> None:
+    with _shared_lock:
+        shared = _shared
+    if shared is not None:
+        shared.shutdown()
@@ -0,0 +1,205 @@
+# browser_pool.py
+
+import json
+import logging
+import threading
+from collections import defaultdict
+
+from src.config import BROWSER_MAX_RSS_MB, BROWSER_MAX_USES, BROWSER_POOL_MAX_IDLE
+from .browser_profiles import profile_of, without_profile
+
+# optional: per-browser memory readings for recycling
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+_CLEAR_STORAGE_JS = "try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}"
+
+
+# requires: options is a selenium ChromeOptions
+# effects: returns a key that is equal for options that launch interchangeable browsers
+def options_key(options) -> str:
+    return json.dumps(options.to_capabilities(), sort_keys=True, default=str)
+
+
+# effects: returns the resident memory (MB) of the driver's chromedriver + chrome tree, or None if unknown
+def browser_rss_mb(driver) -> float | None:
+    if psutil is None:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        procs = [root] + root.children(recursive=True)
+        return sum(p.memory_info().rss for p in procs) / (1024 * 1024)
+    except Exception:
+        return None
+
+
+# modifies: driver state
+# effects: closes extra tabs, clears cookies and web storage, and parks the driver on about:blank
+def reset_driver(driver) -> None:
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+    driver.switch_to.default_content()
+    driver.execute_script(_CLEAR_STORAGE_JS)
+    origin = driver.execute_script("return window.location.origin")
+    if origin and origin.startswith("http"):
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.implicitly_wait(0)
+    driver.get("about:blank")
+
+
+# leases already-running browsers to scrapers and recycles them after max_uses or when over memory
+class BrowserPool:
+
+    # modifies: self
+    # effects: creates an empty pool
+    def __init__(self, max_uses: int = BROWSER_MAX_USES, max_rss_mb: float = BROWSER_MAX_RSS_MB,
+                 max_idle: int = BROWSER_POOL_MAX_IDLE):
+        self.max_uses = max_uses
+        self.max_rss_mb = max_rss_mb
+        self.max_idle = max_idle
+        self._idle: dict[str, list] = defaultdict(list)
+        self._uses: dict[int, int] = {}
+        self._leased: dict[int, str] = {}
+        # id(driver) -> the persistent profile it holds locked, for drivers launched on one
+        self._profiles: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+
+    # requires: launch(options) starts a new driver
+    # modifies: self
+    # effects: returns an idle, live driver matching options, or a freshly launched one
+    def lease(self, options, launch):
+        key = options_key(options)
+        while True:
+            with self._lock:
+                driver = self._idle[key].pop() if self._idle[key] else None
+            if driver is None:
+                break
+            try:
+                driver.current_url  # liveness probe
+            except Exception:
+                self._discard(driver, "dead while idle")
+                continue
+            with self._lock:
+                self._leased[id(driver)] = key
+            logger.debug("Reusing pooled browser")
+            return driver
+
+        options, key = self._claim_profile(options, key)
+        driver = launch(options)
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self._leased[id(driver)] = key
+            profile = profile_of(options)
+            if profile:
+                self._profiles[id(driver)] = profile
+        return driver
+
+
+    # requires: options has no idle match under key
+    # modifies: self
+    # effects: Chrome locks its profile directory, so before launching on a persistent profile this quits
+    #          idle browsers (launched with other options) holding it; if a leased browser holds it, returns
+    #          options for a throwaway profile instead. returns the (options, key) to launch with
+    def _claim_profile(self, options, key):
+        profile = profile_of(options)
+        if not profile:
+            return options, key
+        with self._lock:
+            stale = [
+                d for idle in self._idle.values() for d in idle
+                if self._profiles.get(id(d)) == profile
+            ]
+            for idle in self._idle.values():
+                idle[:] = [d for d in idle if d not in stale]
+            busy = any(self._profiles.get(i) == profile for i in self._leased)
+        for driver in stale:
+            self._discard(driver, "frees its profile for a launch with other options")
+        if busy:
+            logger.info(f"Profile {profile} is in use; launching on a throwaway profile")
+            options = without_profile(options)
+            return options, options_key(options)
+        return options, key
+
+
+    # modifies: self, driver
+    # effects: resets driver and returns it to the idle list, or quits it if worn out, oversized or broken
+    def release(self, driver) -> None:
+        with self._lock:
+            key = self._leased.pop(id(driver), None)
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+        if key is None:
+            self._discard(driver, "not leased from pool")
+            return
+        if uses >= self.max_uses:
+            self._discard(driver, f"reached {uses} uses")
+            return
+        rss = browser_rss_mb(driver)
+        if rss is not None and rss > self.max_rss_mb:
+            self._discard(driver, f"using {rss:.0f} MB")
+            return
+        try:
+            reset_driver(driver)
+        except Exception as e:
+            self._discard(driver, f"reset failed: {e}")
+            return
+        with self._lock:
+            if len(self._idle[key]) < self.max_idle:
+                self._idle[key].append(driver)
+                return
+        self._discard(driver, "pool full")
+
+
+    # modifies: self
+    # effects: quits driver and forgets it
+    def _discard(self, driver, reason: str) -> None:
+        logger.info(f"Retiring pooled browser ({reason})")
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            self._leased.pop(id(driver), None)
+            self._profiles.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting browser: {e}")
+
+
+    # modifies: self
+    # effects: quits every idle browser
+    def shutdown(self) -> None:
+        with self._lock:
+            drivers = [d for idle in self._idle.values() for d in idle]
+            self._idle.clear()
+        for driver in drivers:
+            self._discard(driver, "run finished")
+
+
+_pool: BrowserPool | None = None
+_pool_lock = threading.Lock()
+
+
+# effects: returns the process-wide browser pool
+def get_browser_pool() -> BrowserPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool()
+        return _pool
+
+
+# modifies: the process-wide pool
+# effects: quits every pooled browser; safe to call when no pool exists
+def shutdown_browser_pool() -> None:
+    with _pool_lock:
+        pool = _pool
+    if pool is not None:
+        pool.shutdown()
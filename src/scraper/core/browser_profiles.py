@@ -0,0 +1,65 @@
+# browser_profiles.py
+
+import copy
+import logging
+import shutil
+from pathlib import Path
+
+from src.config import BROWSER_PROFILE_MAX_MB, BROWSER_PROFILES_DIR
+
+logger = logging.getLogger(__name__)
+
+
+# effects: returns the persistent Chrome profile directory for a portal family, creating it if needed
+def profile_dir(family: str) -> Path:
+    path = BROWSER_PROFILES_DIR / family
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+# requires: options is a selenium ChromeOptions
+# effects: returns the --user-data-dir options launch Chrome with, or None for a throwaway profile
+def profile_of(options) -> str | None:
+    for arg in options.arguments:
+        if arg.startswith("--user-data-dir="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+# requires: options is a selenium ChromeOptions
+# effects: returns a copy of options that launches Chrome on a throwaway profile
+def without_profile(options):
+    stripped = copy.deepcopy(options)
+    stripped.arguments[:] = [
+        arg for arg in stripped.arguments
+        if not arg.startswith(("--user-data-dir=", "--disk-cache-size="))
+    ]
+    return stripped
+
+
+# effects: returns the total size of every file under path in MB
+def _size_mb(path: Path) -> float:
+    total = 0
+    for f in path.rglob("*"):
+        try:
+            if f.is_file():
+                total += f.stat().st_size
+        except OSError:
+            continue
+    return total / (1024 * 1024)
+
+
+# requires: no browser is running on these profiles
+# modifies: BROWSER_PROFILES_DIR
+# effects: deletes any family profile that grew past max_mb so Chrome starts it afresh next run
+def enforce_profile_caps(max_mb: float = BROWSER_PROFILE_MAX_MB) -> None:
+    if not BROWSER_PROFILES_DIR.exists():
+        return
+    for path in BROWSER_PROFILES_DIR.iterdir():
+        if not path.is_dir():
+            continue
+        size = _size_mb(path)
+        if size <= max_mb:
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        logger.info(f"Reset browser profile '{path.name}' ({size:.0f} MB > {max_mb} MB)")
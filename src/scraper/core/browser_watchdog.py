@@ -0,0 +1,208 @@
+# browser_watchdog.py
+
+import json
+import logging
+import os
+import threading
+
+from src.config import BROWSER_KILL_RSS_MB, BROWSER_PIDS_FILE, BROWSER_WATCHDOG_INTERVAL
+
+# optional: without psutil the watchdog and reaper are no-ops
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+
+# requires: psutil is available
+# effects: returns the live processes of a recorded tree, skipping pids that were reused by other programs
+def _live_processes(pids: list[list]) -> list:
+    procs = []
+    for pid, created in pids:
+        try:
+            proc = psutil.Process(pid)
+            if abs(proc.create_time() - created) < 1:
+                procs.append(proc)
+        except psutil.Error:
+            continue
+    return procs
+
+
+# requires: psutil is available
+# effects: returns True if tree was recorded by another app instance that is still running
+def _owned_by_other_app(tree: dict, me: int) -> bool:
+    owner = tree.get("owner")
+    return bool(owner) and owner != me and psutil.pid_exists(owner)
+
+
+# requires: psutil is available
+# effects: kills procs and returns (processes killed, MB of resident memory they held)
+def _kill(procs: list) -> tuple[int, float]:
+    freed = 0.0
+    for proc in procs:
+        try:
+            freed += proc.memory_info().rss / (1024 * 1024)
+            proc.kill()
+        except psutil.Error:
+            continue
+    gone, _ = psutil.wait_procs(procs, timeout=5)
+    return len(gone), freed
+
+
+# tracks every chromedriver + Chrome tree SeleniumScraper launches, kills any tree that grows past
+# BROWSER_KILL_RSS_MB, and reaps trees left behind by crashed scrapers, hung quits or a previous app run
+#
+# trees are recorded in BROWSER_PIDS_FILE as {root pid: {"owner": app pid, "pids": [[pid, create_time], ...]}}
+class BrowserWatchdog:
+
+    # modifies: self
+    # effects: creates a watchdog with no tracked browsers; the monitor thread starts on first track
+    def __init__(self, path=BROWSER_PIDS_FILE, kill_rss_mb: float = BROWSER_KILL_RSS_MB,
+                 interval: float = BROWSER_WATCHDOG_INTERVAL):
+        self.path = path
+        self.kill_rss_mb = kill_rss_mb
+        self.interval = interval
+        self._trees: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+
+    # effects: returns the recorded trees on disk
+    def _load(self) -> dict[str, dict]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+
+    # requires: self._lock held
+    # modifies: BROWSER_PIDS_FILE
+    # effects: writes this process's trees, keeping entries other live app instances recorded
+    def _save(self) -> None:
+        me = os.getpid()
+        others = {root: tree for root, tree in self._load().items()
+                  if _owned_by_other_app(tree, me)}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps({**others, **self._trees}), encoding="utf-8")
+        except OSError as e:
+            logger.debug(f"Could not record browser pids: {e}")
+
+
+    # requires: psutil is available
+    # effects: returns [[pid, create_time], ...] for root_pid and all its descendants
+    def _snapshot(self, root_pid: int) -> list[list]:
+        root = psutil.Process(root_pid)
+        return [[p.pid, p.create_time()] for p in [root] + root.children(recursive=True)]
+
+
+    # modifies: self, BROWSER_PIDS_FILE
+    # effects: records the process tree behind driver and starts the monitor thread if needed
+    def track(self, driver) -> None:
+        if psutil is None:
+            return
+        try:
+            root_pid = driver.service.process.pid
+            pids = self._snapshot(root_pid)
+        except Exception as e:
+            logger.debug(f"Cannot track browser process: {e}")
+            return
+        with self._lock:
+            self._trees[str(root_pid)] = {"owner": os.getpid(), "pids": pids}
+            self._save()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._monitor, name="browser-watchdog", daemon=True)
+                self._thread.start()
+
+
+    # modifies: self, BROWSER_PIDS_FILE
+    # effects: every interval, refreshes each tree's pids, forgets exited trees and kills trees over the ceiling
+    def _monitor(self) -> None:
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                roots = list(self._trees)
+            for root in roots:
+                try:
+                    pids = self._snapshot(int(root))
+                except psutil.Error:
+                    # chromedriver is gone; keep the record while any of its Chrome processes survive
+                    with self._lock:
+                        tree = self._trees.get(root)
+                        if tree and not _live_processes(tree["pids"]):
+                            self._trees.pop(root, None)
+                    continue
+                with self._lock:
+                    if root in self._trees:
+                        self._trees[root]["pids"] = pids
+                procs = _live_processes(pids)
+                rss = 0.0
+                for proc in procs:
+                    try:
+                        rss += proc.memory_info().rss / (1024 * 1024)
+                    except psutil.Error:
+                        continue
+                if rss > self.kill_rss_mb:
+                    killed, freed = _kill(procs)
+                    logger.warning(
+                        f"Killed browser tree {root}: {rss:.0f} MB over the {self.kill_rss_mb} MB ceiling "
+                        f"({killed} processes, {freed:.0f} MB reclaimed)"
+                    )
+                    with self._lock:
+                        self._trees.pop(root, None)
+            with self._lock:
+                self._save()
+
+
+    # modifies: self, BROWSER_PIDS_FILE, recorded processes
+    # effects: kills every recorded tree still alive whose owning app is this process or no longer running,
+    #          logs what was reclaimed, and returns (processes killed, MB reclaimed)
+    def reap(self, reason: str) -> tuple[int, float]:
+        if psutil is None:
+            return 0, 0.0
+        me = os.getpid()
+        with self._lock:
+            recorded = {**self._load(), **self._trees}
+            keep = {}
+            killed, freed = 0, 0.0
+            for root, tree in recorded.items():
+                if _owned_by_other_app(tree, me):
+                    keep[root] = tree
+                    continue
+                procs = _live_processes(tree.get("pids", []))
+                if procs:
+                    count, mb = _kill(procs)
+                    killed += count
+                    freed += mb
+            self._trees.clear()
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self.path.write_text(json.dumps(keep), encoding="utf-8")
+            except OSError as e:
+                logger.debug(f"Could not record browser pids: {e}")
+        if killed:
+            logger.warning(f"Reaped {killed} orphaned browser processes on {reason} ({freed:.0f} MB reclaimed)")
+        else:
+            logger.info(f"No orphaned browser processes on {reason}")
+        return killed, freed
+
+
+_watchdog: BrowserWatchdog | None = None
+_watchdog_lock = threading.Lock()
+
+
+# effects: returns the process-wide browser watchdog
+def get_browser_watchdog() -> BrowserWatchdog:
+    global _watchdog
+    with _watchdog_lock:
+        if _watchdog is None:
+            _watchdog = BrowserWatchdog()
+        return _watchdog
+
+
+# modifies: recorded browser processes
+# effects: kills browser trees left behind by this run or by a previous app instance
+def reap_orphans(reason: str) -> tuple[int, float]:
+    return get_browser_watchdog().reap(reason)
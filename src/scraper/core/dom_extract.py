@@ -0,0 +1,30 @@
+# dom_extract.py
+
+# arguments: row selector, [[name, selector, property-or-null], ...]
+# a field with a null selector reads from the row itself; a null property reads innerText
+_EXTRACT_JS = """
+const rows = document.querySelectorAll(arguments[0]), fields = arguments[1], out = [];
+for (const row of rows) {
+    const record = {};
+    for (const [name, selector, prop] of fields) {
+        const el = selector ? row.querySelector(selector) : row;
+        if (!el) { record[name] = null; continue; }
+        const value = prop ? (el[prop] !== undefined ? el[prop] : el.getAttribute(prop)) : el.innerText;
+        record[name] = value == null ? null : String(value).trim();
+    }
+    out.push(record);
+}
+return out;
+"""
+
+
+# requires: fields maps output name -> "css" (element text) or ("css", "property") (e.g. ("a", "href"));
+#           a css of None means the row element itself
+# effects: returns one dict per element matching row_selector, in document order, built in a single
+#          in-page script call; a field whose element is missing is None
+def extract_rows(driver, row_selector: str, fields: dict) -> list[dict]:
+    spec = []
+    for name, field in fields.items():
+        selector, prop = field if isinstance(field, tuple) else (field, None)
+        spec.append([name, selector, prop])
+    return driver.execute_script(_EXTRACT_JS, row_selector, spec) or []
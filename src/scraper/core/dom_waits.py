@@ -0,0 +1,63 @@
+# dom_waits.py
+
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+# arguments: css selector of the container to watch (falls back to <body>)
+_ARM_JS = """
+const root = arguments[0] ? document.querySelector(arguments[0]) : null;
+if (window.__rfpSettle) { window.__rfpSettle.observer.disconnect(); }
+const state = {count: 0, last: performance.now()};
+state.observer = new MutationObserver(function (records) {
+    state.count += records.length;
+    state.last = performance.now();
+});
+state.observer.observe(root || document.body, {childList: true, subtree: true, characterData: true});
+window.__rfpSettle = state;
+return !!root;
+"""
+
+# arguments: quiet ms, timeout ms, callback; calls back with the mutation count, or null after a navigation
+_WAIT_JS = """
+const quiet = arguments[0], timeout = arguments[1], done = arguments[arguments.length - 1];
+const state = window.__rfpSettle, start = performance.now();
+if (!state) { return done(null); }
+(function check() {
+    const now = performance.now();
+    if ((state.count > 0 && now - state.last >= quiet) || now - start >= timeout) {
+        state.observer.disconnect();
+        delete window.__rfpSettle;
+        return done(state.count);
+    }
+    setTimeout(check, 50);
+})();
+"""
+
+_PRESENT_JS = "return document.readyState !== 'loading' && !!document.querySelector(arguments[0]);"
+
+
+# requires: action() triggers a DOM update (click, scroll, ...); selector is a CSS selector
+# modifies: driver page state
+# effects: watches selector's subtree with a MutationObserver, runs action, then returns True once the subtree
+#          has changed and stayed quiet for quiet seconds, or False if nothing changed within timeout;
+#          when action navigates to a new document, returns whether selector appears there within timeout
+def settle_after(driver, action, selector: str | None = None, quiet: float = 0.3, timeout: float = 10) -> bool:
+    driver.execute_script(_ARM_JS, selector)
+    action()
+    try:
+        mutations = driver.execute_async_script(_WAIT_JS, int(quiet * 1000), int(timeout * 1000))
+    except WebDriverException:
+        mutations = None  # document was replaced mid-wait
+    if mutations is not None:
+        return mutations > 0
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if driver.execute_script(_PRESENT_JS, selector or "body"):
+                return True
+        except WebDriverException:
+            pass
+        time.sleep(0.1)
+    return False
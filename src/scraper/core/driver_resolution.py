@@ -0,0 +1,77 @@
+# driver_resolution.py
+
+import json
+import logging
+import subprocess
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from selenium.webdriver.common.selenium_manager import SeleniumManager
+
+from src.config import DRIVER_PATHS_FILE
+
+logger = logging.getLogger(__name__)
+_lock = threading.Lock()
+_resolved: dict | None = None
+
+
+# effects: returns the "--version" string of the binary at path (chromedriver or Chrome), or "" if it cannot be read
+def _binary_version(path: str) -> str:
+    try:
+        out = subprocess.run(
+            [path, "--version"], capture_output=True, text=True, timeout=10,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+        return out.stdout.strip()
+    except Exception:
+        return ""
+
+
+# effects: returns the cached paths if both binaries still exist, else None
+def _load_cached() -> dict | None:
+    try:
+        cached = json.loads(DRIVER_PATHS_FILE.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+    if all(cached.get(k) and Path(cached[k]).is_file() for k in ("driver_path", "browser_path")):
+        return cached
+    return None
+
+
+# modifies: DRIVER_PATHS_FILE
+# effects: asks Selenium Manager for chromedriver and Chrome, records them with both detected versions, and returns them
+def _resolve() -> dict:
+    output = SeleniumManager().binary_paths(["--browser", "chrome"])
+    resolved = {
+        "driver_path": output["driver_path"],
+        "browser_path": output["browser_path"],
+        "driver_version": _binary_version(output["driver_path"]),
+        # Selenium Manager reports the version it detected where it can; otherwise ask the binary
+        "browser_version": output.get("browser_version") or _binary_version(output["browser_path"]),
+        "resolved_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    try:
+        DRIVER_PATHS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        DRIVER_PATHS_FILE.write_text(json.dumps(resolved, indent=2), encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Could not cache driver paths: {e}")
+    logger.info(
+        f"Resolved {resolved['driver_version'] or 'chromedriver'} at {resolved['driver_path']} "
+        f"for {resolved['browser_version'] or 'Chrome'} at {resolved['browser_path']}"
+    )
+    return resolved
+
+
+# modifies: DRIVER_PATHS_FILE when resolving
+# effects: returns {"driver_path", "browser_path", ...}, from memory or disk unless refresh is set
+def resolve_binaries(refresh: bool = False) -> dict:
+    global _resolved
+    with _lock:
+        if not refresh:
+            if _resolved is None:
+                _resolved = _load_cached()
+            if _resolved is not None:
+                return _resolved
+        _resolved = _resolve()
+        return _resolved
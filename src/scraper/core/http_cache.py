@@ -0,0 +1,253 @@
+# http_cache.py
+
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from src.config import HTTP_CACHE_DIR, HTTP_CACHE_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+# query params that only exist to defeat browser caches (e.g. bonfire's "?_=<ms>", sciquest's "&tmstmp=<ms>")
+CACHE_BUSTER_PARAMS = {"_", "tmstmp"}
+
+# headers that describe the wire encoding rather than the decoded body we store
+_UNSTORED_HEADERS = {
+    "content-encoding",
+    "content-length",
+    "transfer-encoding",
+    "connection",
+    "keep-alive",
+    "set-cookie",
+}
+
+
+# requires: url is an absolute url string
+# effects: returns the url with cache-buster params dropped and the query sorted
+def normalize_url(url: str) -> str:
+    parts = urlsplit(url)
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k not in CACHE_BUSTER_PARAMS
+    )
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+
+# a size-capped on-disk store of validated GET responses, evicted least-recently-used first
+class HttpCache:
+
+    INDEX_NAME = "index.json"
+
+    # modifies: root on disk
+    # effects: opens (or creates) the cache under root and loads its index
+    def __init__(self, root, max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+
+
+    # effects: returns the stored index, or an empty one if missing or corrupt
+    def _load_index(self) -> dict[str, dict]:
+        path = self.root / self.INDEX_NAME
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception:
+            logger.warning("HTTP cache index unreadable; starting empty")
+            return {}
+
+
+    # requires: self._lock is held
+    # modifies: index file on disk
+    # effects: atomically rewrites the index
+    def _save_index(self) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.root), prefix="index.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._index, f)
+            os.replace(tmp_path, str(self.root / self.INDEX_NAME))
+        except Exception:
+            logger.exception("Failed to write HTTP cache index")
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+
+    # effects: returns the on-disk path for a cache key
+    def _body_path(self, key: str):
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.root / f"{digest}.body"
+
+
+    # effects: returns the validators/headers entry for key, or None
+    def lookup(self, key: str) -> dict | None:
+        with self._lock:
+            entry = self._index.get(key)
+            return dict(entry) if entry else None
+
+
+    # modifies: index last_used for key
+    # effects: returns the cached body bytes, or None (dropping the entry) if the file is gone
+    def read_body(self, key: str) -> bytes | None:
+        path = self._body_path(key)
+        try:
+            body = path.read_bytes()
+        except OSError:
+            with self._lock:
+                if self._index.pop(key, None) is not None:
+                    self._save_index()
+            return None
+        with self._lock:
+            if key in self._index:
+                self._index[key]["last_used"] = time.time()
+                self._save_index()
+        return body
+
+
+    # requires: headers is a case-insensitive mapping (e.g. Response.headers)
+    # modifies: cache files and index
+    # effects: stores body + validators for key, then evicts until under max_bytes
+    def store(self, key: str, headers, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        path = self._body_path(key)
+        try:
+            path.write_bytes(body)
+        except OSError as e:
+            logger.warning(f"Failed to write HTTP cache body for {key}: {e}")
+            return
+        with self._lock:
+            self._index[key] = {
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "headers": {
+                    k: v for k, v in headers.items()
+                    if k.lower() not in _UNSTORED_HEADERS
+                },
+                "size": len(body),
+                "last_used": time.time(),
+            }
+            self._evict()
+            self._save_index()
+
+
+    # requires: self._lock is held
+    # modifies: cache files and index
+    # effects: drops least-recently-used entries until total size fits max_bytes
+    def _evict(self) -> None:
+        total = sum(e.get("size", 0) for e in self._index.values())
+        if total <= self.max_bytes:
+            return
+        for key, entry in sorted(self._index.items(), key=lambda kv: kv[1].get("last_used", 0)):
+            if total <= self.max_bytes:
+                break
+            try:
+                self._body_path(key).unlink()
+            except OSError:
+                pass
+            total -= entry.get("size", 0)
+            del self._index[key]
+            logger.debug(f"Evicted HTTP cache entry {key}")
+
+
+# effects: returns a fully-read Response for request built from stored parts
+def build_response(request, status: int, reason: str, headers, body: bytes, adapter) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status
+    resp.reason = reason
+    resp.headers = CaseInsensitiveDict(headers)
+    resp.encoding = get_encoding_from_headers(resp.headers)
+    resp.raw = io.BytesIO(body)
+    resp._content = body
+    resp._content_consumed = True
+    resp.url = request.url
+    resp.request = request
+    resp.connection = adapter
+    return resp
+
+
+_shared_cache: HttpCache | None = None
+_shared_lock = threading.Lock()
+
+
+# effects: returns the process-wide cache under HTTP_CACHE_DIR
+def get_http_cache() -> HttpCache:
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = HttpCache(HTTP_CACHE_DIR)
+        return _shared_cache
+
+
+# a transport adapter that revalidates GETs with ETag/Last-Modified and serves 304s from disk
+class ConditionalCacheAdapter(BaseAdapter):
+
+    # modifies: self
+    # effects: wraps inner (a plain HTTPAdapter by default) with the given cache
+    def __init__(self, inner: BaseAdapter | None = None, cache: HttpCache | None = None):
+        super().__init__()
+        self.inner = inner or HTTPAdapter()
+        self.cache = cache or get_http_cache()
+
+
+    # effects: sends request through inner, adding validators and answering 304s from the cache;
+    #          streamed requests pass straight through so their body is never buffered here
+    def send(self, request, **kwargs):
+        if (kwargs.get("stream") or request.method != "GET"
+                or "If-None-Match" in request.headers or "If-Modified-Since" in request.headers):
+            return self.inner.send(request, **kwargs)
+
+        key = normalize_url(request.url)
+        entry = self.cache.lookup(key)
+        if entry:
+            if entry.get("etag"):
+                request.headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request.headers["If-Modified-Since"] = entry["last_modified"]
+
+        resp = self.inner.send(request, **kwargs)
+
+        if resp.status_code == 304 and entry:
+            body = self.cache.read_body(key)
+            if body is not None:
+                resp.close()
+                logger.debug(f"HTTP cache hit (304) for {key}")
+                return self._build_cached_response(request, entry, body)
+            request.headers.pop("If-None-Match", None)
+            request.headers.pop("If-Modified-Since", None)
+            resp.close()
+            return self.inner.send(request, **kwargs)
+
+        if resp.status_code == 200 and ("ETag" in resp.headers or "Last-Modified" in resp.headers):
+            self.cache.store(key, resp.headers, resp.content)
+        return resp
+
+
+    # effects: returns a 200 Response carrying the cached body and headers
+    def _build_cached_response(self, request, entry, body):
+        resp = build_response(request, 200, "OK", entry.get("headers", {}), body, self)
+        resp.from_cache = True
+        return resp
+
+
+    # effects: closes the wrapped adapter
+    def close(self):
+        self.inner.close()
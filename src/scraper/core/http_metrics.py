@@ -0,0 +1,119 @@
+# http_metrics.py
+
+import re
+import threading
+import time
+from urllib.parse import parse_qsl, urlsplit
+
+from requests.adapters import BaseAdapter
+
+# path segments that identify a record rather than a route (numbers, uuids, long hex ids)
+_ID_SEGMENT_RE = re.compile(r"^(\d+|[0-9a-fA-F-]{32,36}|[0-9a-fA-F]{16,})$")
+
+
+# requires: url is an absolute url string
+# effects: returns "host/path?param&param" with ids and query values stripped, for grouping
+def url_template(url: str) -> str:
+    parts = urlsplit(url)
+    path = "/".join(
+        "{id}" if _ID_SEGMENT_RE.match(seg) else seg
+        for seg in parts.path.split("/")
+    )
+    params = sorted({k for k, _ in parse_qsl(parts.query, keep_blank_values=True)})
+    query = f"?{'&'.join(params)}" if params else ""
+    return f"{parts.netloc.lower()}{path}{query}"
+
+
+# a thread-safe list of request events for one scraper instance
+class RequestLog:
+
+    # modifies: self
+    # effects: starts an empty log attributed to region
+    def __init__(self, region: str):
+        self.region = region
+        self._events: list[dict] = []
+        self._lock = threading.Lock()
+
+
+    # modifies: self
+    # effects: appends one event, stamped with the current region
+    def record(self, event: dict) -> None:
+        event["region"] = self.region
+        with self._lock:
+            self._events.append(event)
+
+
+    # effects: returns a copy of the recorded events
+    def events(self) -> list[dict]:
+        with self._lock:
+            return list(self._events)
+
+
+# requires: events are dicts produced by MetricsAdapter
+# effects: returns totals plus a per-url-template breakdown for one region
+def summarize(events: list[dict]) -> dict:
+    summary = {
+        "requests": 0,
+        "retries": 0,
+        "errors": 0,
+        "bytes": 0,
+        "latency_total": 0.0,
+        "latency_max": 0.0,
+        "by_template": {},
+    }
+    for ev in events:
+        summary["requests"] += 1
+        summary["retries"] += ev["attempt"] > 1
+        summary["errors"] += ev["status"] is None or ev["status"] >= 400
+        summary["bytes"] += ev["bytes"] or 0
+        summary["latency_total"] += ev["latency"]
+        summary["latency_max"] = max(summary["latency_max"], ev["latency"])
+
+        key = f"{ev['method']} {ev['template']}"
+        tmpl = summary["by_template"].setdefault(key, {"requests": 0, "latency_total": 0.0, "bytes": 0})
+        tmpl["requests"] += 1
+        tmpl["latency_total"] += ev["latency"]
+        tmpl["bytes"] += ev["bytes"] or 0
+    return summary
+
+
+# a transport adapter that emits one structured event per request attempt
+class MetricsAdapter(BaseAdapter):
+
+    # modifies: self
+    # effects: wraps inner, reporting every exchange to log
+    def __init__(self, inner: BaseAdapter, log: RequestLog):
+        super().__init__()
+        self.inner = inner
+        self.log = log
+
+
+    # effects: sends request through inner and records method, template, status, latency, bytes, attempt
+    def send(self, request, **kwargs):
+        start = time.perf_counter()
+        status = None
+        size = None
+        try:
+            resp = self.inner.send(request, **kwargs)
+            status = resp.status_code
+            if kwargs.get("stream"):
+                length = resp.headers.get("Content-Length")
+                size = int(length) if length and length.isdigit() else None
+            else:
+                size = len(resp.content)
+            return resp
+        finally:
+            self.log.record({
+                "ts": time.time(),
+                "method": request.method,
+                "template": url_template(request.url),
+                "status": status,
+                "latency": time.perf_counter() - start,
+                "bytes": size,
+                "attempt": getattr(request, "attempt", 1),
+            })
+
+
+    # effects: closes the wrapped adapter
+    def close(self):
+        self.inner.close()
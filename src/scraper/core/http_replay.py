@@ -0,0 +1,131 @@
+# http_replay.py
+
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import threading
+from collections import defaultdict, deque
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from src.config import FIXTURES_DIR
+from .http_cache import build_response, normalize_url
+
+logger = logging.getLogger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+
+# headers describing the wire encoding; recorded bodies are stored already decoded
+_WIRE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+# effects: returns the fixture archive path for a scraper name
+def fixture_path(name: str):
+    return FIXTURES_DIR / f"{name}.jsonl.gz"
+
+
+# effects: returns the fixture name for a scraper class, qualified by its module so same-named region
+#          classes (e.g. the California and Florida OrangeScraper) keep separate archives
+def fixture_name(cls) -> str:
+    module = cls.__module__.removeprefix("src.")
+    return f"{module}.{cls.__qualname__}"
+
+
+# requires: request is a PreparedRequest
+# effects: returns the (method, url, body digest) key a request is recorded/replayed under
+def request_key(request) -> str:
+    body = request.body or b""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    elif not isinstance(body, (bytes, bytearray)):
+        body = b""
+    digest = hashlib.sha1(body).hexdigest()[:16]
+    return f"{request.method} {normalize_url(request.url)} {digest}"
+
+
+# a transport adapter that saves every exchange to a fixture archive, or serves them back offline
+class RecordReplayAdapter(BaseAdapter):
+
+    # requires: mode is RECORD or REPLAY
+    # modifies: self
+    # effects: wraps inner for recording, or loads the archive at path for replay
+    def __init__(self, path, mode: str, inner: BaseAdapter | None = None):
+        super().__init__()
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown transport mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.inner = inner or HTTPAdapter()
+        self._lock = threading.Lock()
+        self._recorded: list[dict] = []
+        self._replay: dict[str, deque] = defaultdict(deque)
+        if mode == REPLAY:
+            self._load()
+
+
+    # modifies: self._replay
+    # effects: reads the archive into per-key queues, preserving recorded order
+    def _load(self) -> None:
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._replay[entry["key"]].append(entry)
+            logger.info(f"Loaded {sum(map(len, self._replay.values()))} recorded responses from {self.path.name}")
+        except FileNotFoundError:
+            logger.error(f"No fixture archive at {self.path}")
+
+
+    # effects: records or replays the exchange for request; streamed requests are passed through
+    #          unrecorded so their body is never buffered here
+    def send(self, request, **kwargs):
+        key = request_key(request)
+        if self.mode == REPLAY:
+            return self._serve(request, key)
+
+        resp = self.inner.send(request, **kwargs)
+        if kwargs.get("stream"):
+            return resp
+        body = resp.content
+        with self._lock:
+            self._recorded.append({
+                "key": key,
+                "status": resp.status_code,
+                "reason": resp.reason,
+                "headers": {
+                    k: v for k, v in resp.headers.items()
+                    if k.lower() not in _WIRE_HEADERS
+                },
+                "body": base64.b64encode(body).decode("ascii"),
+            })
+        return resp
+
+
+    # effects: returns the next recorded response for key; the last one repeats once the queue drains
+    def _serve(self, request, key):
+        with self._lock:
+            queue = self._replay.get(key)
+            if not queue:
+                raise requests.ConnectionError(f"No recorded response for {key}")
+            entry = queue.popleft() if len(queue) > 1 else queue[0]
+        body = base64.b64decode(entry["body"])
+        return build_response(request, entry["status"], entry.get("reason") or "", entry["headers"], body, self)
+
+
+    # modifies: archive file on disk
+    # effects: writes recorded exchanges (once) and closes the wrapped adapter
+    def close(self):
+        with self._lock:
+            recorded, self._recorded = self._recorded, []
+        if self.mode == RECORD and recorded:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(self.path, "wt", encoding="utf-8") as f:
+                for entry in recorded:
+                    f.write(json.dumps(entry) + "\n")
+            logger.info(f"Recorded {len(recorded)} responses to {self.path.name}")
+        self.inner.close()
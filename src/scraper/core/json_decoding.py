@@ -0,0 +1,84 @@
+# json_decoding.py
+
+import json
+
+# optional accelerators: orjson for whole-document decoding, ijson for incremental parsing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+# requires: data is a JSON document as bytes or str
+# effects: returns the decoded object, using orjson when installed; raises ValueError on bad JSON
+def loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8-sig")
+    return json.loads(data)
+
+
+# a minimal file-like view over a response body, for ijson
+class _ResponseStream:
+
+    # modifies: self
+    # effects: reads resp's body lazily in STREAM_CHUNK_SIZE chunks (iter_content slices a body that was
+    #          already read, so this works whether or not resp was streamed)
+    def __init__(self, resp):
+        self._chunks = resp.iter_content(STREAM_CHUNK_SIZE)
+
+    # effects: returns the next non-empty chunk, or b"" at end of body (or for a size-0 probe)
+    def read(self, size=-1):
+        if size == 0:
+            return b""
+        for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+# requires: prefix is an ijson-style path such as "data.item" or "payload.projects"
+# effects: walks an already-decoded document down prefix and returns the addressed node
+def _walk(doc, prefix: str):
+    node = doc
+    for part in prefix.split(".") if prefix else []:
+        if part == "item":
+            break
+        node = node.get(part) if isinstance(node, dict) else None
+        if node is None:
+            return None
+    return node
+
+
+# requires: resp was fetched with stream=True for incremental parsing to apply
+# effects: yields each element of the array at prefix ("data.item") one at a time
+def iter_items(resp, prefix: str):
+    if ijson is None:
+        node = _walk(loads(resp.content), prefix)
+        yield from (node or [])
+        return
+    try:
+        yield from ijson.items(_ResponseStream(resp), prefix, use_float=True)
+    except ijson.JSONError as e:
+        raise ValueError(f"streamed JSON decode failed: {e}") from e
+
+
+# requires: resp was fetched with stream=True for incremental parsing to apply
+# effects: yields (key, value) pairs of the object at prefix ("payload.projects") one at a time
+def iter_kvitems(resp, prefix: str):
+    if ijson is None:
+        node = _walk(loads(resp.content), prefix)
+        yield from (node or {}).items()
+        return
+    try:
+        yield from ijson.kvitems(_ResponseStream(resp), prefix, use_float=True)
+    except ijson.JSONError as e:
+        raise ValueError(f"streamed JSON decode failed: {e}") from e
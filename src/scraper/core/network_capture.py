@@ -0,0 +1,93 @@
+# network_capture.py
+
+import base64
+import json
+import logging
+import re
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from . import json_decoding
+
+logger = logging.getLogger(__name__)
+
+# chromedriver capability that streams DevTools Network events into driver.get_log("performance")
+PERFORMANCE_LOG_CAPABILITY = ("goog:loggingPrefs", {"performance": "ALL"})
+
+
+# collects JSON responses the page fetched, read back from the browser's DevTools performance log
+#
+# requires: the driver was launched with PERFORMANCE_LOG_CAPABILITY
+class ResponseCapture:
+
+    # modifies: self
+    # effects: creates a capture bound to driver with nothing seen yet
+    def __init__(self, driver):
+        self.driver = driver
+        self._urls: dict[str, str] = {}      # requestId -> url, for JSON responses
+        self._finished: list[str] = []       # requestIds whose body is complete, in arrival order
+
+
+    # modifies: self, the driver's performance log
+    # effects: drains the performance log, remembering JSON responses and which have finished loading
+    def poll(self) -> None:
+        for entry in self.driver.get_log("performance"):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method, params = message.get("method"), message.get("params", {})
+            if method == "Network.responseReceived":
+                response = params.get("response", {})
+                if "json" in response.get("mimeType", ""):
+                    self._urls[params["requestId"]] = response.get("url", "")
+            elif method == "Network.loadingFinished" and params.get("requestId") in self._urls:
+                self._finished.append(params["requestId"])
+
+
+    # modifies: self, the driver's performance log
+    # effects: forgets everything captured so far
+    def clear(self) -> None:
+        self.poll()
+        self._urls.clear()
+        self._finished.clear()
+
+
+    # requires: pattern is a regex searched against response URLs
+    # modifies: self
+    # effects: waits up to timeout for count finished JSON responses whose URL matches pattern and
+    #          returns them as (url, decoded payload) pairs, oldest first; returns fewer on timeout
+    def wait_for(self, pattern: str, count: int = 1, timeout: float = 20) -> list[tuple[str, object]]:
+        regex = re.compile(pattern)
+        found: list[tuple[str, object]] = []
+        deadline = time.monotonic() + timeout
+        while True:
+            self.poll()
+            for request_id in list(self._finished):
+                url = self._urls[request_id]
+                if not regex.search(url):
+                    continue
+                self._finished.remove(request_id)
+                payload = self._body(request_id)
+                if payload is not None:
+                    found.append((url, payload))
+            if len(found) >= count or time.monotonic() >= deadline:
+                return found
+            time.sleep(0.1)
+
+
+    # effects: returns the decoded JSON body of request_id, or None if the browser no longer has it
+    def _body(self, request_id: str):
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except WebDriverException as e:
+            logger.debug(f"Response body for {request_id} unavailable: {e}")
+            return None
+        body = result.get("body", "")
+        raw = base64.b64decode(body) if result.get("base64Encoded") else body.encode("utf-8")
+        try:
+            return json_decoding.loads(raw)
+        except ValueError:
+            logger.debug(f"Response {self._urls.get(request_id)} was not valid JSON")
+            return None
@@ -0,0 +1,163 @@
+# rate_limiter.py
+
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.exceptions import RequestException
+
+from src.config import (
+    HTTP_HOST_RATES,
+    HTTP_MAX_RETRY_WAIT,
+    HTTP_RATE_BURST,
+    HTTP_RATE_PER_HOST,
+    MAX_RETRIES,
+)
+
+logger = logging.getLogger(__name__)
+
+# statuses that mean "slow down and try this same request again"
+THROTTLE_STATUSES = {429, 503}
+
+# the running scrape's cancel event; pacing and retry waits end as soon as it is set
+_cancel_event = threading.Event()
+
+
+# raised from a pacing or retry wait once the scrape has been cancelled
+class RequestCancelled(RequestException):
+    pass
+
+
+# modifies: the module's cancel event
+# effects: makes every later pacing/retry wait end early when event is set; None detaches it
+def set_cancel_event(event: threading.Event | None) -> None:
+    global _cancel_event
+    _cancel_event = event or threading.Event()
+
+
+# effects: blocks for up to seconds; raises RequestCancelled if the scrape is cancelled first
+def _wait(seconds: float) -> None:
+    if _cancel_event.wait(seconds):
+        raise RequestCancelled("scrape cancelled while waiting to send")
+
+
+# a thread-safe token bucket that can also be paused outright after a throttle response
+class TokenBucket:
+
+    # requires: rate > 0, capacity >= 1
+    # modifies: self
+    # effects: starts a full bucket refilling at rate tokens per second
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+
+    # modifies: self
+    # effects: blocks until a token is available (and any pause has elapsed), then takes it;
+    #          raises RequestCancelled if the scrape is cancelled meanwhile
+    def acquire(self) -> None:
+        while True:
+            if _cancel_event.is_set():
+                raise RequestCancelled("scrape cancelled before sending")
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) / self.rate
+            _wait(wait)
+
+
+    # modifies: self
+    # effects: empties the bucket and holds every caller for at least seconds
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._tokens = 0
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+# effects: returns the shared bucket for host, creating it from config on first use
+def get_bucket(host: str) -> TokenBucket:
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            rate = HTTP_HOST_RATES.get(host, HTTP_RATE_PER_HOST)
+            bucket = TokenBucket(rate, max(1.0, HTTP_RATE_BURST))
+            _buckets[host] = bucket
+        return bucket
+
+
+# effects: returns the Retry-After delay in seconds (delta-seconds or HTTP-date), or None
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+# a transport adapter that paces requests per host and retries 429/503 in place
+class RateLimitAdapter(BaseAdapter):
+
+    # modifies: self
+    # effects: wraps inner (a plain HTTPAdapter by default), retrying throttled requests up to max_retries
+    def __init__(self, inner: BaseAdapter | None = None, max_retries: int = MAX_RETRIES):
+        super().__init__()
+        self.inner = inner or HTTPAdapter()
+        self.max_retries = max_retries
+
+
+    # effects: sends request once a host token is free; on 429/503 waits Retry-After and resends
+    def send(self, request, **kwargs):
+        host = urlsplit(request.url).netloc.lower()
+        bucket = get_bucket(host)
+        attempt = 1
+        while True:
+            bucket.acquire()
+            request.attempt = attempt
+            resp = self.inner.send(request, **kwargs)
+            resp.attempt = attempt
+            if resp.status_code not in THROTTLE_STATUSES or attempt > self.max_retries:
+                return resp
+
+            wait = parse_retry_after(resp.headers.get("Retry-After"))
+            if wait is None:
+                wait = min(2 ** (attempt - 1), HTTP_MAX_RETRY_WAIT) + random.uniform(0, 0.5)
+            if wait > HTTP_MAX_RETRY_WAIT:
+                logger.warning(f"[{host}] asked to wait {wait:.0f}s (> {HTTP_MAX_RETRY_WAIT}s); giving up in place")
+                return resp
+
+            logger.info(f"[{host}] HTTP {resp.status_code}; retrying in {wait:.1f}s (attempt {attempt})")
+            resp.close()
+            bucket.pause(wait)
+            attempt += 1
+
+
+    # effects: closes the wrapped adapter
+    def close(self):
+        self.inner.close()
@@ -1,8 +1,22 @@
 # requests_scraper.py
 import requests
+from requests.adapters import HTTPAdapter
 from .base_scraper import BaseScraper
+from . import json_decoding
+from . import session_state
+from .http_cache import ConditionalCacheAdapter
+from .http_metrics import MetricsAdapter, RequestLog
+from .http_replay import RECORD, REPLAY, RecordReplayAdapter, fixture_name, fixture_path
+from .rate_limiter import RateLimitAdapter
+from src.config import HTTP_CACHE_ENABLED, HTTP_TRANSPORT_MODE, SESSION_STATE_TTL
 
 class RequestsScraper(BaseScraper):
+    # set False on portals whose GET responses must never be revalidated from disk
+    HTTP_CACHE = True
+    # portal key for persisted cookies/tokens; None disables session-state reuse
+    SESSION_STATE_KEY = None
+    SESSION_STATE_TTL = SESSION_STATE_TTL
+
     def __init__(self, base_url):
         super().__init__(base_url)
         self.session = requests.Session()
@@ -11,8 +25,70 @@ class RequestsScraper(BaseScraper):
             "Content-Type": "application/x-www-form-urlencoded",
             "Referer": base_url
         })
+        self.http_log = RequestLog(type(self).__name__)
+        self._mount_adapters()
         self.current_response = None
 
+    def _build_adapter(self):
+        """Build the transport adapter chain used for every request on self.session."""
+        if HTTP_TRANSPORT_MODE == REPLAY:
+            return MetricsAdapter(RecordReplayAdapter(fixture_path(fixture_name(type(self))), REPLAY), self.http_log)
+
+        adapter = RateLimitAdapter(MetricsAdapter(HTTPAdapter(), self.http_log))
+        if HTTP_TRANSPORT_MODE == RECORD:
+            # fixtures hold full responses, so the conditional cache stays out of the way
+            adapter = RecordReplayAdapter(fixture_path(fixture_name(type(self))), RECORD, adapter)
+        elif HTTP_CACHE_ENABLED and self.HTTP_CACHE:
+            adapter = ConditionalCacheAdapter(adapter)
+        return adapter
+
+    def _mount_adapters(self):
+        """Mount the adapter chain for both schemes."""
+        adapter = self._build_adapter()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def parse_json(self, resp):
+        """Decode a response's JSON body with the fastest available decoder; bad JSON raises as resp.json() does."""
+        try:
+            return json_decoding.loads(resp.content)
+        except ValueError as e:
+            # a truncated body stays a retryable RequestException rather than a plain ValueError
+            raise requests.JSONDecodeError(str(e), getattr(e, "doc", ""), getattr(e, "pos", 0), response=resp) from e
+
+    def iter_json(self, resp, prefix, pairs=False):
+        """Yield the records at prefix one at a time; streams when resp was fetched with stream=True."""
+        if pairs:
+            return json_decoding.iter_kvitems(resp, prefix)
+        return json_decoding.iter_items(resp, prefix)
+
+    def _session_state_enabled(self):
+        # fixtures are keyed on request bodies, so record/replay always warm up from scratch
+        return self.SESSION_STATE_KEY is not None and HTTP_TRANSPORT_MODE not in (RECORD, REPLAY)
+
+    def restore_session_state(self):
+        """Load cached cookies into the session and return the cached form fields, or None."""
+        if not self._session_state_enabled():
+            return None
+        state = session_state.load_state(self.SESSION_STATE_KEY)
+        if not state:
+            return None
+        session_state.apply_cookies(self.session.cookies, state.get("cookies", []))
+        self.logger.info(f"[{self.SESSION_STATE_KEY}] reusing cached session state")
+        return dict(state.get("fields", {}))
+
+    def save_session_state(self, fields):
+        """Persist the session's cookies and the given form fields for the next run."""
+        if self._session_state_enabled():
+            session_state.save_state(self.SESSION_STATE_KEY, self.session.cookies, fields, self.SESSION_STATE_TTL)
+
+    def discard_session_state(self):
+        """Drop cached state that the portal rejected and start from a clean cookie jar."""
+        if self._session_state_enabled():
+            self.logger.info(f"[{self.SESSION_STATE_KEY}] cached session state rejected; warming up")
+            session_state.clear_state(self.SESSION_STATE_KEY)
+        self.session.cookies.clear()
+
     def search(self, **kwargs):
         """Start the search with given parameters."""
         raise NotImplementedError("Search must be implemented in subclass.")
@@ -27,4 +103,4 @@ class RequestsScraper(BaseScraper):
 
     def close(self):
         """Close the session."""
-        self.session.close()
\ No newline at end of file
+        self.session.close()
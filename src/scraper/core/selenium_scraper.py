@@ -6,43 +6,163 @@ import logging
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import WebDriverException
 from contextlib import redirect_stdout
 from .base_scraper import BaseScraper
-from src.config import SELENIUM_HEADLESS
+from . import dom_extract, dom_waits
+from .network_capture import PERFORMANCE_LOG_CAPABILITY, ResponseCapture
+from .browser_contexts import get_shared_browser, shutdown_shared_browser
+from .browser_pool import get_browser_pool, shutdown_browser_pool
+from .browser_profiles import enforce_profile_caps, profile_dir
+from .browser_watchdog import get_browser_watchdog, reap_orphans
+from .driver_resolution import resolve_binaries
+from src.config import (
+    BROWSER_PROFILE_CACHE_MB,
+    SELENIUM_BLOCK_RESOURCES,
+    SELENIUM_BLOCKED_URLS,
+    SELENIUM_BROWSER_BACKEND,
+    SELENIUM_HEADLESS,
+    SELENIUM_PAGE_LOAD_STRATEGY,
+    SELENIUM_PERSISTENT_PROFILES,
+)
 
 logging.getLogger("selenium.webdriver.common.selenium_manager").setLevel(logging.CRITICAL)
+logger = logging.getLogger(__name__)
+
+# backends that launch a Chrome per scraper, which can own a persistent profile; "contexts" attaches to one
+# shared host whose tabs are off-the-record, so a profile there would only be the first leaser's
+PROFILE_BACKENDS = ("process", "pool")
+
+
+# requires: options is a ChromeOptions; paths comes from resolve_binaries
+# effects: starts chromedriver at the given paths with its output silenced and returns the driver
+def _start_chrome(options, paths):
+    # tell ChromeDriver to dump its stdout/stderr to nul
+    null_log = "nul"
+    service = Service(
+        executable_path=paths["driver_path"],
+        log_path=null_log,
+        creationflags=subprocess.CREATE_NO_WINDOW
+    )
+    if not options.debugger_address:
+        options.binary_location = paths["browser_path"]
+    with redirect_stdout(open(os.devnull, 'w')):
+        driver = webdriver.Chrome(service=service, options=options)
+    get_browser_watchdog().track(driver)
+    return driver
+
+
+# requires: options is a ChromeOptions
+# effects: launches a new Chrome using the cached driver/browser paths, re-resolving them once if the launch fails
+def launch_chrome(options):
+    try:
+        return _start_chrome(options, resolve_binaries())
+    except (WebDriverException, OSError) as e:
+        logger.warning(f"Chrome launch failed with cached binaries ({e.__class__.__name__}); re-resolving")
+        return _start_chrome(options, resolve_binaries(refresh=True))
+
+
+# effects: returns the configured lease/release backend, or None when each scraper owns its Chrome
+def browser_backend():
+    if SELENIUM_BROWSER_BACKEND == "pool":
+        return get_browser_pool()
+    if SELENIUM_BROWSER_BACKEND == "contexts":
+        return get_shared_browser()
+    return None
+
+
+# modifies: the process-wide browser pool and shared browser
+# effects: quits every browser kept alive between scrapers, then kills any browser left running
+def shutdown_browsers() -> None:
+    shutdown_browser_pool()
+    shutdown_shared_browser()
+    reap_orphans("run end")
+    enforce_profile_caps()
+
 
 class SeleniumScraper(BaseScraper):
+    # set False on portals that break when static assets are blocked
+    BLOCK_RESOURCES = True
+    # extra patterns to block, and default patterns this portal still needs
+    BLOCKED_URLS: tuple[str, ...] = ()
+    ALLOWED_URLS: tuple[str, ...] = ()
+    # set "normal" on portals that need the full load event before driver.get returns
+    PAGE_LOAD_STRATEGY = SELENIUM_PAGE_LOAD_STRATEGY
+    # portals sharing a front-end stack share a persistent profile and its disk cache; None uses a throwaway profile
+    PROFILE_FAMILY = None
+    # set True on portals whose tables come from JSON calls that capture_json should read directly
+    CAPTURE_NETWORK = False
+
     def __init__(self, base_url):
         super().__init__(base_url)
 
-        # tell ChromeDriver to dump its stdout/stderr to nul
-        null_log = "nul"
-        service = Service(
-            log_path=null_log,
-            creationflags=subprocess.CREATE_NO_WINDOW
-        )
+        self.options = self._build_options()
 
-        # build ChromeOptions
-        self.options = webdriver.ChromeOptions()
+        # lease a browser from the configured backend, or launch a dedicated one
+        self._backend = browser_backend()
+        if self._backend is not None:
+            self.driver = self._backend.lease(self.options, launch_chrome)
+        else:
+            self.driver = launch_chrome(self.options)
+        self._apply_resource_blocking()
+        self.network = ResponseCapture(self.driver) if self.CAPTURE_NETWORK else None
+        self.current_response = None
+
+    def _build_options(self):
+        """Build the ChromeOptions this scraper's browser is launched with."""
+        options = webdriver.ChromeOptions()
+        options.page_load_strategy = self.PAGE_LOAD_STRATEGY
+        if self.CAPTURE_NETWORK:
+            options.set_capability(*PERFORMANCE_LOG_CAPABILITY)
+        if SELENIUM_PERSISTENT_PROFILES and self.PROFILE_FAMILY and SELENIUM_BROWSER_BACKEND in PROFILE_BACKENDS:
+            options.add_argument(f"--user-data-dir={profile_dir(self.PROFILE_FAMILY)}")
+            options.add_argument(f"--disk-cache-size={BROWSER_PROFILE_CACHE_MB * 1024 * 1024}")
         if SELENIUM_HEADLESS:
-            self.options.add_argument("--headless=new")
-            self.options.add_argument("window-size=1920,1080")
-            self.options.add_argument("--log-level=3")
-            self.options.add_argument("--disable-gpu")
-            self.options.add_argument("--no-sandbox")
-            self.options.add_argument("--disable-dev-shm-usage")
-
-        self.options.add_argument(
+            options.add_argument("--headless=new")
+            options.add_argument("window-size=1920,1080")
+            options.add_argument("--log-level=3")
+            options.add_argument("--disable-gpu")
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+
+        options.add_argument(
             "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
             "AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/115.0.0.0 Safari/537.36"
         )
+        return options
 
-        # launch Chrome via that Service
-        with redirect_stdout(open(os.devnull, 'w')):
-            self.driver = webdriver.Chrome(service=service, options=self.options)
-        self.current_response = None
+    def blocked_urls(self):
+        """URL patterns this scraper's browser should refuse to fetch."""
+        if not (SELENIUM_BLOCK_RESOURCES and self.BLOCK_RESOURCES):
+            return []
+        patterns = [p for p in SELENIUM_BLOCKED_URLS if p not in self.ALLOWED_URLS]
+        return patterns + [p for p in self.BLOCKED_URLS if p not in patterns]
+
+    def _apply_resource_blocking(self):
+        """Install (or clear, on a reused browser) the blocked-URL list for this session."""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls()})
+        except Exception as e:
+            logger.debug(f"Resource blocking unavailable: {e}")
+
+    def settle_after(self, action, selector=None, quiet=0.3, timeout=10):
+        """Run action and wait until the selector's subtree has changed and gone quiet; False if it never changed."""
+        return dom_waits.settle_after(self.driver, action, selector, quiet, timeout)
+
+    def extract_rows(self, row_selector, fields):
+        """Read every row matching row_selector into a dict of fields in one WebDriver round trip."""
+        return dom_extract.extract_rows(self.driver, row_selector, fields)
+
+    def capture_json(self, pattern, action=None, count=1, timeout=20):
+        """Run action and return the (url, payload) JSON responses matching pattern that the page fetched."""
+        if self.network is None:
+            raise RuntimeError(f"{type(self).__name__} must set CAPTURE_NETWORK = True to capture responses")
+        if action is not None:
+            self.network.clear()
+            action()
+        return self.network.wait_for(pattern, count, timeout)
 
     def search(self, **kwargs):
         """Perform the search (e.g., fill forms, click buttons)."""
@@ -57,6 +177,13 @@ class SeleniumScraper(BaseScraper):
         raise NotImplementedError("Extract data must be implemented in subclass.")
 
     def close(self):
-        """Close the browser."""
-        if hasattr(self, 'driver') and self.driver:
-            self.driver.quit()
\ No newline at end of file
+        """Return the browser to its backend (or quit it when the scraper owns it)."""
+        driver = getattr(self, 'driver', None)
+        if not driver:
+            return
+        self.driver = None
+        backend = getattr(self, '_backend', None)
+        if backend is not None:
+            backend.release(driver)
+        else:
+            driver.quit()
@@ -0,0 +1,108 @@
+# session_state.py
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from requests.cookies import create_cookie
+
+from src.config import SESSION_STATE_FILE
+
+logger = logging.getLogger(__name__)
+_lock = threading.Lock()
+
+
+# effects: returns every stored portal state, or {} if the file is missing or corrupt
+def _load_all() -> dict[str, dict]:
+    try:
+        with SESSION_STATE_FILE.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception:
+        logger.warning(f"Session state file {SESSION_STATE_FILE} unreadable; ignoring it")
+        return {}
+
+
+# requires: _lock is held
+# modifies: SESSION_STATE_FILE
+# effects: atomically rewrites the store
+def _save_all(data: dict[str, dict]) -> None:
+    SESSION_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=str(SESSION_STATE_FILE.parent), prefix="session_state.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, str(SESSION_STATE_FILE))
+    except Exception:
+        logger.exception(f"Failed to write session state file {SESSION_STATE_FILE}")
+        if os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+# effects: returns {"cookies": [...], "fields": {...}} for portal if saved and unexpired, else None
+def load_state(portal: str) -> dict | None:
+    with _lock:
+        entry = _load_all().get(portal)
+    if not entry:
+        return None
+    if entry.get("expires_at", 0) <= time.time():
+        logger.info(f"[{portal}] cached session state expired")
+        return None
+    return entry
+
+
+# modifies: SESSION_STATE_FILE
+# effects: stores the session's cookies plus form fields for portal, valid for ttl seconds
+def save_state(portal: str, cookie_jar, fields: dict[str, str], ttl: float) -> None:
+    now = time.time()
+    cookies = [
+        {
+            "name": c.name,
+            "value": c.value,
+            "domain": c.domain,
+            "path": c.path,
+            "secure": c.secure,
+            "expires": c.expires,
+        }
+        for c in cookie_jar
+    ]
+    with _lock:
+        data = _load_all()
+        data[portal] = {
+            "cookies": cookies,
+            "fields": fields,
+            "saved_at": now,
+            "expires_at": now + ttl,
+        }
+        _save_all(data)
+
+
+# modifies: SESSION_STATE_FILE
+# effects: forgets any stored state for portal
+def clear_state(portal: str) -> None:
+    with _lock:
+        data = _load_all()
+        if data.pop(portal, None) is not None:
+            _save_all(data)
+
+
+# modifies: cookie_jar
+# effects: loads saved cookie dicts into cookie_jar
+def apply_cookies(cookie_jar, cookies: list[dict]) -> None:
+    for c in cookies:
+        cookie_jar.set_cookie(create_cookie(
+            name=c["name"],
+            value=c["value"],
+            domain=c.get("domain", ""),
+            path=c.get("path", "/"),
+            secure=c.get("secure", False),
+            expires=c.get("expires"),
+        ))
@@ -0,0 +1,147 @@
+# bidnet.py
+# BidNet Direct agency listings: https://www.bidnetdirect.com/<state>/<agency>
+
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+
+from scraper.core.requests_scraper import RequestsScraper
+from scraper.utils.data_utils import filter_by_keywords
+from scraper.core.errors import (
+    SearchTimeoutError,
+    DataExtractionError,
+    PaginationError,
+    ScraperError,
+)
+
+
+# a shared Requests engine for BidNet Direct agency solicitation listings
+#
+# the listing is server-rendered, so each page is one GET; page 1 reveals how many pages exist and the
+# rest are fetched concurrently over the session's pooled connections
+class BidNetEngine(RequestsScraper):
+    # region name used in log and error messages
+    REGION = "BidNet"
+    # query parameter selecting a listing page
+    PAGE_PARAM = "pageNumber"
+    # concurrent page fetches per agency (the per-host rate limiter still applies)
+    MAX_WORKERS = 4
+
+    # modifies: self
+    # effects: initializes the engine for the agency listing at base_url and configures logging
+    def __init__(self, base_url):
+        super().__init__(base_url)
+        self.logger = logging.getLogger(type(self).__module__)
+        self.session.headers.update({
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        })
+
+
+    # effects: returns base_url with the page query parameter set to page, keeping its other parameters
+    def page_url(self, page):
+        parts = urlsplit(self.base_url)
+        query = [(k, v) for k, v in parse_qsl(parts.query) if k != self.PAGE_PARAM]
+        if page > 1:
+            query.append((self.PAGE_PARAM, str(page)))
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+    # effects: GETs listing page number page and returns its HTML
+    def fetch_page(self, page):
+        resp = self.session.get(self.page_url(page), timeout=30)
+        resp.raise_for_status()
+        return resp.text
+
+
+    # modifies: self.current_response
+    # effects: fetches the first listing page and returns its HTML
+    def search(self, **kwargs):
+        self.logger.info(f"Fetching {self.REGION} solicitations")
+        try:
+            self.current_response = self.fetch_page(1)
+            return self.current_response
+        except requests.exceptions.RequestException as re_err:
+            self.logger.error(f"search HTTP error: {re_err}", exc_info=False)
+            raise SearchTimeoutError(f"{self.REGION} search HTTP error") from re_err
+
+
+    # requires: html is a listing page
+    # effects: returns the highest page number linked from the page's paginator (1 if none)
+    def page_count(self, html):
+        pattern = re.compile(rf"[?&]{re.escape(self.PAGE_PARAM)}=(\d+)")
+        pages = [int(m.group(1)) for m in pattern.finditer(html.replace("&amp;", "&"))]
+        return max(pages, default=1)
+
+
+    # requires: html is a listing page
+    # effects: parses every solicitation row on the page into raw record dicts
+    def extract_data(self, html):
+        try:
+            soup = BeautifulSoup(html, "html.parser")
+            records = []
+            for idx, row in enumerate(soup.select("tr.mets-table-row")):
+                sol_num = row.select_one("div.sol-num")
+                title_el = row.select_one("a.solicitation-link")
+                closing = row.select_one("span.sol-closing-date .date-value")
+                if not (sol_num and title_el and closing):
+                    self.logger.error(f"[Row {idx}] Error parsing row: missing element", exc_info=False)
+                    continue
+                code = sol_num.get_text(strip=True)
+                title = title_el.get_text(strip=True)
+                if not code or not title:
+                    self.logger.warning(f"[Row {idx}] Missing data; skipping")
+                    continue
+                records.append({
+                    "title": title,
+                    "code": code,
+                    "end_date": closing.get_text(strip=True),
+                    "link": urljoin(self.base_url, title_el.get("href", "")),
+                })
+            return records
+        except Exception as e:
+            self.logger.error(f"extract_data failed: {e}", exc_info=True)
+            raise DataExtractionError(f"{self.REGION} extract_data failed") from e
+
+
+    # requires: first_page is page 1's HTML
+    # effects: fetches pages 2..N concurrently and returns every page's records in page order
+    def fetch_remaining(self, first_page):
+        pages = self.page_count(first_page)
+        if pages <= 1:
+            return []
+        self.logger.info(f"{self.REGION}: fetching {pages - 1} more pages")
+        try:
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+                htmls = list(pool.map(self.fetch_page, range(2, pages + 1)))
+        except requests.exceptions.RequestException as re_err:
+            self.logger.error(f"pagination HTTP error: {re_err}", exc_info=False)
+            raise PaginationError(f"{self.REGION} pagination failed") from re_err
+        return [record for html in htmls for record in self.extract_data(html)]
+
+
+    # effects: orchestrates search -> extract all pages -> filter; returns filtered records or raises
+    def scrape(self, **kwargs):
+        self.logger.info(f"Starting scrape for {self.REGION}")
+        try:
+            first_page = self.search(**kwargs)
+            records = self.extract_data(first_page) + self.fetch_remaining(first_page)
+
+            seen = set()
+            records = [r for r in records if not (r["code"] in seen or seen.add(r["code"]))]
+            df = pd.DataFrame(records)
+            self.logger.info(f"Total raw records before filtering: {len(df)}")
+            filtered = filter_by_keywords(df)
+            self.logger.info(f"Total records after filtering: {len(filtered)}")
+            return filtered.to_dict("records")
+
+        except (SearchTimeoutError, DataExtractionError, PaginationError, ScraperError):
+            raise
+        except Exception as e:
+            self.logger.error(f"scrape failed: {e}", exc_info=True)
+            raise ScraperError(f"{self.REGION} scrape failed") from e
@@ -0,0 +1,187 @@
+# bonfire.py
+# Bonfire public portals: https://<tenant>.bonfirehub.com/PublicPortal/getOpenPublicOpportunitiesSectionData
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urlsplit
+
+import pandas as pd
+import requests
+
+from scraper.core.requests_scraper import RequestsScraper
+from scraper.utils.data_utils import filter_by_keywords
+from scraper.core.http_replay import RECORD, REPLAY
+from src.config import HTTP_TRANSPORT_MODE
+from scraper.core.errors import (
+    SearchTimeoutError,
+    DataExtractionError,
+    ScraperError,
+)
+
+FEED_PATH = "/PublicPortal/getOpenPublicOpportunitiesSectionData"
+
+
+# a shared Requests engine for Bonfire tenants' open-opportunities feed
+#
+# each tenant is one JSON feed on its own host. when the runner has several Bonfire regions to scrape
+# it calls prefetch() once: every distinct feed is fetched concurrently over one pooled session and
+# parsed once, and each region's scrape() then takes its records from that batch. a region that was
+# not prefetched (or whose prefetch failed and is being retried) fetches its own feed
+class BonfireEngine(RequestsScraper):
+    # region name used in log and error messages
+    REGION = "Bonfire"
+    # concurrent feed fetches per prefetch
+    MAX_WORKERS = 8
+
+    # region class -> (records or None, error or None, http events), filled by prefetch(), consumed by scrape()
+    _prefetched: dict[type, tuple] = {}
+    _prefetch_lock = threading.Lock()
+
+    # modifies: self
+    # effects: initializes the engine for the tenant feed at base_url and configures logging
+    def __init__(self, base_url):
+        super().__init__(base_url)
+        self.logger = logging.getLogger(type(self).__module__)
+        self.host = urlsplit(base_url).netloc.lower()
+        self.feed_url = f"https://{self.host}{FEED_PATH}"
+        self.session.headers.update({
+            "Accept": "application/json, text/javascript, */*; q=0.01",
+            "X-Requested-With": "XMLHttpRequest",
+        })
+
+
+    # effects: GETs this tenant's feed with a timestamp to bypass caches; returns parsed JSON
+    def search(self, **kwargs):
+        return self._fetch_feed(self.feed_url)
+
+
+    # effects: GETs the feed at url on this engine's session; returns parsed JSON
+    def _fetch_feed(self, url):
+        try:
+            resp = self.session.get(f"{url}?_={int(time.time() * 1000)}", timeout=20)
+            resp.raise_for_status()
+            return self.parse_json(resp)
+        except requests.RequestException as e:
+            self.logger.error(f"search HTTP error: {e}", exc_info=False)
+            raise SearchTimeoutError(f"{self.REGION} search HTTP error") from e
+        except ValueError as e:
+            self.logger.error(f"search JSON decode error: {e}", exc_info=False)
+            raise DataExtractionError(f"{self.REGION} search JSON decode failed") from e
+
+
+    # effects: returns the yyyy-mm-dd date of a feed "YYYY-MM-DD HH:MM:SS" closing time, which the feed
+    #          already gives in the tenant's local time, or "" if there is none
+    def _local_date(self, raw):
+        raw = (raw or "").strip()
+        if not raw:
+            return ""
+        return datetime.strptime(raw, "%Y-%m-%d %H:%M:%S").strftime("%Y-%m-%d")
+
+
+    # requires: data is a parsed feed
+    # effects: extracts list of {code, title, end_date, link} dicts; returns empty list if none
+    def extract_data(self, data):
+        projects = (data or {}).get("payload", {}).get("projects", {})
+        if not isinstance(projects, dict) or not projects:
+            self.logger.info(f"No {self.REGION} projects found; returning empty list")
+            return []
+        try:
+            return [
+                {
+                    "code": str(proj.get("ReferenceID", "")).strip(),
+                    "title": str(proj.get("ProjectName", "")).strip(),
+                    "end_date": self._local_date(proj.get("DateClose")),
+                    "link": f"https://{self.host}/opportunities/{pid}",
+                }
+                for pid, proj in projects.items()
+            ]
+        except Exception as e:
+            self.logger.error(f"extract_data failed: {e}", exc_info=True)
+            raise DataExtractionError(f"{self.REGION} extract_data failed") from e
+
+
+    # requires: scraper_classes are BonfireEngine subclasses constructible without arguments
+    # modifies: BonfireEngine._prefetched
+    # effects: fetches and parses every distinct tenant feed concurrently over one session, keeping each
+    #          region's records (or error) and the feed's request events for its scrape() call;
+    #          does nothing when recording or replaying fixtures
+    @classmethod
+    def prefetch(cls, scraper_classes):
+        # fixtures are recorded and replayed per region class, so each region fetches for itself
+        if HTTP_TRANSPORT_MODE in (RECORD, REPLAY):
+            return
+        engines = {scraper_cls: scraper_cls() for scraper_cls in scraper_classes}
+        feeds = {}
+        for engine in engines.values():
+            feeds.setdefault(engine.host, engine)
+        if not feeds:
+            return
+        fetcher = next(iter(feeds.values()))
+        start = time.perf_counter()
+
+        def load(engine):
+            try:
+                return engine.extract_data(fetcher._fetch_feed(engine.feed_url)), None
+            except (SearchTimeoutError, DataExtractionError, ScraperError) as e:
+                return None, e
+
+        try:
+            with ThreadPoolExecutor(max_workers=cls.MAX_WORKERS) as pool:
+                results = dict(zip(feeds, pool.map(load, feeds.values())))
+        finally:
+            for engine in engines.values():
+                engine.close()
+        events = fetcher.http_log.events()
+        with BonfireEngine._prefetch_lock:
+            for scraper_cls, engine in engines.items():
+                records, error = results[engine.host]
+                host_events = [e for e in events if e["template"].startswith(engine.host)]
+                BonfireEngine._prefetched[scraper_cls] = (records, error, host_events)
+        logging.getLogger(__name__).info(
+            f"Prefetched {len(feeds)} Bonfire feed(s) for {len(engines)} region(s) "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+
+
+    # modifies: BonfireEngine._prefetched
+    # effects: drops prefetched results no region consumed
+    @classmethod
+    def discard_prefetched(cls):
+        with BonfireEngine._prefetch_lock:
+            BonfireEngine._prefetched.clear()
+
+
+    # modifies: BonfireEngine._prefetched, self.http_log
+    # effects: returns this region's raw records, taking them from the prefetched batch when there is one;
+    #          a prefetch error is raised once so the runner's retry fetches the feed directly
+    def _records(self, **kwargs):
+        with BonfireEngine._prefetch_lock:
+            entry = BonfireEngine._prefetched.pop(type(self), None)
+        if entry is None:
+            return self.extract_data(self.search(**kwargs))
+        records, error, events = entry
+        for event in events:
+            self.http_log.record(dict(event))
+        if error:
+            raise error
+        self.logger.info(f"Using prefetched {self.REGION} feed ({len(records)} projects)")
+        return list(records)
+
+
+    # effects: orchestrates fetch (or prefetched batch) -> extract -> filter; returns filtered records
+    def scrape(self, **kwargs):
+        self.logger.info(f"Starting scrape for {self.REGION}")
+        try:
+            df = pd.DataFrame(self._records(**kwargs))
+            self.logger.info(f"Total raw records before filtering: {len(df)}")
+            filtered = filter_by_keywords(df)
+            self.logger.info(f"Total records after filtering: {len(filtered)}")
+            return filtered.to_dict("records")
+        except (SearchTimeoutError, DataExtractionError, ScraperError):
+            raise
+        except Exception as e:
+            self.logger.error(f"{self.REGION} scrape unexpected error: {e}", exc_info=True)
+            raise ScraperError(f"{self.REGION} scrape failed") from e
@@ -0,0 +1,284 @@
+# bso.py
+# Periscope BSO portals: <host>/bso/view/search/external/advancedSearchBid.xhtml?openBids=true
+
+import io
+import logging
+import re
+import xml.etree.ElementTree as ET
+from urllib.parse import urlsplit
+
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+
+from scraper.core.requests_scraper import RequestsScraper
+from scraper.utils.data_utils import filter_by_keywords
+from scraper.utils.date_utils import parse_date_generic
+from scraper.core.errors import (
+    SearchTimeoutError,
+    ElementNotFoundError,
+    DataExtractionError,
+    PaginationError,
+    ScraperError,
+)
+
+RESULTS_TABLE = "bidSearchResultsForm:bidResultId"
+_ROW_COUNT_RE = re.compile(r"rowCount\s*:\s*(\d+)")
+
+
+# a shared Requests engine for Periscope BSO "advanced search" portals
+#
+# the open-bids page renders the first page of the PrimeFaces results table; the remaining rows are
+# fetched with the table's own lazy-pagination ajax call at PAGE_SIZE rows per request. tenants that
+# expose the spreadsheet export (EXPORT_FIELDS) get every open bid from a single POST instead
+class BsoEngine(RequestsScraper):
+    # region name used in log and error messages
+    REGION = "BSO"
+    # rows requested per pagination call
+    PAGE_SIZE = 250
+    # tenant-specific form fields that trigger the results export; None paginates the table instead
+    EXPORT_FIELDS: dict | None = None
+    # export spreadsheet column -> record field
+    EXPORT_COLUMNS = {
+        "title": "Description",
+        "code": "Bid Solicitation #",
+        "end_date": "Bid Opening Date",
+    }
+
+    # modifies: self
+    # effects: initializes the engine for the BSO portal at base_url and configures logging
+    def __init__(self, base_url):
+        super().__init__(base_url)
+        self.logger = logging.getLogger(type(self).__module__)
+        parts = urlsplit(base_url)
+        self.origin = f"{parts.scheme}://{parts.netloc}"
+        self.tokens = {}
+        self.session.headers.update({
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Referer": base_url,
+        })
+
+
+    # requires: html is the open-bids search page
+    # effects: returns the JSF form tokens needed to post back to the page
+    def _tokens(self, html):
+        soup = BeautifulSoup(html, "html.parser")
+        tokens = {}
+        csrf = soup.find("input", {"name": "_csrf"})
+        if csrf:
+            tokens["_csrf"] = csrf["value"]
+        viewstate = soup.find("input", {"name": "javax.faces.ViewState"})
+        if not viewstate:
+            raise ElementNotFoundError(f"{self.REGION} ViewState not found")
+        tokens["viewstate"] = viewstate["value"]
+        return tokens
+
+
+    # modifies: self.tokens, self.current_response
+    # effects: GETs the open-bids page, records its form tokens and returns its HTML
+    def search(self, **kwargs):
+        self.logger.info(f"Fetching {self.REGION} open bids")
+        try:
+            resp = self.session.get(self.base_url, timeout=30)
+            resp.raise_for_status()
+        except requests.exceptions.RequestException as re_err:
+            self.logger.error(f"search HTTP error: {re_err}", exc_info=False)
+            raise SearchTimeoutError(f"{self.REGION} search HTTP error") from re_err
+        self.current_response = resp.text
+        self.tokens = self._tokens(resp.text)
+        return resp.text
+
+
+    # requires: html is a results page or a fragment of result rows
+    # effects: parses result rows into raw record dicts
+    def extract_data(self, html):
+        try:
+            soup = BeautifulSoup(html, "html.parser")
+            body = soup.find("tbody", id=f"{RESULTS_TABLE}_data")
+            rows = (body or soup).find_all("tr")
+
+            records = []
+            for row in rows:
+                # reflow tables repeat the column header inside each cell
+                for label in row.select("span.ui-column-title"):
+                    label.decompose()
+                cols = row.find_all("td")
+                if len(cols) < 8:
+                    continue
+                a = cols[0].find("a", href=True)
+                if not a:
+                    continue
+                href = a["href"]
+                records.append({
+                    "title": cols[6].get_text(strip=True).removeprefix("Description"),
+                    "code": a.get_text(strip=True),
+                    "end_date": parse_date_generic(
+                        cols[7].get_text(strip=True).removeprefix("Bid Opening Date")
+                    ),
+                    "link": f"{self.origin}{href}" if href.startswith("/") else href,
+                })
+            return records
+        except Exception as e:
+            self.logger.error(f"extract_data failed: {e}", exc_info=True)
+            raise DataExtractionError(f"{self.REGION} extract_data failed") from e
+
+
+    # requires: search() has run
+    # modifies: self.tokens
+    # effects: fetches PAGE_SIZE rows starting at first and returns their <tr> HTML
+    def _fetch_rows(self, first):
+        payload = {
+            "javax.faces.partial.ajax": "true",
+            "javax.faces.source": RESULTS_TABLE,
+            "javax.faces.partial.execute": RESULTS_TABLE,
+            "javax.faces.partial.render": RESULTS_TABLE,
+            f"{RESULTS_TABLE}_pagination": "true",
+            f"{RESULTS_TABLE}_first": str(first),
+            f"{RESULTS_TABLE}_rows": str(self.PAGE_SIZE),
+            f"{RESULTS_TABLE}_encodeFeature": "true",
+            "bidSearchResultsForm": "bidSearchResultsForm",
+            "javax.faces.ViewState": self.tokens["viewstate"],
+        }
+        if "_csrf" in self.tokens:
+            payload["_csrf"] = self.tokens["_csrf"]
+        headers = {"Faces-Request": "partial/ajax", "X-Requested-With": "XMLHttpRequest"}
+        resp = self.session.post(self.base_url, data=payload, headers=headers, timeout=60)
+        resp.raise_for_status()
+
+        rows = ""
+        for update in ET.fromstring(resp.content).iter("update"):
+            update_id = update.get("id", "")
+            if update_id == RESULTS_TABLE:
+                rows = update.text or ""
+            elif "javax.faces.ViewState" in update_id and update.text:
+                self.tokens["viewstate"] = update.text
+        return rows
+
+
+    # requires: search() has run and html is the page it returned
+    # effects: returns every open bid, paginating the results table past the first page
+    def _paginate(self, html):
+        records = self.extract_data(html)
+        match = _ROW_COUNT_RE.search(html)
+        total = int(match.group(1)) if match else None
+        self.logger.info(f"{self.REGION}: {len(records)} rows on first page, {total or 'unknown'} total")
+
+        seen = {r["code"] for r in records}
+        first = len(records)
+        while records and (total is None or first < total):
+            try:
+                batch = self.extract_data(self._fetch_rows(first))
+            except (requests.exceptions.RequestException, ET.ParseError) as e:
+                self.logger.error(f"pagination at row {first} failed: {e}", exc_info=False)
+                raise PaginationError(f"{self.REGION} pagination failed") from e
+            fresh = [r for r in batch if r["code"] not in seen]
+            if not fresh:
+                break
+            seen.update(r["code"] for r in fresh)
+            records.extend(fresh)
+            first += len(batch)
+        return records
+
+
+    # requires: tokens has "viewstate" (and "_csrf" where the tenant uses it)
+    # effects: POSTs the export form and returns the response
+    def _post_export(self, tokens):
+        payload = {
+            "bidSearchResultsForm": "bidSearchResultsForm",
+            "openBids": "true",
+            "javax.faces.ViewState": tokens["viewstate"],
+            **self.EXPORT_FIELDS,
+        }
+        if "_csrf" in tokens:
+            payload["_csrf"] = tokens["_csrf"]
+        return self.session.post(self.base_url, data=payload, timeout=60)
+
+
+    # effects: returns True if resp is the spreadsheet attachment rather than an HTML page
+    def _is_export(self, resp):
+        return (
+            resp is not None and resp.ok
+            and 'attachment' in resp.headers.get('content-disposition', '')
+            and bool(resp.content)
+            and resp.content.lstrip()[:1] != b"<"
+        )
+
+
+    # requires: EXPORT_FIELDS is set
+    # modifies: session cookies, persisted session state
+    # effects: returns the export response, reusing cached form tokens when they are still accepted,
+    #          or None when the portal did not return a spreadsheet
+    def _export(self):
+        tokens = self.restore_session_state()
+        resp = self._post_export(tokens) if tokens else None
+        if self._is_export(resp):
+            return resp
+        if tokens:
+            self.discard_session_state()
+        self.search()
+        resp = self._post_export(self.tokens)
+        if not self._is_export(resp):
+            return None
+        self.save_session_state(self.tokens)
+        return resp
+
+
+    # requires: resp is an export attachment
+    # effects: reads the CSV/XLSX attachment into raw record dicts
+    def _export_records(self, resp):
+        try:
+            ctype = resp.headers.get("Content-Type", "").lower()
+            disp = resp.headers.get("Content-Disposition", "").lower()
+            buffer = io.BytesIO(resp.content)
+            if "excel" in ctype or disp.rstrip('"').endswith((".xls", ".xlsx")):
+                df = pd.read_excel(buffer, dtype=str)
+            else:
+                df = pd.read_csv(buffer, dtype=str)
+            df.columns = [c.strip() for c in df.columns]
+            df = df.fillna("")
+            self.logger.info(f"Read {len(df)} rows from {self.REGION} export")
+            return [
+                {
+                    "title": row.get(self.EXPORT_COLUMNS["title"], "").strip(),
+                    "code": row.get(self.EXPORT_COLUMNS["code"], "").strip(),
+                    "end_date": row.get(self.EXPORT_COLUMNS["end_date"], "").strip(),
+                    "link": self.base_url,
+                }
+                for _, row in df.iterrows()
+            ]
+        except Exception as e:
+            self.logger.error(f"Failed to read export: {e}", exc_info=True)
+            raise DataExtractionError(f"{self.REGION} export read failed") from e
+
+
+    # effects: orchestrates export-or-paginate -> filter; returns filtered records or raises
+    def scrape(self, **kwargs):
+        self.logger.info(f"Starting scrape for {self.REGION}")
+        try:
+            records = None
+            if self.EXPORT_FIELDS:
+                resp = self._export()
+                if resp is not None:
+                    records = self._export_records(resp)
+                else:
+                    self.logger.warning(f"{self.REGION} export unavailable; paginating results instead")
+            if records is None:
+                html = self.current_response or self.search(**kwargs)
+                records = self._paginate(html)
+
+            df = pd.DataFrame(records)
+            self.logger.info(f"Total raw records before filtering: {len(df)}")
+            filtered = filter_by_keywords(df)
+            self.logger.info(f"Total records after filtering: {len(filtered)}")
+            return filtered.to_dict("records")
+
+        except (SearchTimeoutError, ElementNotFoundError, DataExtractionError, PaginationError, ScraperError):
+            raise
+        except requests.exceptions.RequestException as re_err:
+            self.logger.error(f"{self.REGION} HTTP error: {re_err}", exc_info=False)
+            raise SearchTimeoutError(f"{self.REGION} search HTTP error") from re_err
+        except Exception as e:
+            self.logger.error(f"{self.REGION} scrape failed: {e}", exc_info=True)
+            raise ScraperError(f"{self.REGION} scrape failed") from e
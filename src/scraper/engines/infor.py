@@ -0,0 +1,171 @@
+# infor.py
+# Infor Landmark sourcing lists: <host>/<app>/<SupplierWebApp>/list/SourcingEvent.<OpenForBid list>?csk.SupplierGroup=...
+
+import logging
+import time
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import pandas as pd
+import requests
+
+from scraper.core.requests_scraper import RequestsScraper
+from scraper.utils.data_utils import filter_by_keywords
+from scraper.core.errors import (
+    SearchTimeoutError,
+    DataExtractionError,
+    PaginationError,
+    ScraperError,
+)
+
+
+# a shared Requests engine for Infor Landmark (Lawson SCM / CloudSuite FSM) open sourcing-event lists
+#
+# the supplier list page answers XHR requests with its data view as JSON, so each tenant is read with
+# PAGE_SIZE rows per GET and the view's next-page key is followed until the list is exhausted
+class InforEngine(RequestsScraper):
+    # region name used in log and error messages
+    REGION = "Infor"
+    # rows requested per list call
+    PAGE_SIZE = 500
+    # derived supplier statuses kept (rows without a status are dropped); None keeps every row the list returns
+    OPEN_STATUSES = ("open",)
+    # safety cap on next-page requests per scrape
+    MAX_PAGES = 50
+
+    # modifies: self
+    # effects: initializes the engine for the tenant list at base_url and configures logging
+    def __init__(self, base_url):
+        super().__init__(base_url)
+        self.logger = logging.getLogger(type(self).__module__)
+        parts = urlsplit(base_url)
+        self.list_base = urlunsplit(parts._replace(query=""))
+        # e.g. "SourcingEvent.OpenForBid" or a tenant's own "SourcingEvent.XiOpenForBid"
+        self.list_name = parts.path.rsplit("/", 1)[-1]
+        self.query = [
+            (k, v) for k, v in parse_qsl(parts.query)
+            if k not in ("pageop", "pagesize", "pageSize", "lk", "fk", "hasNext", "hasPrevious",
+                         "previousDisabled", "_")
+        ]
+        self.session.headers.update({
+            "Accept": "application/json, text/javascript, */*; q=0.01",
+            "X-Requested-With": "XMLHttpRequest",
+            "x-ssoclienttype": "MSXML",
+        })
+
+
+    # effects: returns the list URL for one page; last_key continues after a previous page
+    def list_url(self, last_key=None):
+        # tenants differ in which casing of the page-size parameter they honour
+        query = self.query + [("pagesize", self.PAGE_SIZE), ("pageSize", self.PAGE_SIZE)]
+        if last_key:
+            query += [("pageop", "next"), ("lk", last_key)]
+        else:
+            query += [("pageop", "load")]
+        # cache-buster the list page's own XHR sends
+        query.append(("_", int(time.time() * 1000)))
+        return f"{self.list_base}?{urlencode(query)}"
+
+
+    # effects: GETs one page of the list and returns its data view
+    def _fetch(self, last_key=None):
+        resp = self.session.get(self.list_url(last_key), timeout=30)
+        resp.raise_for_status()
+        view = self.parse_json(resp).get("dataViewSet")
+        if not view or "data" not in view:
+            raise DataExtractionError(f"{self.REGION} response missing 'dataViewSet.data'")
+        return view
+
+
+    # modifies: self.current_response
+    # effects: GETs the first page of the open-events list and returns its data view
+    def search(self, **kwargs):
+        self.logger.info(f"Fetching {self.REGION} open sourcing events")
+        try:
+            self.current_response = self._fetch()
+            return self.current_response
+        except requests.exceptions.RequestException as re_err:
+            self.logger.error(f"search HTTP error: {re_err}", exc_info=False)
+            raise SearchTimeoutError(f"{self.REGION} search HTTP error") from re_err
+        except ValueError as ve:
+            self.logger.error(f"search JSON decode error: {ve}", exc_info=False)
+            raise DataExtractionError(f"{self.REGION} search JSON decode failed") from ve
+
+
+    # effects: returns the yyyy-mm-dd date of an Infor yyyymmddHHMMSS... timestamp, or it unchanged
+    def _date(self, raw):
+        raw = (raw or "").strip()
+        try:
+            return datetime.strptime(raw[:14], "%Y%m%d%H%M%S").strftime("%Y-%m-%d")
+        except ValueError:
+            return raw
+
+
+    # requires: view is a data view returned by search() or _fetch()
+    # effects: extracts {code, title, end_date, link} for events whose status is in OPEN_STATUSES
+    def extract_data(self, view):
+        try:
+            records = []
+            range_key = view.get("rangeViewKey", "")
+            action = self.list_name.split(".", 1)[-1]
+            query = urlencode(self.query)
+            for item in view["data"]:
+                fields = item.get("fields", {})
+                status = fields.get("_op_DerivedStatusForSupplier_spc_translation_cp_") or {}
+                if self.OPEN_STATUSES is not None and str(status.get("value", "")).lower() not in self.OPEN_STATUSES:
+                    continue
+                code = fields.get("SourcingEvent", {}).get("value")
+                if not code:
+                    continue
+
+                resource = item.get("resourceId")
+                detail = self.list_base.replace(f"/list/{self.list_name}", f"/form/{resource}.Summary")
+                records.append({
+                    "code": str(code),
+                    "title": str(fields.get("Name", {}).get("value", "")).strip(),
+                    "end_date": self._date(fields.get("CloseDate", {}).get("value")),
+                    "link": f"{detail}?{query}&action=_open&list={range_key}.{action}&pk={resource}",
+                })
+            return records
+        except Exception as e:
+            self.logger.error(f"extract_data failed: {e}", exc_info=True)
+            raise DataExtractionError(f"{self.REGION} extract_data failed") from e
+
+
+    # requires: view is the data view search() returned
+    # effects: returns every open event, following the view's next-page key
+    def _paginate(self, view):
+        records = self.extract_data(view)
+        seen = {r["code"] for r in records}
+        for _ in range(self.MAX_PAGES):
+            last_key = view.get("lastKey")
+            if not view.get("hasNext") or not last_key:
+                break
+            try:
+                view = self._fetch(last_key)
+            except (requests.exceptions.RequestException, ValueError) as e:
+                self.logger.error(f"pagination after {last_key} failed: {e}", exc_info=False)
+                raise PaginationError(f"{self.REGION} pagination failed") from e
+            if not view["data"] or view.get("lastKey") == last_key:
+                break
+            fresh = [r for r in self.extract_data(view) if r["code"] not in seen]
+            seen.update(r["code"] for r in fresh)
+            records.extend(fresh)
+        return records
+
+
+    # effects: orchestrates search -> extract all pages -> filter; returns filtered records or raises
+    def scrape(self, **kwargs):
+        self.logger.info(f"Starting scrape for {self.REGION}")
+        try:
+            records = self._paginate(self.search(**kwargs))
+            df = pd.DataFrame(records)
+            self.logger.info(f"Total raw records before filtering: {len(df)}")
+            filtered = filter_by_keywords(df)
+            self.logger.info(f"Total records after filtering: {len(filtered)}")
+            return filtered.to_dict("records")
+        except (SearchTimeoutError, DataExtractionError, PaginationError, ScraperError):
+            raise
+        except Exception as e:
+            self.logger.error(f"{self.REGION} scrape failed: {e}", exc_info=True)
+            raise ScraperError(f"{self.REGION} scrape failed") from e
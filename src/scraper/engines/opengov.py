@@ -0,0 +1,288 @@
+# opengov.py
+# OpenGov Procurement public projects: https://api.procurement.opengov.com/api/v1/government/<slug>/project/public
+
+import logging
+import math
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import requests
+
+from scraper.core.requests_scraper import RequestsScraper
+from scraper.utils.data_utils import filter_by_keywords
+from scraper.core.http_replay import RECORD, REPLAY
+from src.config import OPENGOV_TENANTS, HTTP_TRANSPORT_MODE
+from scraper.core.errors import (
+    SearchTimeoutError,
+    DataExtractionError,
+    PaginationError,
+    ScraperError,
+)
+
+PORTAL_URL = "https://procurement.opengov.com"
+DEFAULT_TIMEZONE = "America/New_York"
+_SLUG_RE = re.compile(r"/government/([^/]+)/")
+
+
+# a shared Requests engine for OpenGov Procurement tenants' public project lists
+#
+# every tenant is the same JSON endpoint on one API host, selected by its government slug. page 1 carries
+# the total row count, so the remaining pages are independent POSTs fetched concurrently. when the runner
+# has several OpenGov regions to scrape it calls prefetch() once: all of their pages go through one pooled
+# session, and each region's scrape() then takes its records from that batch. a region that was not
+# prefetched (or whose prefetch failed and is being retried) fetches its own pages
+class OpenGovEngine(RequestsScraper):
+    # region name used in log and error messages
+    REGION = "OpenGov"
+    # rows requested for page 1; later pages ask for as many rows as page 1 returned, so a lower server cap
+    # still pages without gaps whether the server offsets by the requested limit or by its cap
+    LIMIT = 500
+    # concurrent page fetches (per region, or across all regions in a prefetch)
+    MAX_WORKERS = 8
+    # safety cap on pages walked when the response carries no total count
+    MAX_PAGES = 50
+
+    # region class -> (records or None, error or None, http events), filled by prefetch(), consumed by scrape()
+    _prefetched: dict[type, tuple] = {}
+    _prefetch_lock = threading.Lock()
+
+    # modifies: self
+    # effects: initializes the engine for the tenant endpoint at base_url and configures logging;
+    #          raises ValueError if base_url names no government slug
+    def __init__(self, base_url):
+        super().__init__(base_url)
+        self.logger = logging.getLogger(type(self).__module__)
+        match = _SLUG_RE.search(base_url)
+        if not match:
+            raise ValueError(f"{self.REGION} URL has no government slug: {base_url}")
+        self.slug = match.group(1)
+        self.timezone = ZoneInfo(OPENGOV_TENANTS.get(self.slug, DEFAULT_TIMEZONE))
+        self.session.headers.update({
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Origin": PORTAL_URL,
+            "Referer": f"{PORTAL_URL}/",
+        })
+
+
+    # requires: page >= 1; session defaults to this engine's own; limit defaults to LIMIT
+    # effects: POSTs the open-projects query for page on session; returns the parsed response or raises
+    def fetch_page(self, page, session=None, limit=None):
+        payload = {
+            "filters": [{"type": "status", "value": "open"}],
+            "quickSearchQuery": None,
+            "limit": limit or self.LIMIT,
+            "page": page,
+            # a fixed order keeps concurrently fetched pages from overlapping
+            "sortField": "proposalDeadline",
+            "sortDirection": "ASC",
+        }
+        error = SearchTimeoutError if page == 1 else PaginationError
+        try:
+            resp = (session or self.session).post(self.base_url, json=payload, timeout=20)
+            resp.raise_for_status()
+            data = self.parse_json(resp)
+        except requests.RequestException as e:
+            self.logger.error(f"page {page} HTTP error: {e}", exc_info=False)
+            raise error(f"{self.REGION} HTTP error on page {page}") from e
+        except ValueError as e:
+            self.logger.error(f"page {page} JSON decode error: {e}", exc_info=False)
+            raise DataExtractionError(f"{self.REGION} JSON decode failed on page {page}") from e
+        if not isinstance(data, dict) or not isinstance(data.get("rows"), list):
+            raise DataExtractionError(f"{self.REGION} response missing 'rows' on page {page}")
+        return data
+
+
+    # modifies: self.current_response
+    # effects: fetches the first page of open projects and returns it
+    def search(self, **kwargs):
+        self.logger.info(f"Fetching {self.REGION} open projects for {self.slug}")
+        self.current_response = self.fetch_page(1)
+        return self.current_response
+
+
+    # requires: first is page 1's response
+    # effects: returns the further page numbers implied by its total count, or None if it has no count
+    def remaining_pages(self, first):
+        rows, count = first["rows"], first.get("count")
+        if not rows:
+            return []
+        if not isinstance(count, int):
+            return None
+        return list(range(2, math.ceil(count / len(rows)) + 1))
+
+
+    # requires: first is page 1's response; session defaults to this engine's own
+    # effects: fetches page 2 onwards one at a time until a page comes back empty; returns those responses
+    def _walk(self, first, session=None):
+        pages, data = [], first
+        for page in range(2, self.MAX_PAGES + 1):
+            if not data["rows"]:
+                break
+            data = self.fetch_page(page, session, len(first["rows"]))
+            pages.append(data)
+        return pages
+
+
+    # requires: first is page 1's response
+    # effects: returns the responses for every further page, fetched concurrently when the count is known
+    def fetch_remaining(self, first):
+        pages = self.remaining_pages(first)
+        if pages is None:
+            return self._walk(first)
+        if pages:
+            self.logger.info(f"{self.REGION}: fetching {len(pages)} more pages")
+        limit = len(first["rows"])
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            return list(pool.map(lambda page: self.fetch_page(page, limit=limit), pages))
+
+
+    # effects: returns the tenant-local yyyy-mm-dd date of an ISO-8601 UTC deadline, or "" if there is none
+    def _local_date(self, raw):
+        raw = (raw or "").strip()
+        if not raw:
+            return ""
+        dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        return dt.astimezone(self.timezone).strftime("%Y-%m-%d")
+
+
+    # requires: responses are page responses from fetch_page()
+    # effects: extracts {code, title, end_date, link} dicts across all pages, dropping repeated projects
+    def extract_data(self, responses):
+        try:
+            records, seen = [], set()
+            for data in responses:
+                for proj in data["rows"]:
+                    pid = proj.get("id")
+                    if pid is None or pid in seen:
+                        continue
+                    seen.add(pid)
+                    records.append({
+                        "code": str(proj.get("financialId") or pid).strip(),
+                        "title": str(proj.get("title") or "").strip(),
+                        "end_date": self._local_date(proj.get("proposalDeadline")),
+                        "link": f"{PORTAL_URL}/portal/{self.slug}/projects/{pid}",
+                    })
+            return records
+        except Exception as e:
+            self.logger.error(f"extract_data failed: {e}", exc_info=True)
+            raise DataExtractionError(f"{self.REGION} extract_data failed") from e
+
+
+    # requires: scraper_classes are OpenGovEngine subclasses constructible without arguments
+    # modifies: OpenGovEngine._prefetched
+    # effects: fetches every region's first page, then all of their remaining pages, concurrently over one
+    #          session, keeping each region's records (or error) and request events for its scrape() call;
+    #          does nothing when recording or replaying fixtures
+    @classmethod
+    def prefetch(cls, scraper_classes):
+        # fixtures are recorded and replayed per region class, so each region fetches for itself
+        if HTTP_TRANSPORT_MODE in (RECORD, REPLAY):
+            return
+        engines = {scraper_cls: scraper_cls() for scraper_cls in scraper_classes}
+        if not engines:
+            return
+        fetcher = next(iter(engines.values()))
+        session = fetcher.session
+        start = time.perf_counter()
+
+        def attempt(fetch):
+            try:
+                return fetch(), None
+            except (SearchTimeoutError, DataExtractionError, PaginationError, ScraperError) as e:
+                return None, e
+
+        def first_page(engine):
+            return attempt(lambda: engine.fetch_page(1, session))
+
+        def rest(job):
+            _, engine, page, first = job
+            if page is None:
+                return attempt(lambda: engine._walk(first, session))
+            return attempt(lambda: [engine.fetch_page(page, session, len(first["rows"]))])
+
+        try:
+            with ThreadPoolExecutor(max_workers=cls.MAX_WORKERS) as pool:
+                firsts = dict(zip(engines, pool.map(first_page, engines.values())))
+                jobs = []
+                for scraper_cls, (first, _) in firsts.items():
+                    if first is None:
+                        continue
+                    engine = engines[scraper_cls]
+                    pages = engine.remaining_pages(first)
+                    # None: no total count, so that region walks its pages in a single job
+                    for page in [None] if pages is None else pages:
+                        jobs.append((scraper_cls, engine, page, first))
+                fetched = list(pool.map(rest, jobs))
+        finally:
+            for engine in engines.values():
+                engine.close()
+
+        responses = {scraper_cls: [first] for scraper_cls, (first, _) in firsts.items() if first is not None}
+        errors = {scraper_cls: error for scraper_cls, (_, error) in firsts.items() if error}
+        for (scraper_cls, *_), (pages, error) in zip(jobs, fetched):
+            if error:
+                errors.setdefault(scraper_cls, error)
+            else:
+                responses[scraper_cls] += pages
+
+        events = fetcher.http_log.events()
+        with OpenGovEngine._prefetch_lock:
+            for scraper_cls, engine in engines.items():
+                if scraper_cls in errors:
+                    records, error = None, errors[scraper_cls]
+                else:
+                    records, error = attempt(lambda: engine.extract_data(responses[scraper_cls]))
+                tenant_events = [e for e in events if f"/government/{engine.slug}/" in e["template"]]
+                OpenGovEngine._prefetched[scraper_cls] = (records, error, tenant_events)
+        logging.getLogger(__name__).info(
+            f"Prefetched {sum(len(r) for r in responses.values())} OpenGov page(s) for {len(engines)} region(s) "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+
+
+    # modifies: OpenGovEngine._prefetched
+    # effects: drops prefetched results no region consumed
+    @classmethod
+    def discard_prefetched(cls):
+        with OpenGovEngine._prefetch_lock:
+            OpenGovEngine._prefetched.clear()
+
+
+    # modifies: OpenGovEngine._prefetched, self.http_log
+    # effects: returns this region's raw records, taking them from the prefetched batch when there is one;
+    #          a prefetch error is raised once so the runner's retry fetches the pages directly
+    def _records(self, **kwargs):
+        with OpenGovEngine._prefetch_lock:
+            entry = OpenGovEngine._prefetched.pop(type(self), None)
+        if entry is None:
+            first = self.search(**kwargs)
+            return self.extract_data([first] + self.fetch_remaining(first))
+        records, error, events = entry
+        for event in events:
+            self.http_log.record(dict(event))
+        if error:
+            raise error
+        self.logger.info(f"Using prefetched {self.REGION} projects ({len(records)} projects)")
+        return list(records)
+
+
+    # effects: orchestrates fetch all pages (or prefetched batch) -> extract -> filter; returns filtered records
+    def scrape(self, **kwargs):
+        self.logger.info(f"Starting scrape for {self.REGION}")
+        try:
+            df = pd.DataFrame(self._records(**kwargs))
+            self.logger.info(f"Total raw records before filtering: {len(df)}")
+            filtered = filter_by_keywords(df)
+            self.logger.info(f"Total records after filtering: {len(filtered)}")
+            return filtered.to_dict("records")
+        except (SearchTimeoutError, DataExtractionError, PaginationError, ScraperError):
+            raise
+        except Exception as e:
+            self.logger.error(f"{self.REGION} scrape failed: {e}", exc_info=True)
+            raise ScraperError(f"{self.REGION} scrape failed") from e
@@ -0,0 +1,225 @@
+# peoplesoft.py
+# PeopleSoft supplier portals: <host>/psc/<site>/SUPPLIER/ERP/c/<menu>.<component>.GBL
+
+import logging
+import re
+from datetime import date
+from urllib.parse import urljoin
+
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+
+from scraper.core.requests_scraper import RequestsScraper
+from scraper.utils.data_utils import filter_by_keywords
+from scraper.utils.date_utils import parse_date_generic
+from scraper.core.errors import (
+    SearchTimeoutError,
+    ElementNotFoundError,
+    DataExtractionError,
+    PaginationError,
+    ScraperError,
+)
+
+_VIEW_ALL_RE = re.compile(r"\b([A-Z0-9_]+\$hviewall\$0)\b")
+_NEXT_ROWS_RE = re.compile(r"\b([A-Z0-9_]+\$hdown\$0)\b")
+
+
+# a shared Requests engine for PeopleSoft supplier-portal components
+#
+# a PeopleSoft page is one server-side component state: every hidden field of the win0 form (ICSID,
+# ICStateNum, ...) must be posted back with the ICAction naming the control that was "clicked", and the
+# response carries the next state. the engine replays those posts over HTTP, preferring the grid's
+# "View All" action and falling back to its next-rows action
+class PeopleSoftEngine(RequestsScraper):
+    # region name used in log and error messages
+    REGION = "PeopleSoft"
+    # CSS selector for the results grid and which match to read
+    TABLE_SELECTOR = 'table[title="Bidding Event Information"]'
+    TABLE_INDEX = 1
+    # CSS selector for data rows within the grid; falls back to every row after the header
+    ROW_SELECTOR = "tr.ps_grid-row"
+    # record field -> grid column index
+    COLUMNS = {"title": 0, "code": 2, "end_date": 5}
+    # drop rows whose closing date has passed (for grids that list closed events too, newest first); such
+    # grids are stepped page by page without "View All", stopping at the first page with no open rows
+    OPEN_ONLY = False
+    # safety cap on next-rows posts per scrape
+    MAX_PAGES = 100
+
+    # modifies: self
+    # effects: initializes the engine for the component at base_url and configures logging
+    def __init__(self, base_url):
+        super().__init__(base_url)
+        self.logger = logging.getLogger(type(self).__module__)
+        # /psp/ wraps the component in the portal's iframe; /psc/ serves the component itself
+        self.content_url = base_url.replace("/psp/", "/psc/", 1)
+        self.action_url = self.content_url
+        self.state = {}
+        self.session.headers.update({
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Referer": self.content_url,
+        })
+
+
+    # requires: html is a component page
+    # modifies: self.state, self.action_url
+    # effects: records the win0 form's hidden fields and post target; returns False if the page has no ICSID
+    def _read_state(self, html):
+        soup = BeautifulSoup(html, "html.parser")
+        form = soup.find("form", attrs={"name": "win0"}) or soup
+        fields = {
+            inp["name"]: inp.get("value", "")
+            for inp in form.find_all("input", attrs={"type": "hidden"})
+            if inp.get("name")
+        }
+        if not fields.get("ICSID"):
+            return False
+        self.state = fields
+        action = form.get("action") if form is not soup else None
+        if action:
+            self.action_url = urljoin(self.content_url, action)
+        return True
+
+
+    # modifies: self.state, self.current_response, session cookies
+    # effects: GETs the component page (twice if the first visit only set the signon cookies),
+    #          records its state and returns its HTML
+    def search(self, **kwargs):
+        self.logger.info(f"Fetching {self.REGION} bidding events")
+        try:
+            for _ in range(2):
+                resp = self.session.get(self.content_url, timeout=30)
+                resp.raise_for_status()
+                if self._read_state(resp.text):
+                    self.current_response = resp.text
+                    return resp.text
+        except requests.exceptions.RequestException as re_err:
+            self.logger.error(f"search HTTP error: {re_err}", exc_info=False)
+            raise SearchTimeoutError(f"{self.REGION} search HTTP error") from re_err
+        self.logger.error("component page has no ICSID")
+        raise ElementNotFoundError(f"{self.REGION} component state not found")
+
+
+    # requires: search() has run
+    # modifies: self.state, self.current_response
+    # effects: posts the component state with ICAction=action and returns the resulting page's HTML
+    def post_action(self, action):
+        payload = {**self.state, "ICAction": action, "ICAJAX": "0"}
+        resp = self.session.post(self.action_url, data=payload, timeout=60)
+        resp.raise_for_status()
+        if not self._read_state(resp.text):
+            raise ElementNotFoundError(f"{self.REGION} lost component state after {action}")
+        self.current_response = resp.text
+        return resp.text
+
+
+    # requires: html is a component page
+    # effects: returns the grid's data rows
+    def _rows(self, html):
+        soup = BeautifulSoup(html, "html.parser")
+        tables = soup.select(self.TABLE_SELECTOR)
+        if len(tables) <= self.TABLE_INDEX:
+            self.logger.error(f"expected >{self.TABLE_INDEX} results tables, found {len(tables)}")
+            raise ElementNotFoundError(f"{self.REGION} bidding table not found")
+        table = tables[self.TABLE_INDEX]
+        rows = table.select(self.ROW_SELECTOR)
+        if not rows:
+            rows = table.find_all("tr")[1:]
+        return rows
+
+
+    # requires: html is a component page
+    # effects: parses the results grid into raw record dicts
+    def extract_data(self, html):
+        if not html:
+            raise DataExtractionError(f"Empty page for {self.REGION} extract_data")
+        try:
+            records = []
+            width = max(self.COLUMNS.values()) + 1
+            for row in self._rows(html):
+                cols = row.find_all("td", recursive=False) or row.find_all("td")
+                if len(cols) < width:
+                    continue
+                code_cell = cols[self.COLUMNS["code"]]
+                anchor = code_cell.find("a", href=True)
+                href = anchor["href"] if anchor else ""
+                records.append({
+                    "title": cols[self.COLUMNS["title"]].get_text(strip=True),
+                    "code": code_cell.get_text(strip=True),
+                    "end_date": parse_date_generic(cols[self.COLUMNS["end_date"]].get_text(strip=True)),
+                    "link": href if href and not href.startswith("javascript:") else self.base_url,
+                })
+            return [r for r in records if r["code"] and r["title"]]
+        except ElementNotFoundError:
+            raise
+        except Exception as e:
+            self.logger.error(f"extract_data failed: {e}", exc_info=True)
+            raise DataExtractionError(f"{self.REGION} extract_data failed") from e
+
+
+    # requires: records are one page's rows
+    # effects: returns whether pagination should continue past this page; OPEN_ONLY grids stop at a page
+    #          with no open rows, since everything after it closed earlier still
+    def _more_pages(self, records):
+        return not self.OPEN_ONLY or bool(self._open(records))
+
+
+    # requires: search() has run and html is the page it returned
+    # effects: returns every row of the grid, expanding it with View All or stepping through next-rows posts
+    def _paginate(self, html):
+        try:
+            # View All on an OPEN_ONLY grid would load its whole closed history
+            view_all = None if self.OPEN_ONLY else _VIEW_ALL_RE.search(html)
+            if view_all:
+                self.logger.info(f"{self.REGION}: expanding grid with {view_all.group(1)}")
+                html = self.post_action(view_all.group(1))
+
+            records = self.extract_data(html)
+            seen = {r["code"] for r in records}
+            more = self._more_pages(records)
+            for _ in range(self.MAX_PAGES):
+                next_rows = _NEXT_ROWS_RE.search(html) if more else None
+                if not next_rows:
+                    break
+                html = self.post_action(next_rows.group(1))
+                fresh = [r for r in self.extract_data(html) if r["code"] not in seen]
+                if not fresh:
+                    break
+                seen.update(r["code"] for r in fresh)
+                records.extend(fresh)
+                more = self._more_pages(fresh)
+            if not more:
+                self.logger.info(f"{self.REGION}: reached closed events; stopping pagination")
+            return records
+        except requests.exceptions.RequestException as re_err:
+            self.logger.error(f"pagination HTTP error: {re_err}", exc_info=False)
+            raise PaginationError(f"{self.REGION} pagination failed") from re_err
+
+
+    # effects: returns records whose closing date is today or later (or unparseable)
+    def _open(self, records):
+        today = date.today().isoformat()
+        return [r for r in records if not re.match(r"\d{4}-\d{2}-\d{2}$", r["end_date"]) or r["end_date"] >= today]
+
+
+    # effects: orchestrates search -> expand/paginate grid -> filter; returns filtered records or raises
+    def scrape(self, **kwargs):
+        self.logger.info(f"Starting scrape for {self.REGION}")
+        try:
+            records = self._paginate(self.search(**kwargs))
+            if self.OPEN_ONLY:
+                records = self._open(records)
+
+            df = pd.DataFrame(records)
+            self.logger.info(f"Total raw records before filtering: {len(df)}")
+            filtered = filter_by_keywords(df)
+            self.logger.info(f"Total records after filtering: {len(filtered)}")
+            return filtered.to_dict("records")
+
+        except (SearchTimeoutError, ElementNotFoundError, DataExtractionError, PaginationError, ScraperError):
+            raise
+        except Exception as e:
+            self.logger.error(f"{self.REGION} scrape failed: {e}", exc_info=True)
+            raise ScraperError(f"{self.REGION} scrape failed") from e
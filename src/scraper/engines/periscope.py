@@ -0,0 +1,237 @@
+# periscope.py
+# request_browse_public portals: <host>/page.aspx/en/rfp/request_browse_public
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+
+from scraper.core.requests_scraper import RequestsScraper
+from scraper.utils.data_utils import filter_by_keywords
+from scraper.utils.date_utils import parse_date_generic
+from scraper.core.errors import (
+    SearchTimeoutError,
+    ElementNotFoundError,
+    DataExtractionError,
+    PaginationError,
+    ScraperError,
+)
+
+GRID = "body_x_grid_grd"
+# the status filter's "Open" option and the user-value list the page posts alongside it
+STATUS_FILTER = {
+    "body_x_selStatusCode_4": "val",
+    "hdnUserValue": ",body_x_selStatusCode_4,body_x_cbRfpPubAward",
+}
+
+
+# a shared Requests engine for "request_browse_public" sourcing portals
+#
+# one search POST applies the Open filter and returns page 0 of the results grid along with its page
+# count; every further page is an independent ajax post of the same form state, so they are fetched
+# concurrently. the form state is cached per tenant (SESSION_STATE_KEY) and the warm-up GET only runs
+# when the portal rejects it
+class PeriscopeEngine(RequestsScraper):
+    # region name used in log and error messages
+    REGION = "Periscope"
+    # grid column index per record field, used when the header row does not name the column
+    COLUMNS = {"code": 1, "title": 2, "end_date": 5}
+    # concurrent page fetches per tenant (the per-host rate limiter still applies)
+    MAX_WORKERS = 4
+
+    # modifies: self
+    # effects: initializes the engine for the browse page at base_url and configures logging
+    def __init__(self, base_url):
+        super().__init__(base_url)
+        self.logger = logging.getLogger(type(self).__module__)
+        self.form_state = {}
+        self.ajax_url = (
+            f"{base_url.replace('page.aspx', 'ajax.aspx')}"
+            "?ivControlUIDsAsync=body:x:grid:upgrid&asyncmodulename=rfp&asyncpagename=request_browse_public"
+        )
+        self.session.headers.update({
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Referer": base_url,
+        })
+
+
+    # requires: html is a browse page
+    # effects: returns the page's hidden form fields
+    def _hidden_fields(self, html):
+        soup = BeautifulSoup(html, "html.parser")
+        return {
+            inp["name"]: inp.get("value", "")
+            for inp in soup.find_all("input", type="hidden")
+            if inp.get("name")
+        }
+
+
+    # requires: fields holds the hidden inputs of a browse page
+    # effects: POSTs the Open-filtered search; returns the response, or None if the portal rejected the state
+    def _post_search(self, fields):
+        payload = {
+            **fields,
+            **STATUS_FILTER,
+            "__EVENTTARGET": "body:x:prxFilterBar:x:cmdSearchBtn",
+            "__EVENTARGUMENT": "",
+        }
+        resp = self.session.post(self.base_url, data=payload, timeout=30)
+        if not resp.ok or GRID not in resp.text:
+            self.logger.warning(f"search POST rejected: {resp.status_code}")
+            return None
+        return resp
+
+
+    # modifies: self.form_state, self.current_response, session cookies, persisted session state
+    # effects: runs the search, reusing cached form state when it is still accepted, and returns page 0's HTML
+    def search(self, **kwargs):
+        self.logger.info(f"Searching {self.REGION} open solicitations")
+        try:
+            fields = self.restore_session_state()
+            resp = self._post_search(fields) if fields else None
+            if fields and resp is None:
+                self.discard_session_state()
+            if resp is None:
+                warmup = self.session.get(self.base_url, timeout=15)
+                warmup.raise_for_status()
+                fields = self._hidden_fields(warmup.text)
+                resp = self._post_search(fields)
+                if resp is None:
+                    raise SearchTimeoutError(f"{self.REGION} search POST rejected")
+                self.save_session_state(fields)
+        except requests.exceptions.RequestException as re_err:
+            self.logger.error(f"search HTTP error: {re_err}", exc_info=False)
+            raise SearchTimeoutError(f"{self.REGION} search HTTP error") from re_err
+        self.form_state = fields
+        self.current_response = resp.text
+        return resp.text
+
+
+    # requires: html is a page with the results grid
+    # effects: returns the grid's highest page index (0 for a single page)
+    def max_page(self, html):
+        inp = BeautifulSoup(html, "html.parser").find("input", {"id": f"maxpageindex{GRID}"})
+        try:
+            return int(inp["value"]) if inp else 0
+        except (KeyError, ValueError):
+            return 0
+
+
+    # requires: search() has run
+    # effects: POSTs the grid's ajax pager for page index page and returns the returned grid HTML
+    def fetch_page(self, page):
+        payload = {
+            "__EVENTTARGET": GRID,
+            "__EVENTARGUMENT": f"Page|{page}",
+            "__VIEWSTATE": self.form_state.get("__VIEWSTATE", ""),
+            "__VIEWSTATEGENERATOR": self.form_state.get("__VIEWSTATEGENERATOR", ""),
+            "CSRFToken": self.form_state.get("CSRFToken", ""),
+            **STATUS_FILTER,
+            f"ajaxrowsiscounted{GRID}": "True",
+        }
+        headers = {
+            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+            "IV-Ajax": "AjaxPost=true",
+            "IV-AjaxControl": "updatepanel",
+            "X-Requested-With": "XMLHttpRequest",
+        }
+        resp = self.session.post(self.ajax_url, data=payload, headers=headers, timeout=30)
+        resp.raise_for_status()
+        return resp.text
+
+
+    # requires: table is the results grid
+    # effects: returns record field -> column index, read from the header row where it names the column
+    def _columns(self, table):
+        columns = dict(self.COLUMNS)
+        headers = [th.get_text(strip=True) for th in table.select("thead th")] or [
+            td.get_text(strip=True) for td in (table.find("tr") or table).find_all(["th", "td"])
+        ]
+        for idx, text in enumerate(headers):
+            if text == "Code":
+                columns["code"] = idx
+            elif text == "Label":
+                columns["title"] = idx
+            elif text.startswith("End"):
+                columns["end_date"] = idx
+        return columns
+
+
+    # requires: html contains the results grid
+    # effects: parses the grid rows into raw record dicts
+    def extract_data(self, html):
+        if not html:
+            raise DataExtractionError(f"Empty page for {self.REGION} extract_data")
+        try:
+            table = BeautifulSoup(html, "html.parser").find("table", id=GRID)
+            if not table:
+                self.logger.error("Could not find results grid")
+                raise ElementNotFoundError(f"{self.REGION} results table not found")
+
+            columns = self._columns(table)
+            width = max(columns.values()) + 1
+            rows = table.select(f"tbody > tr[id^={GRID}_tr_]") or table.select("tbody > tr")
+            records = []
+            for tr in rows:
+                tds = tr.find_all("td", recursive=False)
+                if len(tds) < width:
+                    continue
+                a = tds[0].find("a", href=True) or tr.find("a", href=True)
+                records.append({
+                    "title": tds[columns["title"]].get_text(strip=True),
+                    "code": tds[columns["code"]].get_text(strip=True),
+                    "end_date": parse_date_generic(tds[columns["end_date"]].get_text(strip=True)),
+                    "link": urljoin(self.base_url, a["href"].strip()) if a else self.base_url,
+                })
+            return records
+        except (ElementNotFoundError, DataExtractionError):
+            raise
+        except Exception as e:
+            self.logger.error(f"extract_data failed: {e}", exc_info=True)
+            raise DataExtractionError(f"{self.REGION} extract_data failed") from e
+
+
+    # requires: first_page is the HTML search() returned
+    # effects: fetches page indexes 1..max concurrently and returns every page's records in page order
+    def fetch_remaining(self, first_page):
+        last = self.max_page(first_page)
+        if last < 1:
+            return []
+        self.logger.info(f"{self.REGION}: fetching {last} more pages")
+        try:
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+                htmls = list(pool.map(self.fetch_page, range(1, last + 1)))
+        except requests.exceptions.RequestException as re_err:
+            self.logger.error(f"pagination HTTP error: {re_err}", exc_info=False)
+            raise PaginationError(f"{self.REGION} pagination failed") from re_err
+        return [record for html in htmls for record in self.extract_data(html)]
+
+
+    # effects: orchestrates search -> extract all pages -> filter; returns filtered records or raises
+    def scrape(self, **kwargs):
+        self.logger.info(f"Starting scrape for {self.REGION}")
+        try:
+            first_page = self.search(**kwargs)
+            records = self.extract_data(first_page) + self.fetch_remaining(first_page)
+
+            seen = set()
+            records = [r for r in records if not (r["code"] in seen or seen.add(r["code"]))]
+            df = pd.DataFrame(records)
+            self.logger.info(f"Total raw records before filtering: {len(df)}")
+            filtered = filter_by_keywords(df)
+            self.logger.info(f"Total records after filtering: {len(filtered)}")
+            return filtered.to_dict("records")
+
+        except (SearchTimeoutError, ElementNotFoundError, DataExtractionError, PaginationError, ScraperError):
+            raise
+        except requests.exceptions.RequestException as re_err:
+            self.logger.error(f"{self.REGION} HTTP error: {re_err}", exc_info=False)
+            raise SearchTimeoutError(f"{self.REGION} scrape HTTP error") from re_err
+        except Exception as e:
+            self.logger.error(f"{self.REGION} scrape failed: {e}", exc_info=True)
+            raise ScraperError(f"{self.REGION} scrape failed") from e
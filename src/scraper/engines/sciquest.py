@@ -0,0 +1,195 @@
+# sciquest.py
+# Jaggaer (SciQuest) public events: https://bids.sciquest.com/apps/Router/PublicEvent?CustomerOrg=<org>
+
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+
+from scraper.core.requests_scraper import RequestsScraper
+from scraper.utils.data_utils import filter_by_keywords
+from scraper.utils.date_utils import parse_date_generic
+from scraper.core.errors import (
+    SearchTimeoutError,
+    ElementNotFoundError,
+    DataExtractionError,
+    PaginationError,
+    ScraperError,
+)
+
+_PAGE_LABEL_RE = re.compile(r'aria-label="Page (\d+)"|\bPage \d+ of (\d+)\b')
+
+
+# a shared Requests engine for Jaggaer/SciQuest PublicEvent listings
+#
+# every tenant is the same router page selected by its CustomerOrg, so onboarding one only needs its
+# URL in the config map. page 1 reveals the page count and the rest are fetched concurrently. the page
+# query parameter has not been confirmed against a recorded listing, so a router that ignores it is
+# detected and the tenant gets page 1, as New Mexico's own scraper did
+class SciQuestEngine(RequestsScraper):
+    # region name used in log and error messages
+    REGION = "SciQuest"
+    # listing tab with the events open for bid
+    TAB = "PHX_NAV_SourcingOpenForBid"
+    # concurrent page fetches per tenant (the per-host rate limiter still applies)
+    MAX_WORKERS = 4
+
+    # modifies: self
+    # effects: initializes the engine for the tenant at base_url and configures logging;
+    #          raises ValueError if base_url names no CustomerOrg
+    def __init__(self, base_url):
+        super().__init__(base_url)
+        self.logger = logging.getLogger(type(self).__module__)
+        parts = urlsplit(base_url)
+        self.customer_org = dict(parse_qsl(parts.query)).get("CustomerOrg")
+        if not self.customer_org:
+            raise ValueError(f"{self.REGION} URL has no CustomerOrg: {base_url}")
+        self.router_url = urlunsplit(parts._replace(query=""))
+        self.session.headers.update({
+            "User-Agent": (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36"
+            ),
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Referer": "https://bids.sciquest.com/",
+        })
+
+
+    # effects: returns the listing URL for page number page
+    def page_url(self, page):
+        query = [("CustomerOrg", self.customer_org), ("tab", self.TAB)]
+        if page > 1:
+            query.append(("page", page))
+        # the router caches listings per URL; the timestamp asks for a fresh one
+        query.append(("tmstmp", int(time.time() * 1000)))
+        return f"{self.router_url}?{urlencode(query)}"
+
+
+    # effects: GETs listing page number page and returns its HTML
+    def fetch_page(self, page):
+        resp = self.session.get(self.page_url(page), timeout=30)
+        resp.raise_for_status()
+        return resp.text
+
+
+    # modifies: self.current_response
+    # effects: fetches the first listing page and returns its HTML
+    def search(self, **kwargs):
+        self.logger.info(f"Fetching {self.REGION} events for {self.customer_org}")
+        try:
+            self.current_response = self.fetch_page(1)
+            return self.current_response
+        except requests.exceptions.RequestException as re_err:
+            self.logger.error(f"search HTTP error: {re_err}", exc_info=False)
+            raise SearchTimeoutError(f"{self.REGION} search HTTP error") from re_err
+
+
+    # requires: html is a listing page
+    # effects: returns the number of listing pages the pager advertises (1 if none)
+    def page_count(self, html):
+        pages = [int(a or b) for a, b in _PAGE_LABEL_RE.findall(html)]
+        return max(pages, default=1)
+
+
+    # requires: details is the event's details cell
+    # effects: returns the text of the labelled detail row whose id contains suffix, or ""
+    def _detail(self, details, suffix):
+        for row in details.select("div.phx.table-row-layout"):
+            if row.find("div", id=lambda i: i and suffix in i):
+                content = row.select_one("div.phx.data-row-content")
+                if content:
+                    return content.get_text(strip=True)
+        return ""
+
+
+    # requires: html is a listing page
+    # effects: parses the results table into raw record dicts
+    def extract_data(self, html):
+        if not html:
+            raise DataExtractionError(f"{self.REGION} extract_data missing HTML")
+        try:
+            soup = BeautifulSoup(html, "html.parser")
+            table = (
+                soup.find("table", attrs={"aria-label": "Search Results"})
+                or soup.find("table", class_="table phx table-hover no-column-borders")
+            )
+            if not table:
+                self.logger.error("Results table not found")
+                raise ElementNotFoundError(f"{self.REGION} results table not found")
+
+            records = []
+            for row in (table.find("tbody") or table).find_all("tr"):
+                cols = row.find_all("td")
+                if len(cols) < 2:
+                    continue
+                details = cols[1]
+                link_a = details.select_one("a.btn.btn-link")
+                if not link_a:
+                    continue
+                records.append({
+                    "title": link_a.get_text(strip=True),
+                    "code": self._detail(details, "LABEL_NUMBER"),
+                    "end_date": parse_date_generic(self._detail(details, "LABEL_CLOSE")),
+                    "link": urljoin(self.router_url, link_a.get("href", "")),
+                })
+            return records
+        except (ElementNotFoundError, DataExtractionError):
+            raise
+        except Exception as e:
+            self.logger.error(f"extract_data failed: {e}", exc_info=True)
+            raise DataExtractionError(f"{self.REGION} extract_data failed") from e
+
+
+    # requires: first_page is page 1's HTML
+    # effects: fetches pages 2..N concurrently and returns every page's records in page order; if a later
+    #          page repeats page 1 (the router ignored its page number) logs a warning and returns none of them
+    def fetch_remaining(self, first_page):
+        pages = self.page_count(first_page)
+        if pages <= 1:
+            return []
+        self.logger.info(f"{self.REGION}: fetching {pages - 1} more pages")
+        try:
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+                htmls = list(pool.map(self.fetch_page, range(2, pages + 1)))
+        except requests.exceptions.RequestException as re_err:
+            self.logger.error(f"pagination HTTP error: {re_err}", exc_info=False)
+            raise PaginationError(f"{self.REGION} pagination failed") from re_err
+
+        first_links = [r["link"] for r in self.extract_data(first_page)]
+        records = []
+        for page, html in enumerate(htmls, start=2):
+            page_records = self.extract_data(html)
+            if first_links and [r["link"] for r in page_records] == first_links:
+                self.logger.warning(f"page {page} repeats page 1; the router ignored the page number, "
+                                    f"so only page 1 is returned")
+                return []
+            records += page_records
+        return records
+
+
+    # effects: orchestrates search -> extract all pages -> filter; returns filtered records or raises
+    def scrape(self, **kwargs):
+        self.logger.info(f"Starting scrape for {self.REGION}")
+        try:
+            first_page = self.search(**kwargs)
+            records = self.extract_data(first_page) + self.fetch_remaining(first_page)
+
+            seen = set()
+            records = [r for r in records if not (r["link"] in seen or seen.add(r["link"]))]
+            df = pd.DataFrame(records)
+            self.logger.info(f"Total raw records before filtering: {len(df)}")
+            filtered = filter_by_keywords(df)
+            self.logger.info(f"Total records after filtering: {len(filtered)}")
+            return filtered.to_dict("records")
+
+        except (SearchTimeoutError, ElementNotFoundError, DataExtractionError, PaginationError, ScraperError):
+            raise
+        except Exception as e:
+            self.logger.error(f"{self.REGION} scrape failed: {e}", exc_info=True)
+            raise ScraperError(f"{self.REGION} scrape failed") from e
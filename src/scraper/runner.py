@@ -14,6 +14,9 @@ from scraper.exporters.excel_exporter import export_all
 from scraper.utils.data_utils import sync_hidden_from_excel
 from scraper.utils.date_utils import filter_by_dates
 from scraper.utils.text_utils import sanitize
+from scraper.core.http_metrics import summarize
+from scraper.core.rate_limiter import set_cancel_event
+from scraper.core.selenium_scraper import shutdown_browsers
 from src.config import (
     CACHE_DIR,
     DEFAULT_TIMEOUT,
@@ -45,14 +48,27 @@ def run_scraping(
     dict[str, dict[str, pd.DataFrame]], # cleaned county_to_df
     Path,                               # excel file path
     dict[str, float],                   # state durations
-    dict[str, dict[str, float]]         # county durations
+    dict[str, dict[str, float]],        # county durations
+    dict[str, dict]                     # per-region HTTP summaries {"states": ..., "counties": ...}
 ]:
     _write_keywords(keywords)
     cancel_event = _init_cancel_event(cancel_event)
     sync_hidden_from_excel()
 
-    state_to_df, state_durations = _scrape_states(states, cancel_event)
-    county_to_df, county_durations = _scrape_counties(counties, cancel_event)
+    http_summary: dict[str, dict] = {"states": {}, "counties": {}}
+    prefetched: list[type] = []
+    set_cancel_event(cancel_event)
+    try:
+        prefetched, prefetch_time = _prefetch_tenants(states, counties, cancel_event)
+        state_to_df, state_durations = _scrape_states(states, cancel_event, http_summary["states"], prefetch_time)
+        county_to_df, county_durations = _scrape_counties(
+            counties, cancel_event, http_summary["counties"], prefetch_time
+        )
+    finally:
+        for engine_cls in prefetched:
+            engine_cls.discard_prefetched()
+        set_cancel_event(None)
+        shutdown_browsers()
     _enforce_not_empty(state_to_df, county_to_df, cancel_event)
 
     _prune_old_cache()
@@ -61,7 +77,7 @@ def run_scraping(
     county_export_map = _build_county_export_map(county_to_df)
 
     cache_path = _write_outputs(state_export_map, county_export_map)
-    return state_to_df, county_to_df, cache_path, state_durations, county_durations
+    return state_to_df, county_to_df, cache_path, state_durations, county_durations, http_summary
 
 
 # requires: writeable KEYWORDS_FILE path
@@ -80,10 +96,52 @@ def _init_cancel_event(cancel_event: threading.Event | None) -> threading.Event:
     return cancel_event or threading.Event()
 
 
-# requires: list of state keys, cancel_event
+# requires: selected state keys and state->counties mapping (or None), cancel_event
+# modifies: class-level prefetch caches of multi-tenant engines
+# effects: lets each multi-tenant engine (scrapers with a prefetch classmethod) fetch all of its selected
+#          regions in one concurrent batch; the regions still run and report individually afterwards.
+#          returns one scraper class per engine that prefetched, for discarding leftovers at run end, and
+#          each prefetched scraper class's even share of its batch's time, to add to that region's duration
+def _prefetch_tenants(
+    states: list[str], counties: dict[str, list[str]] | None, cancel_event: threading.Event
+) -> tuple[list[type], dict[type, float]]:
+    selected = [STATE_SCRAPERS.get(state) for state in states]
+    for state, county_list in (counties or {}).items():
+        selected += [COUNTY_SCRAPERS.get(state, {}).get(county) for county in county_list]
+
+    groups: dict[object, list[type]] = {}
+    for scraper_cls in selected:
+        prefetch = getattr(scraper_cls, "prefetch", None)
+        if prefetch is not None:
+            groups.setdefault(prefetch.__func__, []).append(scraper_cls)
+
+    prefetched: list[type] = []
+    prefetch_time: dict[type, float] = {}
+    for group in groups.values():
+        if cancel_event.is_set():
+            break
+        start = time.perf_counter()
+        try:
+            group[0].prefetch(group)
+            prefetched.append(group[0])
+        except Exception as e:
+            # regions fall back to fetching on their own
+            logging.warning(f"Prefetch for {[cls.__name__ for cls in group]} failed: {e}")
+        share = (time.perf_counter() - start) / len(group)
+        for scraper_cls in group:
+            prefetch_time[scraper_cls] = prefetch_time.get(scraper_cls, 0.0) + share
+    return prefetched, prefetch_time
+
+
+# requires: list of state keys, cancel_event, prefetch_time from _prefetch_tenants
+# modifies: http_summary (state -> HTTP summary for states that made requests)
 # effects: runs each state scraper, cleans results, returns state→DataFrame and durations
+#          (including each state's share of any prefetch that served it)
 def _scrape_states(
-    states: list[str], cancel_event: threading.Event
+    states: list[str],
+    cancel_event: threading.Event,
+    http_summary: dict[str, dict],
+    prefetch_time: dict[type, float],
 ) -> tuple[dict[str, pd.DataFrame], dict[str, float]]:
     state_to_df: dict[str, pd.DataFrame] = {}
     state_durations: dict[str, float] = {}
@@ -92,17 +150,25 @@ def _scrape_states(
             logging.info(f"Cancellation before state [{state}]")
             break
         logging.info(f"[{state}] Starting scrape...")
-        df, elapsed = _run_single_scraper(state, STATE_SCRAPERS, cancel_event)
+        events: list[dict] = []
+        df, elapsed = _run_single_scraper(state, STATE_SCRAPERS, cancel_event, events)
         cleaned = _clean_dataframe(df)
         state_to_df[state] = cleaned
-        state_durations[state] = elapsed
+        state_durations[state] = elapsed + prefetch_time.get(STATE_SCRAPERS.get(state), 0.0)
+        if events:
+            http_summary[state] = _summarize_http(state, events)
     return state_to_df, state_durations
 
 
-# requires: mapping of state→counties or None, cancel_event
+# requires: mapping of state→counties or None, cancel_event, prefetch_time from _prefetch_tenants
+# modifies: http_summary (state -> county -> HTTP summary for counties that made requests)
 # effects: runs each county scraper, cleans results, returns key->DataFrame and durations
+#          (including each county's share of any prefetch that served it)
 def _scrape_counties(
-    counties: dict[str, list[str]] | None, cancel_event: threading.Event
+    counties: dict[str, list[str]] | None,
+    cancel_event: threading.Event,
+    http_summary: dict[str, dict],
+    prefetch_time: dict[type, float],
 ) -> tuple[dict[str, dict[str, pd.DataFrame]], dict[str, dict[str, float]]]:
     county_to_df: dict[str, dict[str, pd.DataFrame]] = {}
     county_durations: dict[str, dict[str, float]] = {}
@@ -125,13 +191,28 @@ def _scrape_counties(
                 logging.error(f"No county scraper for [{county}]")
                 continue
 
-            df, elapsed = _run_single_scraper(county, scraper_map, cancel_event)
+            events: list[dict] = []
+            df, elapsed = _run_single_scraper(county, scraper_map, cancel_event, events)
             cleaned = _clean_dataframe(df)
             county_to_df[state][county] = cleaned
-            county_durations[state][county] = elapsed
+            county_durations[state][county] = elapsed + prefetch_time.get(scraper_cls, 0.0)
+            if events:
+                http_summary.setdefault(state, {})[county] = _summarize_http(county, events)
     return county_to_df, county_durations
 
 
+# requires: events recorded by a scraper's http_log
+# effects: logs a one-line HTTP digest for key and returns its summary
+def _summarize_http(key: str, events: list[dict]) -> dict:
+    summary = summarize(events)
+    logging.info(
+        f"[{key}] HTTP: {summary['requests']} request(s), {summary['retries']} retried, "
+        f"{summary['errors']} error(s), {summary['bytes'] / 1024:.0f} KB, "
+        f"{summary['latency_total']:.1f}s in flight (max {summary['latency_max']:.1f}s)"
+    )
+    return summary
+
+
 # requires: DataFrame possibly with 'success' column
 # effects: returns sanitized, deduplicated, date‐filtered DataFrame
 def _clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
@@ -246,11 +327,13 @@ def _write_outputs(
 
 
 # requires: scraper_map contains str of only state names and type is a core scraper type
+# modifies: http_events (extended with every attempt's request events, if given)
 # effects: runs the scraper for the given state
 def _run_single_scraper(
     key: str,
     scraper_map: dict[str, type],
-    cancel_event: threading.Event
+    cancel_event: threading.Event,
+    http_events: list[dict] | None = None
 ) -> tuple[pd.DataFrame, float]:
     start = time.perf_counter()
     records: list[dict] = []
@@ -266,6 +349,8 @@ def _run_single_scraper(
         scraper = None
         try:
             scraper = scraper_cls()
+            if hasattr(scraper, "http_log"):
+                scraper.http_log.region = key
             records = scraper.scrape(timeout=DEFAULT_TIMEOUT)
             success = True
             break
@@ -273,7 +358,7 @@ def _run_single_scraper(
             logging.warning(f"[{key}] retryable error on attempt {attempt}: {retryable}")
             backoff = min(2 ** (attempt - 1), 30)
             jitter = random.uniform(0, 1.0)
-            time.sleep(backoff + jitter)
+            cancel_event.wait(backoff + jitter)
         except DataExtractionError as de:
             logging.error(f"[{key}] unrecoverable data error: {de}")
             break
@@ -283,6 +368,8 @@ def _run_single_scraper(
                     scraper.close()
                 except Exception as e:
                     logging.debug(f"Error closing scraper for {key}: {e}")
+                if http_events is not None and hasattr(scraper, "http_log"):
+                    http_events.extend(scraper.http_log.events())
 
     if not success:
         df = pd.DataFrame([{
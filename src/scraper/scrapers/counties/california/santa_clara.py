@@ -61,7 +61,7 @@ class SantaClaraScraper(RequestsScraper):
         try:
             resp = self.session.post(url, json=payload, timeout=20)
             resp.raise_for_status()
-            return resp.json()
+            return self.parse_json(resp)
         except requests.RequestException as e:
             self.logger.error(f"search HTTP error (page={page}): {e}", exc_info=False)
             raise SearchTimeoutError("SantaClara search HTTP error") from e
@@ -26,6 +26,7 @@ from scraper.core.errors import (
 
 # a scraper for Palm Beach RFP data using Selenium
 class PalmBeachScraper(SeleniumScraper):
+    PROFILE_FAMILY = "cgi_advantage"
 
     # modifies: self
     # effects: initializes the scraper with Palm Beach's RFP url and sets up logging
@@ -35,7 +35,7 @@ class ClarkScraper(RequestsScraper):
         try:
             resp = self.session.get(self.base_url, timeout=20)
             resp.raise_for_status()
-            return resp.json()
+            return self.parse_json(resp)
         except requests.RequestException as e:
             self.logger.error(f"search HTTP error: {e}", exc_info=False)
             raise SearchTimeoutError("Clark search HTTP error") from e
@@ -26,6 +26,7 @@ from scraper.core.errors import (
 
 # a scraper for Mecklenburg RFP data using Selenium
 class MecklenburgScraper(SeleniumScraper):
+    PROFILE_FAMILY = "cgi_advantage"
 
     # modifies: self
     # effects: initializes the scraper with Mecklenburg's RFP url and sets up logging
@@ -59,35 +59,25 @@ class TarrantScraper(SeleniumScraper):
     # effects: parses the bids table and extracts raw record dicts
     def extract_data(self):
         try:
+            rows = self.extract_rows("#ctl00_mainContent_rgBidList_ctl00 tbody > tr", {
+                "code": ":scope > td:nth-of-type(2)",
+                "title": ":scope > td:nth-of-type(3)",
+                "end_date": ":scope > td:nth-of-type(7)",
+            })
             records = []
-            table = self.driver.find_element(By.ID, 'ctl00_mainContent_rgBidList_ctl00')
-            rows = table.find_elements(By.CSS_SELECTOR, 'tbody > tr')
-
             for idx, row in enumerate(rows):
-                try:
-                    cells = row.find_elements(By.TAG_NAME, 'td')
-                    if len(cells) < 7:
-                        continue
-
-                    code = cells[1].text.strip()
-                    title = cells[2].text.strip()
-                    close_date = cells[6].text.strip()
-
-                    if not code or not title:
-                        self.logger.warning(f"[Row {idx}] Missing code/title; skipping")
-                        continue
-
-                    records.append({
-                        'code': code,
-                        'title': title,
-                        'end_date': close_date,
-                        'link': self.base_url,
-                    })
-
-                except Exception as e:
-                    self.logger.error(f"[Row {idx}] Error parsing row: {e}", exc_info=False)
+                # rows without a seventh cell are group headers and pager rows
+                if row["end_date"] is None:
                     continue
-
+                if not row["code"] or not row["title"]:
+                    self.logger.warning(f"[Row {idx}] Missing code/title; skipping")
+                    continue
+                records.append({
+                    'code': row["code"],
+                    'title': row["title"],
+                    'end_date': row["end_date"],
+                    'link': self.base_url,
+                })
             return records
 
         except Exception as e:
@@ -24,6 +24,7 @@ from scraper.core.errors import (
 
 # a scraper for Alabama RFP data using Selenium
 class AlabamaScraper(SeleniumScraper):
+    PROFILE_FAMILY = "cgi_advantage"
 
     # modifies: self
     # effects: initializes the scraper with Alabama's RFP url and sets up logging
@@ -25,6 +25,7 @@ from scraper.core.errors import (
 
 # a scraper for Colorado RFP data using Selenium
 class ColoradoScraper(SeleniumScraper):
+    PROFILE_FAMILY = "cgi_advantage"
 
     # modifies: self
     # effects: initializes the scraper with Colorado's RFP url and sets up logging
@@ -46,48 +46,31 @@ class DelawareScraper(SeleniumScraper):
     # effects: parses all rows in the jqGrid and returns a list of record dicts
     def extract_data(self):
         try:
+            # jqgrow marks data rows; the grid's sizing row (jqgfirstrow) and group rows lack it
+            rows = self.extract_rows("#jqGridBids > tbody > tr.jqgrow", {
+                "bid_id": (None, "id"),
+                "code": ":scope > td:nth-of-type(2)",
+                "title": ":scope > td:nth-of-type(3) a",
+                "end_date": ":scope > td:nth-of-type(5)",
+                "last_col": ":scope > td:nth-of-type(7)",
+            })
             records = []
-            table_xpath = "//table[@id='jqGridBids']"
-            all_rows = self.driver.find_elements(By.XPATH, f"{table_xpath}/tbody/tr")
-
-            for idx, row_el in enumerate(all_rows):
-                classes = row_el.get_attribute('class') or ''
-                
-                if 'jqgfirstrow' in classes:
-                    self.logger.info(f"[Row {idx}] Skipping header/fake row")
+            for idx, row in enumerate(rows):
+                if row["last_col"] is None:
+                    self.logger.warning(f"[Row {idx}] Skipped due to insufficient columns")
                     continue
-                
-                if 'jqgrow' not in classes:
-                    self.logger.info(f"[Row {idx}] Skipping non-data row (classes: {classes})")
+                if not row["bid_id"]:
+                    self.logger.warning(f"[Row {idx}] Missing <tr id>. Skipping.")
                     continue
-
-                cols = row_el.find_elements(By.TAG_NAME, 'td')
-                
-                if len(cols) < 7:
-                    self.logger.warning(f"[Row {idx}] Skipped due to insufficient columns ({len(cols)})")
+                if row["title"] is None:
+                    self.logger.error(f"[Row {idx}] Error parsing row: no title link")
                     continue
-
-                try:
-                    bid_id = (row_el.get_attribute("id") or "").strip()
-                    if not bid_id:
-                        self.logger.warning(f"[Row {idx}] Missing <tr id>. Skipping.")
-                        continue
-
-                    code = cols[1].text.strip()
-                    title_link = cols[2].find_element(By.TAG_NAME, "a")
-                    title = title_link.text.strip()
-                    closing_date = cols[4].text.strip()
-
-                    link = f"https://mmp.delaware.gov/Bids/Details/{bid_id}"
-                    records.append({
-                        "title": title,
-                        "code": code,
-                        "end_date": closing_date,
-                        "link": link,
-                    })
-                except Exception as e:
-                    self.logger.error(f"[Row {idx}] Error parsing row: {e}", exc_info=False)
-
+                records.append({
+                    "title": row["title"],
+                    "code": row["code"],
+                    "end_date": row["end_date"],
+                    "link": f"https://mmp.delaware.gov/Bids/Details/{row['bid_id']}",
+                })
             return records
 
         except Exception as e:
@@ -62,7 +62,7 @@ class FloridaScraper(RequestsScraper):
             raise SearchTimeoutError(f"Florida search HTTP error on page {page}") from re
 
         try:
-            data = resp.json()
+            data = self.parse_json(resp)
         except ValueError as ve:
             self.logger.error(f"JSON decode failed (page={page}): {ve}", exc_info=False)
             raise DataExtractionError(f"Florida JSON decode failed on page {page}") from ve
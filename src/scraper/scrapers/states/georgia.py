@@ -136,7 +136,7 @@ class GeorgiaScraper(RequestsScraper):
         try:
             resp = self.session.post(self.base_url, data=payload, headers=headers_post, timeout=20)
             resp.raise_for_status()
-            data = resp.json()
+            data = self.parse_json(resp)
             return data
         except requests.exceptions.RequestException as re:
             self.logger.error(f"search HTTP error: {re}", exc_info=False)
@@ -2,7 +2,6 @@
 # url: https://hiepro.ehawaii.gov/solicitation-notices.html
 
 import logging
-import time
 
 from bs4 import BeautifulSoup
 import pandas as pd
@@ -67,22 +66,15 @@ class HawaiiScraper(SeleniumScraper):
 
 
     # modifies: self.driver
-    # effects: clicks 'Next' pagination button and waits for table refresh; returns True if next page exists
+    # effects: clicks 'Next' pagination button and waits for the table body to settle; returns True if next page exists
     def next_page(self):
         try:
             next_btn = self.driver.find_element(By.ID, 'notices-list_next')
             if 'disabled' in next_btn.get_attribute('class'):
                 return False
 
-            table = self.driver.find_element(By.ID, 'notices-list')
-            old_first = table.find_element(By.CSS_SELECTOR, 'tbody tr').text
-
-            self.driver.execute_script("arguments[0].click();", next_btn)
-
-            WebDriverWait(self.driver, 20).until(
-                lambda d: d.find_element(By.CSS_SELECTOR, '#notices-list tbody tr').text != old_first
-            )
-            return True
+            click = lambda: self.driver.execute_script("arguments[0].click();", next_btn)
+            return self.settle_after(click, '#notices-list tbody', timeout=20)
 
         except (TimeoutException, NoSuchElementException):
             return False
@@ -155,7 +147,6 @@ class HawaiiScraper(SeleniumScraper):
 
             while self.next_page():
                 self.logger.info("Extracting next page")
-                time.sleep(1)  # allow DOM settle
                 all_records.extend(self.extract_data(self.driver.page_source))
 
             df = pd.DataFrame(all_records)
@@ -58,7 +58,7 @@ class IowaScraper(RequestsScraper):
             raise SearchTimeoutError("Iowa search HTTP error") from re
 
         try:
-            data = resp.json()
+            data = self.parse_json(resp)
         except ValueError as ve:
             self.logger.error(f"JSON decode failed: {ve}; response: {resp.text}", exc_info=False)
             raise DataExtractionError("Iowa JSON decode failed") from ve
@@ -25,6 +25,7 @@ from scraper.core.errors import (
 
 # a scraper for Kentucky RFP data using Selenium
 class KentuckyScraper(SeleniumScraper):
+    PROFILE_FAMILY = "cgi_advantage"
 
     # modifies: self
     # effects: initializes the scraper with Kentucky's RFP url and sets up logging
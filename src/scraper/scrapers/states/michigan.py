@@ -2,7 +2,6 @@
 # url: https://sigma.michigan.gov/PRDVSS1X1/Advantage4
 
 import logging
-import time
 
 from bs4 import BeautifulSoup
 import pandas as pd
@@ -26,6 +25,7 @@ from scraper.core.errors import (
 
 # a scraper for Michigan RFP data using Selenium
 class MichiganScraper(SeleniumScraper):
+    PROFILE_FAMILY = "cgi_advantage"
 
     # modifies: self
     # effects: initializes the scraper with Michigan's RFP url and sets up logging
@@ -166,13 +166,17 @@ class MichiganScraper(SeleniumScraper):
                     break
 
                 try:
-                    next_btn.click()
+                    changed = self.settle_after(
+                        next_btn.click, "#vsspageVVSSX10019gridView1group1cardGridgrid1 tbody"
+                    )
                 except WebDriverException as we:
                     self.logger.error(f"failed to click next button: {we}", exc_info=False)
                     raise PaginationError(f"failed to click next button: {we}") from we
+                if not changed:
+                    self.logger.info("Results did not change after 'Next'; stopping pagination")
+                    break
 
                 page_num += 1
-                time.sleep(1)
 
             df = pd.DataFrame(all_records)
             self.logger.info(f"Total raw records before filtering: {len(df)}")
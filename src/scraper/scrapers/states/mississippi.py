@@ -60,7 +60,7 @@ class MississippiScraper(RequestsScraper):
         try:
             resp = self.session.post(self.base_url, data=data, timeout=20)
             resp.raise_for_status()
-            return resp.json()
+            return self.parse_json(resp)
         except requests.exceptions.RequestException as re:
             self.logger.error(f"search HTTP error: {re}", exc_info=False)
             raise SearchTimeoutError("Mississippi search HTTP error") from re
@@ -2,12 +2,13 @@
 # url: https://ewqg.fa.us8.oraclecloud.com/fscmUI/redwood/negotiation-abstracts/view/abstractlisting?prcBuId=300000005255687
 
 import logging
-import time
 import re
 from datetime import datetime
 
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
 import pytz
 import pandas as pd
@@ -42,34 +43,26 @@ class MissouriScraper(SeleniumScraper):
             raise ScraperError("Missouri base_url invalid")
 
         self.driver.get(self.base_url)
-        deadline = time.time() + 20
-        while time.time() < deadline:
-            try:
-                self.driver.find_element(By.ID, "ui-id-2")
-                return True
-            except NoSuchElementException:
-                time.sleep(1)
-
-        self.logger.error("Could not find <ul id='ui-id-2'> on Missouri page")
-        raise SearchTimeoutError("Missouri search timed out waiting for list")
+        try:
+            WebDriverWait(self.driver, 20).until(
+                EC.presence_of_element_located((By.ID, "ui-id-2"))
+            )
+            return True
+        except TimeoutException:
+            self.logger.error("Could not find <ul id='ui-id-2'> on Missouri page")
+            raise SearchTimeoutError("Missouri search timed out waiting for list")
 
 
     # requires: UL is present in DOM
     # modifies: self.driver
-    # effects: scrolls the window twice until the page height stabilizes to trigger lazy loading
+    # effects: scrolls to the bottom until a scroll appends nothing more to the UL, triggering lazy loading
     def _ensure_all_loaded(self):
+        scroll = lambda: self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
         try:
-            last_height = 0
-            for pass_num in range(2):
-                self.logger.info(f"Scroll pass {pass_num+1}/2 to load items")
-                while True:
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
-                    new_height = self.driver.execute_script("return document.body.scrollHeight;")
-                    if new_height == last_height:
-                        break
-                    last_height = new_height
-                time.sleep(1)
+            rounds = 0
+            while rounds < 200 and self.settle_after(scroll, "#ui-id-2", quiet=0.5, timeout=3):
+                rounds += 1
+            self.logger.info(f"Lazy loading finished after {rounds} scroll(s)")
         except WebDriverException as we:
             self.logger.error(f"_ensure_all_loaded failed: {we}", exc_info=False)
             raise PaginationError("Missouri lazy-load scroll failed") from we
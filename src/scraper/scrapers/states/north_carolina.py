@@ -2,7 +2,10 @@
 # url: https://evp.nc.gov/solicitations/
 
 import logging
-from urllib.parse import urljoin
+import re
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+from zoneinfo import ZoneInfo
 
 from bs4 import BeautifulSoup
 import pandas as pd
@@ -23,14 +26,50 @@ from scraper.core.errors import (
     ScraperError,
 )
 
+ROW_SELECTOR = "table.table-striped.table-fluid tbody tr[data-entity='evp_solicitation']"
+# the entity list fills its grid from this JSON call on load and on every page change
+GRID_DATA = r"/_services/entity-grid-data\.json"
+EASTERN = ZoneInfo("America/New_York")
+_MS_DATE_RE = re.compile(r"/Date\((-?\d+)")
+_FRACTION_RE = re.compile(r"\.\d+")
+
 # a scraper for North Carolina RFP data using Selenium
+#
+# the grid is a Power Pages entity list, so each page's records are read from the JSON the list fetches;
+# a page whose JSON was not captured or does not match the rendered columns is parsed from the table
 class NorthCarolinaScraper(SeleniumScraper):
+    CAPTURE_NETWORK = True
 
     # modifies: self
     # effects: initializes scraper with North Carolina RFP URL and configures logger
     def __init__(self):
         super().__init__(STATE_RFP_URL_MAP.get("north carolina"))
         self.logger = logging.getLogger(__name__)
+        # the current page's captured grid JSON, and the grid's column attributes and detail link
+        self.grid_payload = None
+        self.columns = None
+
+
+    # requires: action leaves the grid showing a page of rows
+    # modifies: self.grid_payload
+    # effects: runs action, keeping the grid JSON it fetched (None if none was seen)
+    def _capture_grid(self, action):
+        found = self.capture_json(GRID_DATA, action, timeout=2)
+        self.grid_payload = found[-1][1] if found else None
+
+
+    # requires: the grid is showing rows
+    # modifies: self.columns
+    # effects: reads the attribute names behind the code, title and close-date columns, and the code
+    #          link, from the first rendered row
+    def _read_columns(self):
+        rows = self.extract_rows(ROW_SELECTOR, {
+            "code": ("td:nth-of-type(1)", "data-attribute"),
+            "title": ("td:nth-of-type(2)", "data-attribute"),
+            "end_date": ("td:nth-of-type(4)", "data-attribute"),
+            "href": ("td:nth-of-type(1) a", "href"),
+        })
+        self.columns = rows[0] if rows else None
 
 
     # modifies: self.driver
@@ -38,13 +77,16 @@ class NorthCarolinaScraper(SeleniumScraper):
     def search(self, **kwargs):
         self.logger.info("Navigating to North Carolina RFP portal")
         try:
-            self.driver.get(self.base_url)
-            WebDriverWait(self.driver, 20).until(
-                EC.presence_of_element_located((
-                    By.CSS_SELECTOR,
-                    "table.table-striped.table-fluid tbody tr"
-                ))
-            )
+            def load():
+                self.driver.get(self.base_url)
+                WebDriverWait(self.driver, 20).until(
+                    EC.presence_of_element_located((
+                        By.CSS_SELECTOR,
+                        "table.table-striped.table-fluid tbody tr"
+                    ))
+                )
+            self._capture_grid(load)
+            self._read_columns()
             return True
         except TimeoutException as te:
             self.logger.error(f"Search timeout: {te}", exc_info=False)
@@ -60,9 +102,58 @@ class NorthCarolinaScraper(SeleniumScraper):
             raise ScraperError("North Carolina search failed") from e
 
 
-    # requires: current page loaded in self.driver
-    # effects: parses the solicitations table and returns list of raw records
-    def extract_data(self):
+    # effects: returns the yyyy-mm-dd Eastern date of a grid date attribute, or its display text
+    def _json_date(self, attr):
+        value = str(attr.get("Value") or "")
+        match = _MS_DATE_RE.match(value)
+        try:
+            if match:
+                dt = datetime.fromtimestamp(int(match.group(1)) / 1000, tz=timezone.utc)
+            else:
+                dt = datetime.fromisoformat(_FRACTION_RE.sub("", value).replace("Z", "+00:00"))
+        except ValueError:
+            return str(attr.get("DisplayValue") or value).strip()
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(EASTERN)
+        return dt.strftime("%Y-%m-%d")
+
+
+    # requires: payload is a captured grid JSON response
+    # effects: returns the page's raw records built from payload, or None if it does not match the
+    #          rendered grid's columns
+    def _records_from_json(self, payload):
+        columns = self.columns
+        if not isinstance(payload, dict) or not isinstance(payload.get("Records"), list) or not columns:
+            return None
+        href = urlsplit(urljoin(self.base_url, columns.get("href") or ""))
+        query = parse_qsl(href.query)
+        if not any(k == "id" for k, _ in query):
+            return None
+
+        records = []
+        for record in payload["Records"]:
+            attrs = {a.get("Name"): a for a in record.get("Attributes", [])}
+            if not record.get("Id") or not all(columns[f] in attrs for f in ("code", "title", "end_date")):
+                return None
+            detail = [(k, record["Id"] if k == "id" else v) for k, v in query]
+            records.append({
+                "title": str(attrs[columns["title"]].get("DisplayValue") or "").strip(),
+                "code": str(attrs[columns["code"]].get("DisplayValue") or "").strip(),
+                "end_date": self._json_date(attrs[columns["end_date"]]),
+                "link": urlunsplit(href._replace(query=urlencode(detail))),
+            })
+        return records
+
+
+    # requires: current page loaded in self.driver; payload is that page's captured grid JSON, if any
+    # effects: returns the page's raw records from payload, or parses the solicitations table when
+    #          payload is missing or does not match the grid
+    def extract_data(self, payload=None):
+        if payload is not None:
+            records = self._records_from_json(payload)
+            if records is not None:
+                return records
+            self.logger.warning("Captured grid JSON did not match the table; parsing the page instead")
         try:
             soup = BeautifulSoup(self.driver.page_source, "html.parser")
             table = soup.find("table", class_="table table-striped table-fluid")
@@ -120,11 +211,14 @@ class NorthCarolinaScraper(SeleniumScraper):
 
         try:
             old_tbody = self.driver.find_element(By.CSS_SELECTOR, "table.table-striped.table-fluid tbody")
-            next_btn.click()
-            WebDriverWait(self.driver, 10).until(EC.staleness_of(old_tbody))
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "table.table-striped.table-fluid tbody tr"))
-            )
+
+            def turn():
+                next_btn.click()
+                WebDriverWait(self.driver, 10).until(EC.staleness_of(old_tbody))
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "table.table-striped.table-fluid tbody tr"))
+                )
+            self._capture_grid(turn)
             return True
         except WebDriverException as we:
             self.logger.error(f"next_page WebDriver error: {we}", exc_info=False)
@@ -146,7 +240,7 @@ class NorthCarolinaScraper(SeleniumScraper):
             page = 1
             while True:
                 self.logger.info(f"Extracting page {page}")
-                batch = self.extract_data()
+                batch = self.extract_data(self.grid_payload)
                 if page == 1 and not batch:
                     self.logger.error("No records found on first page; aborting")
                     raise DataExtractionError("North Carolina extract_data returned empty on first page")
@@ -57,7 +57,7 @@ class RhodeIslandScraper(RequestsScraper):
             raise DataExtractionError("Rhode Island non-JSON response")
 
         try:
-            return resp.json()
+            return self.parse_json(resp)
         except ValueError as ve:
             snippet = resp.text[:200].replace("\n", " ")
             self.logger.error(f"JSON parse error: {ve}; snippet: {snippet!r}", exc_info=False)
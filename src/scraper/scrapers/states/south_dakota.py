@@ -31,7 +31,24 @@ class SouthDakotaScraper(RequestsScraper):
         })
 
 
-    # effects: fetches all events in one request by using a large recordsPerPage
+    # requires: resp is the streamed events response
+    # effects: yields events as they are decoded, mapping mid-stream read and decode failures to the
+    #          errors search() would raise; closes resp once the stream ends or fails
+    def _stream_events(self, resp):
+        try:
+            yield from self.iter_json(resp, "data.item")
+        except RequestException as re:
+            self.logger.error(f"Stream HTTP error: {re}", exc_info=False)
+            raise SearchTimeoutError("South Dakota search HTTP error") from re
+        except ValueError as ve:
+            self.logger.error(f"JSON decode error: {ve}", exc_info=False)
+            raise DataExtractionError("South Dakota JSON decode failed") from ve
+        finally:
+            resp.close()
+
+
+    # effects: fetches all events in one request by using a large recordsPerPage;
+    #          returns {"data": iterator} that decodes events one at a time from the streamed body
     def search(self, **kwargs):
         params = {
             "pageNo": 0,
@@ -40,22 +57,24 @@ class SouthDakotaScraper(RequestsScraper):
             "browserGlobalTimeZoneName": "America/Los_Angeles",
             "browserOffset": "-07:00:00",
         }
+        resp = None
         try:
-            resp = self.session.get(self.base_url, params=params, timeout=20)
+            resp = self.session.get(self.base_url, params=params, timeout=20, stream=True)
             resp.raise_for_status()
-            return resp.json()
+            return {"data": self._stream_events(resp)}
         except RequestException as re:
             self.logger.error(f"Search HTTP error: {re}", exc_info=False)
+            if resp is not None:
+                resp.close()
             raise SearchTimeoutError("South Dakota search HTTP error") from re
-        except ValueError as ve:
-            self.logger.error(f"JSON decode error: {ve}", exc_info=False)
-            raise DataExtractionError("South Dakota JSON decode failed") from ve
         except Exception as e:
             self.logger.error(f"Search failed: {e}", exc_info=True)
+            if resp is not None:
+                resp.close()
             raise ScraperError("South Dakota search failed") from e
 
 
-    # requires: response_json is dict with 'data'
+    # requires: response_json is dict with 'data' (a list or an iterator of events)
     # effects: extracts event records into standardized list of dicts
     def extract_data(self, response_json):
         if not response_json or "data" not in response_json:
@@ -89,9 +108,16 @@ class SouthDakotaScraper(RequestsScraper):
                 })
 
             return records
+        except (SearchTimeoutError, DataExtractionError):
+            raise
         except Exception as e:
             self.logger.error(f"extract_data failed: {e}", exc_info=True)
             raise DataExtractionError("South Dakota extract_data failed") from e
+        finally:
+            # a stream abandoned part-way releases its connection now rather than at garbage collection
+            close = getattr(response_json["data"], "close", None)
+            if close:
+                close()
 
 
     # effects: orchestrates full scrape: search -> extract_data -> filter -> return
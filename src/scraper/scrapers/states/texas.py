@@ -73,7 +73,7 @@ class TexasScraper(RequestsScraper):
                 self.logger.info(f"Fetching Texas RFP page {page}")
                 resp = self.session.post(url, json=payload, timeout=30)
                 resp.raise_for_status()
-                data = resp.json()
+                data = self.parse_json(resp)
 
                 if page == 1:
                     agencies_cache = data.get('agencies', [])
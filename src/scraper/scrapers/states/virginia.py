@@ -2,7 +2,6 @@
 # url: https://mvendor.cgieva.com/Vendor/public/AllOpportunities.jsp
 
 import logging
-import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -49,22 +48,26 @@ class VirginiaScraper(SeleniumScraper):
             WebDriverWait(self.driver, 20).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, 'li.fetch-by-cursor'))
             )
-            self.driver.execute_script("window.scrollBy(0, window.innerHeight);")
-            time.sleep(0.5)
-            self.driver.execute_script("window.scrollBy(0, -100);")
-            time.sleep(0.5)
-            count = 1
-            while True:
+            # each time the cursor sentinel scrolls into view the next batch is appended;
+            # wait for that batch to land instead of sleeping a fixed interval
+            misses = 0
+            for _ in range(120):
                 try:
-                    count += 1
                     sentinel = self.driver.find_element(By.CSS_SELECTOR, 'li.fetch-by-cursor')
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", sentinel)
-                    time.sleep(0.2)
-                    if count >= 120:
-                        break
                 except NoSuchElementException:
                     self.logger.info("All items loaded; sentinel gone.")
                     break
+                scroll = lambda: self.driver.execute_script(
+                    "arguments[0].scrollIntoView({block: 'center'});", sentinel
+                )
+                if self.settle_after(scroll, quiet=0.2, timeout=5):
+                    misses = 0
+                    continue
+                misses += 1
+                if misses >= 3:
+                    self.logger.warning("Sentinel stopped loading new items; continuing with what loaded")
+                    break
+                self.driver.execute_script("window.scrollBy(0, -100);")
             return True
         except TimeoutException as te:
             self.logger.error(f"Search timeout: {te}", exc_info=False)
@@ -24,6 +24,8 @@ from scraper.core.errors import (
 
 # a scraper for Washington RFP data using Selenium
 class WashingtonScraper(SeleniumScraper):
+    # the search button is an image input
+    ALLOWED_URLS = ("*.gif*", "*.png*", "*.jpg*")
 
     # modifies: self
     # effects: initializes scraper with Washington RFP URL and configures logger
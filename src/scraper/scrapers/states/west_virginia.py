@@ -23,6 +23,7 @@ from scraper.core.errors import (
 
 # a scraper for West Virginia RFP data using Selenium
 class WestVirginiaScraper(SeleniumScraper):
+    PROFILE_FAMILY = "cgi_advantage"
 
     # modifies: self
     # effects: initializes the scraper with West Virginia's RFP url and sets up logging
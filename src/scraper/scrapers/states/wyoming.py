@@ -64,49 +64,41 @@ class WyomingScraper(SeleniumScraper):
         self.logger.info("Parsing Wyoming RFP table")
         records = []
         try:
-            rows = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                "table.tabHome tbody tr.listA, table.tabHome tbody tr.listB"
-            )
+            rows = self.extract_rows("table.tabHome tbody tr.listA, table.tabHome tbody tr.listB", {
+                "text": ":scope > td:nth-of-type(1) a",
+                "link": (":scope > td:nth-of-type(1) a", "href"),
+                "end_text": ":scope > td:nth-of-type(3)",
+                "last_col": ":scope > td:nth-of-type(5)",
+            })
             for row in rows:
-                try:
-                    cols = row.find_elements(By.TAG_NAME, "td")
-                    if len(cols) < 5:
-                        continue
-
-                    anchor = cols[0].find_element(By.TAG_NAME, "a")
-                    full_text = anchor.text.strip()
-
-                    code_match = re.search(r"#(\S+-K)", full_text)
-                    code = code_match.group(1) if code_match else ""
-
-                    if code:
-                        title = re.sub(rf"#\s*{re.escape(code)}\s*-\s*", "", full_text).strip()
-                    else:
-                        title = full_text
-
-                    link = anchor.get_attribute("href")
-
-                    end_text = cols[2].text.strip()
-                    date_tokens = end_text.split()[:3]
-                    date_str = " ".join(date_tokens)
-                    try:
-                        dt = datetime.strptime(date_str, "%b %d, %Y")
-                        end_date = dt.date().isoformat()
-                    except Exception:
-                        end_date = date_str
-
-                    records.append({
-                        "title": title,
-                        "code": code,
-                        "end_date": end_date,
-                        "link": link,
-                    })
-
-                except Exception as e:
-                    snippet = row.get_attribute("outerHTML")[:200].replace("\n", " ")
-                    self.logger.warning(f"Skipping row due to {e!r}. Snippet: {snippet}…")
+                if row["last_col"] is None:
                     continue
+                if row["text"] is None:
+                    self.logger.warning(f"Skipping row without a title link: {row}")
+                    continue
+
+                full_text = row["text"]
+                code_match = re.search(r"#(\S+-K)", full_text)
+                code = code_match.group(1) if code_match else ""
+
+                if code:
+                    title = re.sub(rf"#\s*{re.escape(code)}\s*-\s*", "", full_text).strip()
+                else:
+                    title = full_text
+
+                date_str = " ".join((row["end_text"] or "").split()[:3])
+                try:
+                    dt = datetime.strptime(date_str, "%b %d, %Y")
+                    end_date = dt.date().isoformat()
+                except Exception:
+                    end_date = date_str
+
+                records.append({
+                    "title": title,
+                    "code": code,
+                    "end_date": end_date,
+                    "link": row["link"],
+                })
             return records
         except Exception as e:
             self.logger.error(f"Wyoming extract_data failed: {e}", exc_info=True)
@@ -23,10 +23,12 @@ from src.scraper.utils.data_utils import ensure_dirs_exist
 from src.config import LOG_FILE, ASSETS_DIR, OUTPUT_DIR
 from scraper.logging_config import configure_logging
 from scraper.runner import run_scraping
+from scraper.core.browser_watchdog import reap_orphans
 from ui.pages.home_page import HomePage
 from ui.pages.run_page import RunPage
 from ui.pages.status_page import StatusPage
 from persistence.average_time_manager import load_averages, update_averages as persist_update_averages
+from persistence.http_metrics_manager import append_http_metrics
 
 
 class ScrapeWorker(QThread):
@@ -42,7 +44,7 @@ class ScrapeWorker(QThread):
 
     def run(self):
         try:
-            state_to_df, county_to_df, cache_path, state_durations, county_durations = run_scraping(
+            state_to_df, county_to_df, cache_path, state_durations, county_durations, http_summary = run_scraping(
                 self.states,
                 self.keywords,
                 counties=self.counties,
@@ -57,6 +59,7 @@ class ScrapeWorker(QThread):
                 "county_results": county_to_df,
                 "state_durations": state_durations,
                 "county_durations": county_durations,
+                "http_summary": http_summary,
             })
         except RuntimeError as e:
             msg = str(e)
@@ -82,6 +85,7 @@ class MainWindow(QMainWindow):
         self._build_menu()
         ensure_dirs_exist()
         configure_logging(LOG_FILE)
+        reap_orphans("startup")
         if sys.platform == "win32":
             myappid = 'com.hotb.rfpscraper.1.0'
             ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
@@ -197,6 +201,9 @@ class MainWindow(QMainWindow):
         if state_durs or county_durs:
             avg_data = load_averages()
             persist_update_averages(avg_data, state_durs, county_durs)
+        http_summary = payload.get("http_summary")
+        if http_summary:
+            append_http_metrics(http_summary)
         state_results  = payload.get("results", {})
         county_results = payload.get("county_results", {})
         self.status_page.display_results(state_results, county_results)
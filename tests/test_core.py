@@ -1,11 +1,30 @@
+import io
+import json
 import os
+import subprocess
 import sys
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import src.scraper.core.base_scraper as base_scraper
 import src.scraper.core.requests_scraper as requests_scraper
 import src.scraper.core.selenium_scraper as selenium_scraper
+import src.scraper.core.http_cache as http_cache
+import src.scraper.core.http_replay as http_replay
+import src.scraper.core.rate_limiter as rate_limiter
+import src.scraper.core.json_decoding as json_decoding
+import src.scraper.core.session_state as session_state
+import src.scraper.core.http_metrics as http_metrics
+import src.scraper.core.browser_pool as browser_pool
+import src.scraper.core.browser_contexts as browser_contexts
+import src.scraper.core.dom_waits as dom_waits
+import src.scraper.core.dom_extract as dom_extract
+import src.scraper.core.network_capture as network_capture
+import src.scraper.core.driver_resolution as driver_resolution
+import src.scraper.core.browser_watchdog as browser_watchdog
+import src.scraper.core.browser_profiles as browser_profiles
 
 
 class DummyScraper(base_scraper.BaseScraper):
@@ -100,14 +119,10 @@ class DummyDriver:
 
 
 class TestSeleniumScraper(unittest.TestCase):
-    @patch("scraper.core.selenium_scraper.ChromeDriverManager")
-    @patch("scraper.core.selenium_scraper.webdriver.Chrome")
-    def setUp(self, mock_chrome, mock_chromedriver_manager):
-        mock_manager_instance = MagicMock()
-        mock_manager_instance.install.return_value = "/path/to/chromedriver"
-        mock_chromedriver_manager.return_value = mock_manager_instance
-
-        mock_chrome.return_value = DummyDriver()
+    @patch.object(selenium_scraper, "browser_backend", return_value=None)
+    @patch.object(selenium_scraper, "launch_chrome")
+    def setUp(self, mock_launch_chrome, mock_browser_backend):
+        mock_launch_chrome.return_value = DummyDriver()
 
         self.scraper = selenium_scraper.SeleniumScraper("http://example.com")
 
@@ -130,5 +145,544 @@ class TestSeleniumScraper(unittest.TestCase):
         self.assertTrue(driver.quit_called)
 
 
+class FakeAdapter(requests_scraper.requests.adapters.BaseAdapter):
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(dict(request.headers))
+        status, headers, body = self.responses.pop(0)
+        resp = requests_scraper.requests.Response()
+        resp.status_code = status
+        resp.headers = requests_scraper.requests.structures.CaseInsensitiveDict(headers)
+        resp._content = body
+        resp.raw = io.BytesIO(body)
+        resp.url = request.url
+        resp.request = request
+        return resp
+
+    def close(self):
+        pass
+
+
+class TestConditionalCacheAdapter(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = http_cache.HttpCache(Path(self.tmp.name), max_bytes=10)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _session(self, inner):
+        session = requests_scraper.requests.Session()
+        session.mount("http://", http_cache.ConditionalCacheAdapter(inner, self.cache))
+        return session
+
+    def test_304_is_served_from_disk(self):
+        inner = FakeAdapter([
+            (200, {"ETag": '"v1"'}, b"hello"),
+            (304, {}, b""),
+        ])
+        session = self._session(inner)
+        self.assertEqual(session.get("http://example.com/feed?_=1").content, b"hello")
+        resp = session.get("http://example.com/feed?_=2")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.content, b"hello")
+        self.assertEqual(inner.sent[1].get("If-None-Match"), '"v1"')
+
+    def test_cache_buster_params_share_one_key(self):
+        self.assertEqual(
+            http_cache.normalize_url("http://example.com/feed?tmstmp=1&_=2&tab=x"),
+            http_cache.normalize_url("http://example.com/feed?tab=x&tmstmp=3"),
+        )
+
+    def test_streamed_get_is_neither_revalidated_nor_stored(self):
+        inner = FakeAdapter([(200, {"ETag": '"v1"'}, b"hello")])
+        resp = self._session(inner).get("http://example.com/feed", stream=True)
+        self.assertEqual(resp.raw.read(), b"hello")
+        self.assertIsNone(self.cache.lookup(http_cache.normalize_url("http://example.com/feed")))
+
+    def test_lru_eviction_respects_size_cap(self):
+        self.cache.store("a", {"ETag": "1"}, b"12345")
+        self.cache.store("b", {"ETag": "2"}, b"12345")
+        self.cache.read_body("a")
+        self.cache.store("c", {"ETag": "3"}, b"12345")
+        self.assertIsNotNone(self.cache.lookup("a"))
+        self.assertIsNone(self.cache.lookup("b"))
+        self.assertIsNotNone(self.cache.lookup("c"))
+
+
+class TestRecordReplayAdapter(unittest.TestCase):
+    def test_replay_serves_recorded_exchange_offline(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "Dummy.jsonl.gz"
+            inner = FakeAdapter([(200, {"Content-Type": "application/json"}, b'{"a": 1}')])
+            recorder = requests_scraper.requests.Session()
+            recorder.mount("http://", http_replay.RecordReplayAdapter(path, http_replay.RECORD, inner))
+            recorder.post("http://example.com/api", data={"page": 1})
+            recorder.close()
+
+            player = requests_scraper.requests.Session()
+            player.mount("http://", http_replay.RecordReplayAdapter(path, http_replay.REPLAY, FakeAdapter([])))
+            self.assertEqual(player.post("http://example.com/api", data={"page": 1}).json(), {"a": 1})
+            with self.assertRaises(requests_scraper.requests.ConnectionError):
+                player.post("http://example.com/api", data={"page": 2})
+
+    def test_same_named_region_classes_get_separate_archives(self):
+        from src.scraper.scrapers.counties.california.orange import OrangeScraper as CaliforniaOrange
+        from src.scraper.scrapers.counties.florida.orange import OrangeScraper as FloridaOrange
+        self.assertNotEqual(http_replay.fixture_path(http_replay.fixture_name(CaliforniaOrange)),
+                            http_replay.fixture_path(http_replay.fixture_name(FloridaOrange)))
+        self.assertEqual(http_replay.fixture_name(FloridaOrange),
+                         "scraper.scrapers.counties.florida.orange.OrangeScraper")
+
+
+class TestRateLimitAdapter(unittest.TestCase):
+    def test_throttled_request_is_retried_in_place(self):
+        inner = FakeAdapter([
+            (429, {"Retry-After": "0"}, b""),
+            (200, {}, b"ok"),
+        ])
+        session = requests_scraper.requests.Session()
+        session.mount("http://", rate_limiter.RateLimitAdapter(inner))
+        resp = session.get("http://throttled.example.com/")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.attempt, 2)
+        self.assertEqual(len(inner.sent), 2)
+
+    def test_cancel_interrupts_a_retry_wait(self):
+        inner = FakeAdapter([(429, {"Retry-After": "50"}, b"")])
+        session = requests_scraper.requests.Session()
+        session.mount("http://", rate_limiter.RateLimitAdapter(inner))
+        cancel = rate_limiter.threading.Event()
+        rate_limiter.set_cancel_event(cancel)
+        rate_limiter.threading.Timer(0.1, cancel.set).start()
+        try:
+            with self.assertRaises(rate_limiter.RequestCancelled):
+                session.get("http://slow-down.example.com/")
+        finally:
+            rate_limiter.set_cancel_event(None)
+        self.assertEqual(len(inner.sent), 1)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(rate_limiter.parse_retry_after("7"), 7.0)
+        self.assertEqual(rate_limiter.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        self.assertIsNone(rate_limiter.parse_retry_after("soon"))
+
+
+class TestJsonDecoding(unittest.TestCase):
+    def _response(self, body):
+        return FakeAdapter([(200, {}, body)]).send(
+            requests_scraper.requests.Request("GET", "http://example.com/").prepare()
+        )
+
+    def test_loads_accepts_bytes(self):
+        self.assertEqual(json_decoding.loads(b'{"a": [1, 2]}'), {"a": [1, 2]})
+
+    def test_parse_json_raises_a_request_exception_for_a_truncated_body(self):
+        scraper = requests_scraper.RequestsScraper("http://example.com")
+        with self.assertRaises(requests_scraper.requests.RequestException) as caught:
+            scraper.parse_json(self._response(b'{"data": [{"id": "a"}, {"id'))
+        self.assertIsInstance(caught.exception, requests_scraper.requests.JSONDecodeError)
+
+    def test_iter_items_yields_each_record(self):
+        resp = self._response(b'{"data": [{"id": "a"}, {"id": "b"}], "total": 2}')
+        self.assertEqual([r["id"] for r in json_decoding.iter_items(resp, "data.item")], ["a", "b"])
+
+    def test_iter_kvitems_yields_object_members(self):
+        resp = self._response(b'{"payload": {"projects": {"1": {"n": "x"}, "2": {"n": "y"}}}}')
+        self.assertEqual(dict(json_decoding.iter_kvitems(resp, "payload.projects")),
+                         {"1": {"n": "x"}, "2": {"n": "y"}})
+
+
+class TestSessionState(unittest.TestCase):
+    def test_round_trip_and_expiry(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(session_state, "SESSION_STATE_FILE", Path(tmp) / "state.json"):
+            jar = requests_scraper.requests.cookies.RequestsCookieJar()
+            jar.set("ASP.NET_SessionId", "abc", domain="example.com", path="/")
+            session_state.save_state("portal", jar, {"CSRFToken": "t"}, ttl=60)
+
+            state = session_state.load_state("portal")
+            self.assertEqual(state["fields"], {"CSRFToken": "t"})
+            restored = requests_scraper.requests.cookies.RequestsCookieJar()
+            session_state.apply_cookies(restored, state["cookies"])
+            self.assertEqual(restored.get("ASP.NET_SessionId"), "abc")
+
+            session_state.save_state("portal", jar, {}, ttl=-1)
+            self.assertIsNone(session_state.load_state("portal"))
+
+
+class TestHttpMetrics(unittest.TestCase):
+    def test_url_template_strips_ids_and_query_values(self):
+        self.assertEqual(
+            http_metrics.url_template("https://Host.example.com/opportunities/12345?_=99&page=2"),
+            "host.example.com/opportunities/{id}?_&page",
+        )
+
+    def test_each_attempt_is_recorded_and_summarized(self):
+        log = http_metrics.RequestLog("harris")
+        inner = FakeAdapter([
+            (429, {"Retry-After": "0"}, b""),
+            (200, {}, b"12345"),
+        ])
+        session = requests_scraper.requests.Session()
+        session.mount("http://", rate_limiter.RateLimitAdapter(http_metrics.MetricsAdapter(inner, log)))
+        session.get("http://metrics.example.com/feed")
+
+        events = log.events()
+        self.assertEqual([e["attempt"] for e in events], [1, 2])
+        self.assertEqual({e["region"] for e in events}, {"harris"})
+        summary = http_metrics.summarize(events)
+        self.assertEqual(summary["requests"], 2)
+        self.assertEqual(summary["retries"], 1)
+        self.assertEqual(summary["errors"], 1)
+        self.assertEqual(summary["bytes"], 5)
+
+
+class PoolDriver(DummyDriver):
+    def __init__(self, options=None):
+        super().__init__()
+        self.window_handles = ["main"]
+        self.current_url = "about:blank"
+        self.switch_to = MagicMock()
+        self.cdp_calls = []
+
+    def execute_script(self, script):
+        return "https://portal.example.com"
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_calls.append(cmd)
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def get(self, url):
+        self.current_url = url
+
+
+class TestBrowserPool(unittest.TestCase):
+    def test_released_browser_is_reset_and_reused_until_worn_out(self):
+        pool = browser_pool.BrowserPool(max_uses=2, max_rss_mb=10 ** 6, max_idle=2)
+        options = selenium_scraper.webdriver.ChromeOptions()
+
+        first = pool.lease(options, PoolDriver)
+        pool.release(first)
+        self.assertIn("Network.clearBrowserCookies", first.cdp_calls)
+        self.assertFalse(first.quit_called)
+
+        second = pool.lease(options, PoolDriver)
+        self.assertIs(second, first)
+        pool.release(second)
+        self.assertTrue(first.quit_called)
+        self.assertIsNot(pool.lease(options, PoolDriver), first)
+
+    def test_profile_is_never_locked_by_two_browsers(self):
+        pool = browser_pool.BrowserPool(max_uses=5, max_rss_mb=10 ** 6, max_idle=2)
+        launched = []
+
+        def launch(options):
+            launched.append(browser_profiles.profile_of(options))
+            return PoolDriver()
+
+        plain = selenium_scraper.webdriver.ChromeOptions()
+        plain.add_argument("--user-data-dir=/profiles/cgi")
+        capturing = selenium_scraper.webdriver.ChromeOptions()
+        capturing.add_argument("--user-data-dir=/profiles/cgi")
+        capturing.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+        idle = pool.lease(plain, launch)
+        pool.release(idle)
+        holder = pool.lease(capturing, launch)
+        self.assertTrue(idle.quit_called)
+        # the profile is leased out, so a concurrent launch gets a throwaway one
+        pool.lease(plain, launch)
+        self.assertEqual(launched, ["/profiles/cgi", "/profiles/cgi", None])
+        self.assertFalse(holder.quit_called)
+
+    def test_shutdown_quits_idle_browsers(self):
+        pool = browser_pool.BrowserPool(max_uses=5, max_rss_mb=10 ** 6, max_idle=2)
+        driver = pool.lease(selenium_scraper.webdriver.ChromeOptions(), PoolDriver)
+        pool.release(driver)
+        pool.shutdown()
+        self.assertTrue(driver.quit_called)
+
+
+class TestResourceBlocking(unittest.TestCase):
+    def test_blocked_urls_apply_portal_overrides(self):
+        class Portal(selenium_scraper.SeleniumScraper):
+            ALLOWED_URLS = ("*.png*",)
+            BLOCKED_URLS = ("*chat-widget*",)
+
+        scraper = Portal.__new__(Portal)
+        patterns = scraper.blocked_urls()
+        self.assertIn("*.woff*", patterns)
+        self.assertIn("*chat-widget*", patterns)
+        self.assertNotIn("*.png*", patterns)
+
+        Portal.BLOCK_RESOURCES = False
+        self.assertEqual(scraper.blocked_urls(), [])
+
+
+class TestPageLoadStrategy(unittest.TestCase):
+    def test_eager_by_default_with_per_scraper_opt_out(self):
+        class FullLoadPortal(selenium_scraper.SeleniumScraper):
+            PAGE_LOAD_STRATEGY = "normal"
+
+        default = selenium_scraper.SeleniumScraper.__new__(selenium_scraper.SeleniumScraper)
+        full = FullLoadPortal.__new__(FullLoadPortal)
+        self.assertEqual(default._build_options().page_load_strategy, "eager")
+        self.assertEqual(full._build_options().page_load_strategy, "normal")
+        self.assertNotEqual(browser_pool.options_key(default._build_options()),
+                            browser_pool.options_key(full._build_options()))
+
+
+class TestSettleAfter(unittest.TestCase):
+    def test_reports_whether_the_watched_subtree_changed(self):
+        driver = MagicMock()
+        action = MagicMock()
+        driver.execute_async_script.return_value = 4
+        self.assertTrue(dom_waits.settle_after(driver, action, "#results tbody", quiet=0.1, timeout=1))
+        action.assert_called_once()
+        self.assertEqual(driver.execute_script.call_args[0][1], "#results tbody")
+
+        driver.execute_async_script.return_value = 0
+        self.assertFalse(dom_waits.settle_after(driver, action, "#results tbody"))
+
+    def test_falls_back_to_presence_after_navigation(self):
+        driver = MagicMock()
+        driver.execute_async_script.return_value = None
+        driver.execute_script.side_effect = [True, False, True]
+        self.assertTrue(dom_waits.settle_after(driver, MagicMock(), "#results", timeout=1))
+
+
+class TestExtractRows(unittest.TestCase):
+    def test_sends_field_spec_in_one_script_call(self):
+        driver = MagicMock()
+        driver.execute_script.return_value = [{"title": "Paving", "link": "https://x/1"}]
+        rows = dom_extract.extract_rows(driver, "tr.row", {"title": "a.t", "link": ("a.t", "href")})
+        self.assertEqual(rows, [{"title": "Paving", "link": "https://x/1"}])
+        driver.execute_script.assert_called_once()
+        _, selector, spec = driver.execute_script.call_args[0]
+        self.assertEqual(selector, "tr.row")
+        self.assertEqual(spec, [["title", "a.t", None], ["link", "a.t", "href"]])
+
+
+class TestBrowserProfiles(unittest.TestCase):
+    def test_family_scrapers_share_a_capped_persistent_profile(self):
+        class CgiPortal(selenium_scraper.SeleniumScraper):
+            PROFILE_FAMILY = "cgi_advantage"
+
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(browser_profiles, "BROWSER_PROFILES_DIR", Path(tmp)):
+            args = CgiPortal.__new__(CgiPortal)._build_options().arguments
+            self.assertIn(f"--user-data-dir={Path(tmp) / 'cgi_advantage'}", args)
+            self.assertTrue(any(a.startswith("--disk-cache-size=") for a in args))
+            plain = selenium_scraper.SeleniumScraper.__new__(selenium_scraper.SeleniumScraper)
+            self.assertFalse(any(a.startswith("--user-data-dir") for a in plain._build_options().arguments))
+            with patch.object(selenium_scraper, "SELENIUM_BROWSER_BACKEND", "contexts"):
+                shared = CgiPortal.__new__(CgiPortal)._build_options().arguments
+            self.assertFalse(any(a.startswith("--user-data-dir") for a in shared))
+
+            (Path(tmp) / "cgi_advantage" / "blob").write_bytes(b"x" * 2048)
+            browser_profiles.enforce_profile_caps(max_mb=0.001)
+            self.assertFalse((Path(tmp) / "cgi_advantage").exists())
+
+
+class CaptureDriver:
+    def __init__(self, events):
+        self.events = events
+
+    def get_log(self, kind):
+        events, self.events = self.events, []
+        return [{"message": json.dumps({"message": e})} for e in events]
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {"body": json.dumps({"id": params["requestId"]}), "base64Encoded": False}
+
+
+class TestResponseCapture(unittest.TestCase):
+    def test_returns_finished_json_responses_matching_pattern(self):
+        def received(request_id, url, mime="application/json"):
+            return {"method": "Network.responseReceived",
+                    "params": {"requestId": request_id, "response": {"url": url, "mimeType": mime}}}
+
+        def finished(request_id):
+            return {"method": "Network.loadingFinished", "params": {"requestId": request_id}}
+
+        driver = CaptureDriver([
+            received("1", "https://portal/api/bids?page=1"), finished("1"),
+            received("2", "https://portal/api/user"), finished("2"),
+            received("3", "https://portal/logo.png", "image/png"), finished("3"),
+            received("4", "https://portal/api/bids?page=2"),
+        ])
+        capture = network_capture.ResponseCapture(driver)
+        found = capture.wait_for(r"/api/bids", count=2, timeout=0.2)
+        self.assertEqual(found, [("https://portal/api/bids?page=1", {"id": "1"})])
+
+
+GRID_JSON = {"Records": [
+    {"Id": "b1", "Attributes": [
+        {"Name": "evp_solicitationnbr", "Value": "NC-1", "DisplayValue": "NC-1"},
+        {"Name": "evp_name", "Value": "Roofing", "DisplayValue": " Roofing "},
+        # 02:00 UTC is the previous evening in Raleigh
+        {"Name": "evp_closedate", "Value": "/Date(1902880800000)/", "DisplayValue": "4/19/2030 10:00 PM"},
+    ]},
+]}
+
+
+class GridDriver(CaptureDriver):
+    def __init__(self):
+        super().__init__([])
+
+    def get(self, url):
+        self.events = [
+            {"method": "Network.responseReceived", "params": {"requestId": "7", "response": {
+                "url": "https://evp.nc.gov/_services/entity-grid-data.json/abc", "mimeType": "application/json"}}},
+            {"method": "Network.loadingFinished", "params": {"requestId": "7"}},
+        ]
+
+    def find_element(self, by, selector):
+        return object()
+
+    def execute_script(self, script, *args):
+        return [{"code": "evp_solicitationnbr", "title": "evp_name", "end_date": "evp_closedate",
+                 "href": "https://evp.nc.gov/solicitations/details/?id=a0&tab=1"}]
+
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd != "Network.getResponseBody":
+            return {}
+        return {"body": json.dumps(GRID_JSON), "base64Encoded": False}
+
+    def quit(self):
+        pass
+
+
+class TestNorthCarolinaGridCapture(unittest.TestCase):
+    def test_reads_records_from_the_captured_grid_json(self):
+        from src.scraper.scrapers.states import north_carolina
+        core = sys.modules[north_carolina.SeleniumScraper.__module__]
+        with patch.object(core, "launch_chrome", return_value=GridDriver()), \
+                patch.object(core, "browser_backend", return_value=None):
+            scraper = north_carolina.NorthCarolinaScraper()
+
+        scraper.search()
+        records = scraper.extract_data(scraper.grid_payload)
+
+        self.assertEqual(records, [{
+            "title": "Roofing", "code": "NC-1", "end_date": "2030-04-19",
+            "link": "https://evp.nc.gov/solicitations/details/?id=b1&tab=1",
+        }])
+        self.assertIsNone(scraper._records_from_json({"Records": [{"Id": "b2", "Attributes": []}]}))
+
+
+class TestDriverResolution(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.driver_bin = root / "chromedriver"
+        self.browser_bin = root / "chrome"
+        self.driver_bin.write_text("")
+        self.browser_bin.write_text("")
+        self.patches = [
+            patch.object(driver_resolution, "DRIVER_PATHS_FILE", root / "driver_paths.json"),
+            patch.object(driver_resolution, "_resolved", None),
+            patch.object(driver_resolution, "_binary_version",
+                         side_effect=lambda path: "Google Chrome 1.0" if path.endswith("chrome") else "ChromeDriver 1.0"),
+        ]
+        for p in self.patches:
+            p.start()
+        self.manager = patch.object(driver_resolution, "SeleniumManager").start()
+        self.manager.return_value.binary_paths.return_value = {
+            "driver_path": str(self.driver_bin), "browser_path": str(self.browser_bin)
+        }
+
+    def tearDown(self):
+        patch.stopall()
+        self.tmp.cleanup()
+
+    def test_resolves_once_and_reuses_the_cached_paths(self):
+        first = driver_resolution.resolve_binaries()
+        driver_resolution._resolved = None  # new process: read back from disk
+        second = driver_resolution.resolve_binaries()
+        self.assertEqual(first["driver_path"], second["driver_path"])
+        self.assertEqual(second["driver_version"], "ChromeDriver 1.0")
+        self.assertEqual(second["browser_version"], "Google Chrome 1.0")
+        self.assertEqual(self.manager.return_value.binary_paths.call_count, 1)
+
+        driver_resolution.resolve_binaries(refresh=True)
+        self.assertEqual(self.manager.return_value.binary_paths.call_count, 2)
+
+    def test_missing_binary_invalidates_the_cache(self):
+        driver_resolution.resolve_binaries()
+        driver_resolution._resolved = None
+        self.driver_bin.unlink()
+        driver_resolution.resolve_binaries()
+        self.assertEqual(self.manager.return_value.binary_paths.call_count, 2)
+
+
+@unittest.skipIf(browser_watchdog.psutil is None, "psutil not installed")
+class TestBrowserWatchdog(unittest.TestCase):
+    def test_reap_kills_tracked_trees_and_clears_the_record(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            pids_file = Path(tmp) / "browser_pids.json"
+            watchdog = browser_watchdog.BrowserWatchdog(path=pids_file, interval=3600)
+            child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+            try:
+                driver = MagicMock()
+                driver.service.process.pid = child.pid
+                watchdog.track(driver)
+                self.assertIn(str(child.pid), json.loads(pids_file.read_text()))
+
+                killed, _ = browser_watchdog.BrowserWatchdog(path=pids_file).reap("startup")
+                self.assertEqual(killed, 1)
+                self.assertIsNotNone(child.wait(timeout=5))
+                self.assertEqual(json.loads(pids_file.read_text()), {})
+            finally:
+                if child.poll() is None:
+                    child.kill()
+                watchdog._stop.set()
+
+
+class ContextDriver(PoolDriver):
+    def __init__(self, options=None):
+        super().__init__()
+        self.options = options
+        self.capabilities = {"goog:chromeOptions": {"debuggerAddress": "localhost:9222"}}
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_calls.append((cmd, params))
+        return {"browserContextId": "ctx-1", "targetId": "tab-1"}
+
+
+class TestSharedBrowser(unittest.TestCase):
+    def test_leases_attach_to_one_browser_in_isolated_contexts(self):
+        shared = browser_contexts.SharedBrowser()
+        launched = []
+
+        def launch(options):
+            launched.append(ContextDriver(options))
+            return launched[-1]
+
+        options = selenium_scraper.webdriver.ChromeOptions()
+        first = shared.lease(options, launch)
+        second = shared.lease(options, launch)
+        host = launched[0]
+        self.assertEqual(len(launched), 3)
+        self.assertEqual(first.options.debugger_address, "localhost:9222")
+        self.assertEqual(first.cdp_calls[0][0], "Target.createBrowserContext")
+        first.switch_to.window.assert_called_with("tab-1")
+
+        shared.release(first)
+        self.assertIn(("Target.disposeBrowserContext", {"browserContextId": "ctx-1"}), first.cdp_calls)
+        self.assertTrue(first.quit_called)
+        self.assertFalse(host.quit_called)
+        shared.release(second)
+        shared.shutdown()
+        self.assertTrue(host.quit_called)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,474 @@
+import io
+import json
+import threading
+import unittest
+from unittest import mock
+from urllib.parse import urlsplit
+
+import requests
+
+from src.scraper.core.http_metrics import MetricsAdapter
+
+from src.scraper.engines.bidnet import BidNetEngine
+from src.scraper.engines.bonfire import BonfireEngine
+from src.scraper.engines.bso import BsoEngine
+from src.scraper.engines.infor import InforEngine
+from src.scraper.engines.opengov import OpenGovEngine
+from src.scraper.engines.peoplesoft import PeopleSoftEngine
+from src.scraper.engines.periscope import PeriscopeEngine
+from src.scraper.engines.sciquest import SciQuestEngine
+
+
+class FakeAdapter(requests.adapters.BaseAdapter):
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = responses if isinstance(responses, dict) else list(responses)
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        if isinstance(self.responses, dict):
+            key = request.url if request.url in self.responses else urlsplit(request.url).netloc
+            status, headers, body = self.responses[key]
+        else:
+            status, headers, body = self.responses.pop(0)
+        resp = requests.Response()
+        resp.status_code = status
+        resp.headers = requests.structures.CaseInsensitiveDict(headers)
+        resp._content = body
+        resp.raw = io.BytesIO(body)
+        resp.url = request.url
+        resp.request = request
+        return resp
+
+    def close(self):
+        pass
+
+
+# effects: mounts adapter on engine's session in place of its real transport chain
+def mount(engine, adapter):
+    engine.session.mount("https://", adapter)
+    engine.session.mount("http://", adapter)
+    return engine
+
+
+def bso_row(code, title, date):
+    return (
+        f'<tr><td><a href="/bso/external/bidDetail.sdo?docId={code}">{code}</a></td>'
+        '<td></td><td></td><td></td><td></td><td></td>'
+        f'<td><span class="ui-column-title">Description</span>{title}</td>'
+        f'<td><span class="ui-column-title">Bid Opening Date</span>{date}</td></tr>'
+    )
+
+
+class TestBsoEngine(unittest.TestCase):
+    def test_paginates_past_the_first_page_with_the_table_ajax_call(self):
+        page = (
+            '<form><input name="_csrf" value="c1"/><input name="javax.faces.ViewState" value="v1"/>'
+            '<table><tbody id="bidSearchResultsForm:bidResultId_data">'
+            + bso_row("BID-1", "Road paving", "01/05/2030 02:00:00 PM")
+            + bso_row("BID-2", "Bridge repair", "02/06/2030")
+            + '</tbody></table></form><script>PrimeFaces.cw("DataTable",{paginator:{rowCount:3}})</script>'
+        )
+        ajax = (
+            '<?xml version="1.0" encoding="UTF-8"?><partial-response><changes>'
+            '<update id="bidSearchResultsForm:bidResultId"><![CDATA['
+            + bso_row("BID-3", "Snow removal", "03/07/2030")
+            + ']]></update><update id="j_id1:javax.faces.ViewState:0"><![CDATA[v2]]></update>'
+            '</changes></partial-response>'
+        )
+        adapter = FakeAdapter([(200, {}, page.encode()), (200, {"Content-Type": "text/xml"}, ajax.encode())])
+        engine = mount(BsoEngine("https://bids.example.gov/bso/view/search/external/advancedSearchBid.xhtml"), adapter)
+
+        records = engine._paginate(engine.search())
+
+        self.assertEqual([r["code"] for r in records], ["BID-1", "BID-2", "BID-3"])
+        self.assertEqual(records[0]["title"], "Road paving")
+        self.assertEqual(records[0]["end_date"], "2030-01-05")
+        self.assertEqual(records[2]["link"], "https://bids.example.gov/bso/external/bidDetail.sdo?docId=BID-3")
+        body = adapter.requests[1].body
+        self.assertIn("bidSearchResultsForm%3AbidResultId_first=2", body)
+        self.assertIn("javax.faces.ViewState=v1", body)
+        self.assertEqual(engine.tokens["viewstate"], "v2")
+
+
+def bidnet_page(rows, pages):
+    links = "".join(f'<a href="/texas/agency?pageNumber={n}">{n}</a>' for n in range(2, pages + 1))
+    body = "".join(
+        f'<tr class="mets-table-row"><td><div class="sol-num">{code}</div>'
+        f'<a class="solicitation-link" href="/texas/agency/opportunity/{code}">{title}</a>'
+        f'<span class="sol-closing-date"><span class="date-value">04/01/2030</span></span></td></tr>'
+        for code, title in rows
+    )
+    return (f'<table id="g_6"><tbody>{body}</tbody></table><div class="paging">{links}</div>').encode()
+
+
+class TestBidNetEngine(unittest.TestCase):
+    def test_fetches_every_listing_page_and_keeps_page_order(self):
+        base = "https://www.bidnetdirect.com/texas/agency?posting=1"
+        adapter = FakeAdapter({
+            base: (200, {}, bidnet_page([("A-1", "Roofing")], 3)),
+            f"{base}&pageNumber=2": (200, {}, bidnet_page([("A-2", "Paving")], 3)),
+            f"{base}&pageNumber=3": (200, {}, bidnet_page([("A-3", "Fencing"), ("", "No code")], 3)),
+        })
+        engine = mount(BidNetEngine(base), adapter)
+
+        first = engine.search()
+        records = engine.extract_data(first) + engine.fetch_remaining(first)
+
+        self.assertEqual([r["code"] for r in records], ["A-1", "A-2", "A-3"])
+        self.assertEqual(records[1]["link"], "https://www.bidnetdirect.com/texas/agency/opportunity/A-2")
+        self.assertEqual(records[0]["end_date"], "04/01/2030")
+
+
+def ps_page(state, rows, view_all=False):
+    grid = "".join(
+        f'<tr class="ps_grid-row"><td>{title}</td><td></td><td>{code}</td><td></td><td></td><td>{close}</td></tr>'
+        for code, title, close in rows
+    )
+    link = '<a id="SCP_PUB_BID_GRID$hviewall$0" href="javascript:submitAction_win0(document.win0,\'SCP_PUB_BID_GRID$hviewall$0\');">View All</a>' if view_all else ""
+    return (
+        f'<form name="win0" action="/psc/site/SUPPLIER/ERP/c/SCP.GBL"><input type="hidden" name="ICSID" value="sid"/>'
+        f'<input type="hidden" name="ICStateNum" value="{state}"/><input type="hidden" name="ICAction" value="None"/>'
+        f'<table title="Bidding Event Information"></table><table title="Bidding Event Information">'
+        f'<tr><th>Event</th></tr>{grid}</table>{link}</form>'
+    ).encode()
+
+
+class TestPeopleSoftEngine(unittest.TestCase):
+    def test_expands_the_grid_by_posting_view_all_with_the_component_state(self):
+        adapter = FakeAdapter([
+            (200, {}, b"<html>signon</html>"),
+            (200, {}, ps_page(1, [("EV-1", "Roofing", "01/05/2030 2:00PM")], view_all=True)),
+            (200, {}, ps_page(2, [("EV-1", "Roofing", "01/05/2030 2:00PM"), ("EV-2", "Paving", "02/06/2030")])),
+        ])
+        engine = mount(PeopleSoftEngine("https://supplier.example.gov/psp/site/SUPPLIER/ERP/c/SCP.GBL"), adapter)
+
+        records = engine._paginate(engine.search())
+
+        self.assertEqual([r["code"] for r in records], ["EV-1", "EV-2"])
+        self.assertEqual(records[0]["end_date"], "2030-01-05")
+        self.assertEqual(adapter.requests[0].url, "https://supplier.example.gov/psc/site/SUPPLIER/ERP/c/SCP.GBL")
+        body = adapter.requests[2].body
+        self.assertIn("ICSID=sid", body)
+        self.assertIn("ICStateNum=1", body)
+        self.assertIn("ICAction=SCP_PUB_BID_GRID%24hviewall%240", body)
+        self.assertEqual(engine.state["ICStateNum"], "2")
+
+
+    def test_open_only_grid_stops_at_the_first_page_without_open_rows(self):
+        def with_next_rows(page):
+            return page.replace(b"</form>", b'<a id="SCP_PUB_BID_GRID$hdown$0" href="#">Next</a></form>')
+
+        adapter = FakeAdapter([
+            (200, {}, with_next_rows(ps_page(1, [("EV-3", "Fencing", "03/01/2099")], view_all=True))),
+            (200, {}, with_next_rows(ps_page(2, [("EV-2", "Paving", "02/06/2001")]))),
+        ])
+        engine = mount(PeopleSoftEngine("https://supplier.example.gov/psc/site/SUPPLIER/ERP/c/SCP.GBL"), adapter)
+        engine.OPEN_ONLY = True
+
+        records = engine._open(engine._paginate(engine.search()))
+
+        self.assertEqual([r["code"] for r in records], ["EV-3"])
+        self.assertEqual(len(adapter.requests), 2)
+        self.assertIn("ICAction=SCP_PUB_BID_GRID%24hdown%240", adapter.requests[1].body)
+
+
+def infor_item(code, name, status="Open"):
+    fields = {
+        "SourcingEvent": {"value": code},
+        "Name": {"value": name},
+        "CloseDate": {"value": "20300105140000000"},
+    }
+    if status is not None:
+        fields["_op_DerivedStatusForSupplier_spc_translation_cp_"] = {"value": status}
+    return {"resourceId": f"SourcingEvent({code})", "fields": fields}
+
+
+class TestInforEngine(unittest.TestCase):
+    def test_reads_large_pages_and_follows_the_next_page_key(self):
+        first = {"dataViewSet": {"rangeViewKey": "rv", "hasNext": True, "lastKey": "k1",
+                                 "data": [infor_item(1, "Roofing"), infor_item(2, "Closed", status="Closed")]}}
+        second = {"dataViewSet": {"rangeViewKey": "rv", "hasNext": False, "lastKey": "k2",
+                                  "data": [infor_item(3, "Paving", status="Amendment in progress")]}}
+        adapter = FakeAdapter([(200, {}, json.dumps(first).encode()), (200, {}, json.dumps(second).encode())])
+        url = ("https://tenant.example.com/fsm/Supplier/list/SourcingEvent.XiOpenForBid"
+               "?csk.SupplierGroup=LUMA&pageSize=20&pageop=load")
+        engine = mount(InforEngine(url), adapter)
+        engine.OPEN_STATUSES = ("open", "amendment in progress")
+
+        records = engine._paginate(engine.search())
+
+        self.assertEqual([r["code"] for r in records], ["1", "3"])
+        self.assertEqual(records[0]["end_date"], "2030-01-05")
+        self.assertTrue(records[0]["link"].startswith(
+            "https://tenant.example.com/fsm/Supplier/form/SourcingEvent(1).Summary?csk.SupplierGroup=LUMA"))
+        self.assertIn("list=rv.XiOpenForBid", records[0]["link"])
+        self.assertIn("pagesize=500", adapter.requests[0].url)
+        self.assertNotIn("pageSize=20", adapter.requests[0].url)
+        self.assertIn("pageop=next&lk=k1", adapter.requests[1].url)
+
+    def test_keeps_only_open_rows_unless_the_tenant_keeps_every_row(self):
+        view = {"rangeViewKey": "rv", "data": [
+            infor_item(1, "Roofing"), infor_item(2, "Paving", status=None),
+            infor_item(3, "Fencing", status="Amendment in progress"),
+        ]}
+        engine = InforEngine("https://tenant.example.com/lmscm/SourcingSupplier/list/SourcingEvent.OpenForBid")
+
+        self.assertEqual([r["code"] for r in engine.extract_data(view)], ["1"])
+        engine.OPEN_STATUSES = None
+        self.assertEqual([r["code"] for r in engine.extract_data(view)], ["1", "2", "3"])
+
+
+def sciquest_page(events, pages):
+    rows = "".join(
+        f'<tr><td></td><td><a class="btn btn-link" href="/apps/Router/PublicEvent?tab=x&id={code}">{title}</a>'
+        f'<div class="phx table-row-layout"><div id="lbl_LABEL_NUMBER"></div><div class="phx data-row-content">{code}</div></div>'
+        f'<div class="phx table-row-layout"><div id="lbl_LABEL_CLOSE"></div>'
+        f'<div class="phx data-row-content">04/01/2030 2:00:00 PM MDT</div></div></td></tr>'
+        for code, title in events
+    )
+    pager = "".join(f'<button aria-label="Page {n}">{n}</button>' for n in range(1, pages + 1))
+    return f'<table aria-label="Search Results"><tbody>{rows}</tbody></table>{pager}'.encode()
+
+
+class TestSciQuestEngine(unittest.TestCase):
+    def test_reads_every_page_of_the_customer_org(self):
+        adapter = FakeAdapter([
+            (200, {}, sciquest_page([("MT-1", "Roofing")], 2)),
+            (200, {}, sciquest_page([("MT-2", "Paving")], 2)),
+        ])
+        engine = mount(SciQuestEngine("https://bids.sciquest.com/apps/Router/PublicEvent?CustomerOrg=StateOfX&tmstmp="), adapter)
+        engine.MAX_WORKERS = 1
+
+        first = engine.search()
+        records = engine.extract_data(first) + engine.fetch_remaining(first)
+
+        self.assertEqual([r["code"] for r in records], ["MT-1", "MT-2"])
+        self.assertEqual(records[0]["end_date"], "2030-04-01")
+        self.assertTrue(records[1]["link"].startswith("https://bids.sciquest.com/apps/Router/PublicEvent?tab=x"))
+        self.assertIn("CustomerOrg=StateOfX&tab=PHX_NAV_SourcingOpenForBid&tmstmp=", adapter.requests[0].url)
+        self.assertIn("&page=2&", adapter.requests[1].url)
+
+    def test_a_page_that_repeats_page_one_falls_back_to_page_one(self):
+        adapter = FakeAdapter([
+            (200, {}, sciquest_page([("MT-1", "Roofing")], 2)),
+            (200, {}, sciquest_page([("MT-1", "Roofing")], 2)),
+        ])
+        engine = mount(SciQuestEngine("https://bids.sciquest.com/apps/Router/PublicEvent?CustomerOrg=StateOfX"), adapter)
+
+        with self.assertLogs(engine.logger, "WARNING"):
+            self.assertEqual(engine.fetch_remaining(engine.search()), [])
+
+    def test_requires_a_customer_org(self):
+        with self.assertRaises(ValueError):
+            SciQuestEngine("https://bids.sciquest.com/apps/Router/PublicEvent")
+
+
+def browse_grid(rows, max_page=0):
+    body = "".join(
+        f'<tr id="body_x_grid_grd_tr_{i}"><td><a href="/page.aspx/en/bpm/process_manage_extranet/{code}">Edit</a></td>'
+        f'<td>{code}</td><td>{title}</td><td>Open</td><td>x</td><td>05/01/2030 3:00:00 PM</td></tr>'
+        for i, (code, title) in enumerate(rows)
+    )
+    return (
+        '<input type="hidden" name="__VIEWSTATE" value="vs"/><input type="hidden" name="CSRFToken" value="t"/>'
+        f'<input type="hidden" id="maxpageindexbody_x_grid_grd" value="{max_page}"/>'
+        '<table id="body_x_grid_grd"><thead><tr><th></th><th>Code</th><th>Label</th><th>Status</th>'
+        f'<th>Begin</th><th>End (UTC-7)</th></tr></thead><tbody>{body}</tbody></table>'
+    ).encode()
+
+
+class TestPeriscopeEngine(unittest.TestCase):
+    def test_searches_once_then_reads_remaining_pages_through_the_ajax_pager(self):
+        adapter = FakeAdapter([
+            (200, {}, b'<form><input type="hidden" name="__VIEWSTATE" value="vs0"/>'
+                      b'<input type="hidden" name="CSRFToken" value="t0"/></form>'),
+            (200, {}, browse_grid([("RFP-1", "Roofing")], max_page=2)),
+            (200, {}, browse_grid([("RFP-2", "Paving")])),
+            (200, {}, browse_grid([("RFP-3", "Fencing")])),
+        ])
+        engine = mount(PeriscopeEngine("https://buy.example.gov/page.aspx/en/rfp/request_browse_public"), adapter)
+        engine.MAX_WORKERS = 1
+
+        first = engine.search()
+        records = engine.extract_data(first) + engine.fetch_remaining(first)
+
+        self.assertEqual([r["code"] for r in records], ["RFP-1", "RFP-2", "RFP-3"])
+        self.assertEqual(records[0]["end_date"], "2030-05-01")
+        self.assertEqual(records[0]["link"], "https://buy.example.gov/page.aspx/en/bpm/process_manage_extranet/RFP-1")
+        self.assertIn("CSRFToken=t0", adapter.requests[1].body)
+        self.assertIn("body_x_selStatusCode_4=val", adapter.requests[1].body)
+        page = adapter.requests[3]
+        self.assertTrue(page.url.startswith("https://buy.example.gov/ajax.aspx/en/rfp/request_browse_public?"))
+        self.assertIn("__EVENTARGUMENT=Page%7C2", page.body)
+
+
+def bonfire_feed(*projects):
+    return json.dumps({"payload": {"projects": {
+        str(pid): {"ReferenceID": code, "ProjectName": name, "DateClose": "2030-03-01 03:00:00"}
+        for pid, code, name in projects
+    }}}).encode()
+
+
+BONFIRE_FEEDS = FakeAdapter({
+    "utah.bonfirehub.com": (200, {}, bonfire_feed((7, "UT-1", "Roofing"))),
+    "harriscountytx.bonfirehub.com": (200, {}, bonfire_feed((9, "HC-1", "Paving"))),
+})
+
+
+class BonfireTenant(BonfireEngine):
+    URL = None
+
+    def __init__(self):
+        super().__init__(self.URL)
+        mount(self, MetricsAdapter(BONFIRE_FEEDS, self.http_log))
+
+
+class StateTenant(BonfireTenant):
+    URL = "https://utah.bonfirehub.com/PublicPortal/getOpenPublicOpportunitiesSectionData"
+
+
+class CountyTenant(BonfireTenant):
+    URL = "https://utah.bonfirehub.com/PublicPortal/getOpenPublicOpportunitiesSectionData?_="
+
+
+class OtherTenant(BonfireTenant):
+    URL = "https://harriscountytx.bonfirehub.com/PublicPortal/getOpenPublicOpportunitiesSectionData?_="
+
+
+class TestBonfireEngine(unittest.TestCase):
+    def tearDown(self):
+        BonfireEngine.discard_prefetched()
+        BONFIRE_FEEDS.requests.clear()
+
+    def test_prefetch_reads_each_feed_once_and_serves_every_region(self):
+        BonfireEngine.prefetch([StateTenant, CountyTenant, OtherTenant])
+        self.assertEqual(len(BONFIRE_FEEDS.requests), 2)
+
+        state, county, other = StateTenant(), CountyTenant(), OtherTenant()
+        self.assertEqual(state._records(), county._records())
+        records = other._records()
+        self.assertEqual(len(BONFIRE_FEEDS.requests), 2)
+
+        self.assertEqual(records[0]["code"], "HC-1")
+        self.assertEqual(records[0]["link"], "https://harriscountytx.bonfirehub.com/opportunities/9")
+        self.assertEqual(records[0]["end_date"], "2030-03-01")
+        self.assertEqual([e["region"] for e in other.http_log.events()], ["OtherTenant"])
+
+    def test_prefetch_is_skipped_when_replaying_fixtures(self):
+        with mock.patch("src.scraper.engines.bonfire.HTTP_TRANSPORT_MODE", "replay"):
+            BonfireEngine.prefetch([StateTenant, OtherTenant])
+
+        self.assertEqual(BONFIRE_FEEDS.requests, [])
+        self.assertEqual(OtherTenant()._records()[0]["code"], "HC-1")
+        self.assertEqual(len(BONFIRE_FEEDS.requests), 1)
+
+    def test_region_without_prefetch_fetches_its_own_feed(self):
+        records = OtherTenant()._records()
+
+        self.assertEqual(records[0]["code"], "HC-1")
+        self.assertEqual(len(BONFIRE_FEEDS.requests), 1)
+
+
+# serves OpenGov's public-project POSTs: slug -> every open project, offset by the request's limit and page
+# and returning at most cap rows
+class OpenGovApi(FakeAdapter):
+    def __init__(self, projects):
+        super().__init__([])
+        self.projects = projects
+        self.cap = None
+        # pages are requested concurrently
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        body = json.loads(request.body)
+        rows = self.projects[request.url.split("/government/")[1].split("/")[0]]
+        start = (body["page"] - 1) * body["limit"]
+        page = {"count": len(rows), "rows": rows[start:start + min(body["limit"], self.cap or body["limit"])]}
+        with self.lock:
+            self.responses = [(200, {"Content-Type": "application/json"}, json.dumps(page).encode())]
+            return super().send(request, **kwargs)
+
+
+OPENGOV_API = OpenGovApi({
+    "acgov": [
+        {"id": pid, "financialId": f"AC-{pid}", "title": f"Project {pid}", "proposalDeadline": "2030-03-01T05:00:00.000Z"}
+        for pid in range(1, 6)
+    ],
+    "collincountytx": [{"id": 77, "financialId": None, "title": " Paving ", "proposalDeadline": None}],
+})
+
+
+class OpenGovTenant(OpenGovEngine):
+    LIMIT = 2
+    SLUG = None
+
+    def __init__(self):
+        super().__init__(f"https://api.procurement.opengov.com/api/v1/government/{self.SLUG}/project/public")
+        mount(self, MetricsAdapter(OPENGOV_API, self.http_log))
+
+
+class AlamedaTenant(OpenGovTenant):
+    SLUG = "acgov"
+
+
+class CollinTenant(OpenGovTenant):
+    SLUG = "collincountytx"
+
+
+class TestOpenGovEngine(unittest.TestCase):
+    def tearDown(self):
+        OpenGovEngine.discard_prefetched()
+        OPENGOV_API.requests.clear()
+        OPENGOV_API.cap = None
+
+    def test_fetches_every_page_the_count_implies(self):
+        records = AlamedaTenant()._records()
+
+        self.assertEqual([r["code"] for r in records], [f"AC-{pid}" for pid in range(1, 6)])
+        self.assertEqual(sorted(json.loads(r.body)["page"] for r in OPENGOV_API.requests), [1, 2, 3])
+        self.assertEqual(records[0]["link"], "https://procurement.opengov.com/portal/acgov/projects/1")
+        # 05:00 UTC is the previous evening in Alameda
+        self.assertEqual(records[0]["end_date"], "2030-02-28")
+
+    def test_later_pages_ask_for_as_many_rows_as_a_capped_first_page(self):
+        OPENGOV_API.cap = 2
+        engine = AlamedaTenant()
+        engine.LIMIT = 3
+
+        records = engine._records()
+
+        self.assertEqual([r["code"] for r in records], [f"AC-{pid}" for pid in range(1, 6)])
+        self.assertEqual(sorted(json.loads(r.body)["limit"] for r in OPENGOV_API.requests), [2, 2, 3])
+
+    def test_prefetch_batches_all_regions_on_one_session(self):
+        OpenGovEngine.prefetch([AlamedaTenant, CollinTenant])
+        self.assertEqual(len(OPENGOV_API.requests), 4)
+
+        alameda, collin = AlamedaTenant(), CollinTenant()
+        self.assertEqual(len(alameda._records()), 5)
+        records = collin._records()
+        self.assertEqual(len(OPENGOV_API.requests), 4)
+
+        self.assertEqual(records, [{
+            "code": "77", "title": "Paving", "end_date": "",
+            "link": "https://procurement.opengov.com/portal/collincountytx/projects/77",
+        }])
+        self.assertEqual([e["region"] for e in collin.http_log.events()], ["CollinTenant"])
+        self.assertEqual(len(alameda.http_log.events()), 3)
+
+    def test_prefetch_is_skipped_when_recording_fixtures(self):
+        with mock.patch("src.scraper.engines.opengov.HTTP_TRANSPORT_MODE", "record"):
+            OpenGovEngine.prefetch([AlamedaTenant, CollinTenant])
+
+        self.assertEqual(OPENGOV_API.requests, [])
+        self.assertEqual(len(CollinTenant()._records()), 1)
+
+    def test_rejects_url_without_government_slug(self):
+        with self.assertRaises(ValueError):
+            OpenGovEngine("https://procurement.opengov.com/portal/acgov")
+
+
+if __name__ == "__main__":
+    unittest.main()